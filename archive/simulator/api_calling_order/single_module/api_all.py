@@ -5,15 +5,21 @@
 """
 from flask import Flask, request, jsonify
 import os
-import torch
-from ultralytics import YOLO
+import sys
+
+from image_decoding import decode_upload
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "..", "..", "..", "research", "VDRS", "archive", "detector_service", "single_module"))
+from detector_runtime import load_detector
 
 # Flask 애플리케이션 인스턴스 생성
 app = Flask(__name__)
 
 # YOLOv8 nano 모델 로드 (COCO 80 클래스 사전학습 가중치)
 # - 서버 시작 시 1회 로드하여 전역으로 재사용 → 추론 지연 감소
-model = YOLO('yolov8n.pt')
+# detector_runtime.load_detector: 프로세스당 1회 로드 + 워밍업 (첫 /detect 요청의 초기화 지연 제거)
+runtime = load_detector('yolov8n.pt')
 
 # 시뮬레이터에 순차적으로 보낼 예시 액션 시퀀스(큐 역할)
 # - /get_action 호출 때마다 맨 앞 요소를 pop(0)으로 꺼내 사용
@@ -38,17 +44,15 @@ def detect():
     if not image:
         return jsonify({"error": "No image received"}), 400
 
-    # 간단 구현: 파일로 저장 후 경로 기반 추론
-    # - 동시 요청 경합 방지를 위해 실제 서비스에서는 UUID 파일명/메모리 추론 권장
-    image_path = 'temp_image.jpg'
-    image.save(image_path)
+    # 메모리에서 바로 디코딩 (temp 파일 저장/재읽기 없음, 요청별 버퍼라 동시 요청에도 안전)
+    try:
+        frame = decode_upload(image)
+    except ValueError:
+        return jsonify({"error": "Invalid image"}), 400
 
     # YOLO 추론 실행
-    results = model(image_path)
-
-    # 첫 번째 결과의 바운딩 박스 텐서를 numpy로 변환
-    # 형식: [x1, y1, x2, y2, conf, class_id]
-    detections = results[0].boxes.data.cpu().numpy()
+    # [x1, y1, x2, y2, conf, class_id] numpy 배열
+    detections = runtime.predict(frame)
 
     # 타깃 클래스 매핑
     #   COCO 기준: 0=person, 2=car, 7=truck. (15는 bench)
@@ -4,13 +4,19 @@
 """
 from flask import Flask, request, jsonify
 import os
-import torch
-from ultralytics import YOLO
+import sys
+
+from image_decoding import decode_upload
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "..", "..", "..", "research", "VDRS", "archive", "detector_service", "single_module"))
+from detector_runtime import load_detector
 
 app = Flask(__name__)
 
 # YOLOv8 nano 가중치 로드 (COCO 80클래스 사전학습)
-model = YOLO('yolov8n.pt')
+# detector_runtime.load_detector: 프로세스당 1회 로드 + 워밍업 (첫 /detect 요청의 초기화 지연 제거)
+runtime = load_detector('yolov8n.pt')
 
 # 시뮬레이터에 보낼 예시 명령 시퀀스(큐처럼 pop(0)으로 맨 앞부터 사용)
 combined_commands = [
@@ -30,14 +36,15 @@ def detect():
     if not image:
         return jsonify({"error": "No image received"}), 400
 
-    # 간단 구현: 파일로 저장 후 추론 (실서비스에선 메모리에서 바로 추론 권장)
-    image_path = 'temp_image.jpg'
-    image.save(image_path)
+    # 메모리에서 바로 디코딩 (temp 파일 저장/재읽기 없음, 요청별 버퍼라 동시 요청에도 안전)
+    try:
+        frame = decode_upload(image)
+    except ValueError:
+        return jsonify({"error": "Invalid image"}), 400
 
     # YOLO 추론 실행
-    results = model(image_path)
-    # boxes.data: [x1, y1, x2, y2, conf, class_id] 형태 (numpy로 변환)
-    detections = results[0].boxes.data.cpu().numpy()
+    # [x1, y1, x2, y2, conf, class_id] numpy 배열
+    detections = runtime.predict(frame)
 
     # 타깃 클래스 매핑 (COCO 기준 0=person, 2=car, 7=truck)
     # ⚠ 주의: COCO에서 class_id 15는 bench임. rock은 COCO에 없음 → 커스텀 모델 필요.
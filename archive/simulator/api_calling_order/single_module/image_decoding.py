@@ -0,0 +1,32 @@
+"""
+/detect 업로드 이미지 메모리 디코딩
+
+/detect 핸들러들은 업로드된 이미지를 temp_image.jpg로 저장한 뒤 model(image_path)로 다시 읽어서
+프레임마다 디스크 쓰기 + 읽기가 한 번씩 생겼고, 요청이 동시에 들어오면 같은 파일을 서로 덮어써서
+다른 요청의 이미지로 추론하는 경우가 있었음.
+
+decode_upload는 multipart 파일(werkzeug FileStorage)의 바이트를 요청마다 따로 읽어서
+np.frombuffer(복사 없음) -> cv2.imdecode로 바로 BGR 배열을 만듦. ultralytics YOLO는 numpy 배열을 BGR로 받으므로
+model(frame)에 그대로 넣으면 됨. 공유 파일이 없어서 동시 요청에도 안전함.
+
+사용 예)
+    frame = decode_upload(request.files.get('image'))
+    results = model(frame)
+"""
+import numpy as np
+import cv2
+
+
+##### 업로드 파일 -> BGR 이미지 배열 (디코딩 실패 시 ValueError) #####
+def decode_upload(file_storage):
+    data = file_storage.read()                              # 요청별 bytes (다른 요청과 공유 안 함)
+    return decode_bytes(data)
+
+
+##### 인코딩된 이미지 bytes(jpg/png) -> BGR 이미지 배열 #####
+def decode_bytes(data, flags=cv2.IMREAD_COLOR):
+    buffer = np.frombuffer(data, dtype=np.uint8)           # bytes를 복사하지 않고 배열로 봄
+    frame = cv2.imdecode(buffer, flags)
+    if frame is None:
+        raise ValueError("Could not decode uploaded image")
+    return frame
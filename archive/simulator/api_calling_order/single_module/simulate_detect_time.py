@@ -3,15 +3,21 @@
 """
 from flask import Flask, request, jsonify
 import os
-import torch
-from ultralytics import YOLO
+import sys
 from datetime import datetime
 
+from image_decoding import decode_upload
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "..", "..", "..", "research", "VDRS", "archive", "detector_service", "single_module"))
+from detector_runtime import load_detector
+
 # Flask 애플리케이션 생성
 app = Flask(__name__)
 
 # YOLOv8 Nano 모델 로드(사전학습: COCO 80 클래스) — 서버 시작 시 1회 로드 후 재사용
-model = YOLO('yolov8n.pt')
+# detector_runtime.load_detector: 프로세스당 1회 로드 + 워밍업 (첫 /detect 요청의 초기화 지연 제거)
+runtime = load_detector('yolov8n.pt')
 
 # 시뮬레이터에 차례대로 보낼 샘플 액션 목록(큐처럼 pop(0)으로 하나씩 소비)
 combined_commands = [
@@ -113,15 +119,15 @@ def detect():
     if not image:
         return jsonify({"error": "No image received"}), 400
 
-    # 간단 구현: 디스크에 저장 후 경로로 추론
-    # (동시 요청 경합 방지 위해 실제 서비스에서는 UUID 파일명/메모리 추론 권장)
-    image_path = 'temp_image.jpg'
-    image.save(image_path)
+    # 메모리에서 바로 디코딩 (temp 파일 저장/재읽기 없음, 요청별 버퍼라 동시 요청에도 안전)
+    try:
+        frame = decode_upload(image)
+    except ValueError:
+        return jsonify({"error": "Invalid image"}), 400
 
     # YOLO 추론 실행(단일 이미지면 results 길이는 보통 1)
-    results = model(image_path)
-    # boxes.data: [x1, y1, x2, y2, conf, class_id] (Tensor → numpy)
-    detections = results[0].boxes.data.cpu().numpy()
+    # [x1, y1, x2, y2, conf, class_id] numpy 배열
+    detections = runtime.predict(frame)
 
     # 타깃 클래스 매핑
     #   COCO 기준: 0=person, 2=car, 7=truck, 15는 bench임(rock 아님)
@@ -3,16 +3,22 @@
 """
 from flask import Flask, request, jsonify
 import os
-import torch
-from ultralytics import YOLO
+import sys
 from datetime import datetime
 
+from image_decoding import decode_upload
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "..", "..", "..", "research", "VDRS", "archive", "detector_service", "single_module"))
+from detector_runtime import load_detector
+
 # Flask 앱 생성
 app = Flask(__name__)
 
 # YOLOv8 nano 모델 로드 (COCO 80클래스 사전학습 가중치)
 # 서버 시작 시 1회 로드 → 요청마다 재사용(추론 지연 감소)
-model = YOLO('yolov8n.pt')
+# detector_runtime.load_detector: 프로세스당 1회 로드 + 워밍업 (첫 /detect 요청의 초기화 지연 제거)
+runtime = load_detector('yolov8n.pt')
 
 # 시뮬레이터에 순차적으로 보낼 샘플 액션 시퀀스(큐처럼 pop(0)으로 사용)
 combined_commands = [
@@ -113,17 +119,15 @@ def detect():
     if not image:
         return jsonify({"error": "No image received"}), 400
 
-    # 간단 구현: 디스크에 저장 후 경로로 추론
-    # (실서비스: UUID 파일명/메모리 추론 권장 — 동시성 충돌 방지)
-    image_path = 'temp_image.jpg'
-    image.save(image_path)
+    # 메모리에서 바로 디코딩 (temp 파일 저장/재읽기 없음, 요청별 버퍼라 동시 요청에도 안전)
+    try:
+        frame = decode_upload(image)
+    except ValueError:
+        return jsonify({"error": "Invalid image"}), 400
 
     # YOLO 추론 실행
-    results = model(image_path)
-
-    # 결과의 바운딩박스 텐서를 numpy로 변환
-    # 포맷: [x1, y1, x2, y2, conf, class_id]
-    detections = results[0].boxes.data.cpu().numpy()
+    # [x1, y1, x2, y2, conf, class_id] numpy 배열
+    detections = runtime.predict(frame)
 
     # 타깃 클래스 매핑
     #   COCO 기준: 0=person, 2=car, 7=truck. (15는 bench)
@@ -0,0 +1,82 @@
+"""
+/detect 이미지 입력 방식 비교: temp_image.jpg 저장 후 읽기 vs 메모리 디코딩
+
+시뮬레이터 카메라 크기의 무작위 프레임을 jpg로 인코딩해 두고, 프레임마다
+1. 기존 방식: 업로드 bytes를 temp_image.jpg로 저장 -> cv2.imread (ultralytics가 경로를 받으면 내부에서 cv2.imread로 읽음)
+2. decode_upload 방식: np.frombuffer -> cv2.imdecode
+의 평균 / p99 시간을 재서 프레임당 줄어든 시간을 출력함. 모델 추론 시간은 두 방식이 같아서 제외.
+
+동시성: 서로 다른 프레임 CONCURRENT_REQUESTS개를 스레드로 동시에 처리했을 때
+기존 방식은 같은 파일을 덮어써서 다른 요청의 프레임을 읽는 경우가 생기고, 메모리 디코딩은 항상 자기 프레임을 읽는지 확인.
+"""
+import os
+import sys
+import time
+import tempfile
+import numpy as np
+import cv2
+from concurrent.futures import ThreadPoolExecutor
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "single_module"))
+
+from image_decoding import decode_bytes
+
+FRAME_SIZE = (720, 1280)        # 시뮬레이터 카메라 프레임 (높이, 너비), 측정 전 추정값
+JPEG_QUALITY = 90
+REPEATS = 200
+CONCURRENT_REQUESTS = 64
+
+
+def make_frames(n, rng):
+    frames = []
+    for i in range(n):
+        img = rng.integers(0, 256, (*FRAME_SIZE, 3), dtype=np.uint8)
+        img = cv2.GaussianBlur(img, (0, 0), 3)                      # 실제 장면처럼 압축되도록 고주파 제거
+        cv2.putText(img, str(i), (50, 200), cv2.FONT_HERSHEY_SIMPLEX, 6, (255, 255, 255), 12)
+        ok, encoded = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+        frames.append(encoded.tobytes())
+    return frames
+
+
+##### 기존 방식: 공유 temp 파일에 저장 후 경로로 읽기 #####
+def via_temp_file(data, path):
+    with open(path, "wb") as f:
+        f.write(data)
+    return cv2.imread(path)
+
+
+def timed(fn, frames, *args):
+    times = []
+    for i in range(REPEATS):
+        start = time.perf_counter()
+        fn(frames[i % len(frames)], *args)
+        times.append(time.perf_counter() - start)
+    times = np.array(times) * 1000.0
+    return times.mean(), np.percentile(times, 99)
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    frames = make_frames(8, rng)
+    temp_path = os.path.join(tempfile.gettempdir(), "temp_image.jpg")
+
+    file_mean, file_p99 = timed(via_temp_file, frames, temp_path)
+    mem_mean, mem_p99 = timed(decode_bytes, frames)
+    print(f"프레임 {FRAME_SIZE[1]}x{FRAME_SIZE[0]}, jpg {np.mean([len(f) for f in frames]) / 1024:.0f}KB")
+    print(f"{'방식':<14} | {'평균(ms)':>8} | {'p99(ms)':>8}")
+    print(f"{'temp 파일':<14} | {file_mean:>8.2f} | {file_p99:>8.2f}")
+    print(f"{'메모리 디코딩':<14} | {mem_mean:>8.2f} | {mem_p99:>8.2f}")
+    print(f"프레임당 절약: {file_mean - mem_mean:.2f}ms (평균), {file_p99 - mem_p99:.2f}ms (p99)")
+
+    # --- 동시 요청: 각 요청이 자기 프레임을 읽는지 (프레임 번호 = 요청 번호 % 8, 원본 디코딩 결과와 비교) ---
+    expected = [cv2.imdecode(np.frombuffer(f, np.uint8), cv2.IMREAD_COLOR) for f in frames]
+    requests = [i % len(frames) for i in range(CONCURRENT_REQUESTS)]
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        file_out = list(pool.map(lambda i: via_temp_file(frames[i], temp_path), requests))
+        mem_out = list(pool.map(lambda i: decode_bytes(frames[i]), requests))
+
+    def wrong(outputs):
+        return sum(out is None or not np.array_equal(out, expected[i]) for i, out in zip(requests, outputs))
+
+    print(f"동시 {CONCURRENT_REQUESTS}요청 중 다른 프레임/깨진 프레임: temp 파일 {wrong(file_out)}개, 메모리 디코딩 {wrong(mem_out)}개")
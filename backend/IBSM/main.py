@@ -126,6 +126,8 @@ def info():
         "ally_speed": player_speed, # 아군 전차 속도(m/s)
         "ally_turret_angle": {"x": player_turret_x, "y": player_turret_y}, # 아군 전차 포탑 X, Y 각도
         "ibsm_target_pos" : {"x": enemy_x, "y": enemy_y, "z": enemy_z}, # IBSM 상의 타겟 X, Y, Z 좌표
+        "ibsm_target_speed" : enemy_speed, # 타겟 속도 (FCS 리드 계산용)
+        "ibsm_target_body_angle" : {"x": enemy_body_x, "y": enemy_body_y, "z": enemy_body_z}, # 타겟 차체 X, Y, Z 각도 (FCS 리드 계산용)
         "may_type" : 0 # 현재 맵 유형
     }
     fcs_data = send_fcs(request_data_fcs)
@@ -1,6 +1,11 @@
 from flask import Flask, request, jsonify
+import os
+import sys
 import math
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESEARCH_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", "..", "..", ".."))
+
 # -------------------------------------------------------------------
 # detect | Integrated Battlefield Situation Management (IBSM)
 enemy_detection, enemy_in_fov = False, False # detect API
@@ -14,63 +19,14 @@ global_fire_command = False
 
 # -------------------------------------------------------------------
 
-# info | Waypoint : Linked List
-class WaypointNode:
-    def __init__(self, x, z):
-        self.x = float(x) # pos x
-        self.z = float(z) # pos y 
-        self.next = None # next node
-
-class WaypointList:
-    def __init__(self):
-        self.head = None # head node (first waypoint)
-        self.tail = None # tail node (last waypoint)
-        self._len = 0 # length (number of waypoints)
-
-    def append(self, x, z):
-        # Add a new waypoint to the end of the list
-        node = WaypointNode(x, z)
-        if not self.head:
-            self.head = self.tail = node # If list is empty, set head and tail
-        else:
-            self.tail.next = node # Link new node to the end
-            self.tail = node      # Update tail to new node
-        self._len += 1
-        return node
-    
-    def peek(self):
-        # Return the first waypoint (head) without removing it
-        return self.head
-
-    def pop(self):
-        # Remove and return the first waypoint (head)
-        if not self.head:
-            return None
-        node = self.head
-        self.head = node.next
-        if not self.head:
-            self.tail = None # If list is now empty, reset tail
-        node.next = None
-        self._len -= 1
-        return node
-
-    def is_empty(self):
-        # Check if the waypoint list is empty
-        return self.head is None
-
-    def to_list(self):
-        # Convert the linked list of waypoints to a Python list of dicts
-        out = []
-        cur = self.head
-        while cur:
-            out.append({'x': cur.x, 'z': cur.z})
-            cur = cur.next
-        return out
+# info | Waypoint : 배열 기반 웨이포인트 경로 (TPP/archive/waypoint_path)
+sys.path.append(os.path.join(RESEARCH_DIR, "TPP", "archive", "waypoint_path", "single_module"))
+from waypoint_path import WaypointPath
 
 # --------------------------------------------------------------------
 
 # Path Planning
-waypoints = WaypointList()
+waypoints = WaypointPath()
 
 # for idx, y in enumerate(range(5, 296, 5)): # whole path waypoints
 #     if idx % 2 == 0:
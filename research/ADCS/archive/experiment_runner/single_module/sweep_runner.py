@@ -0,0 +1,102 @@
+"""
+파라미터 스윕 실행기
+
+turning_inertial_force.py는 SPEED_LEVELS x REPEATS_PER_SPEED 스윕을 Flask /get_action 상태 머신(idle -> hold -> settle)으로
+돌려서, 시뮬레이터 세션 1개에 시행이 하나씩 순서대로만 진행됐고 중간에 끊기면 처음부터 다시 해야 했음.
+결과도 마지막에 한 번에 CSV로 저장해서 도중에 죽으면 전부 사라졌음.
+
+이 모듈은
+- 파라미터 격자(dict: 이름 -> 값 리스트) x 반복 횟수로 시행 목록을 만들고 (param_grid)
+- 시행 함수 trial_fn(params) -> 결과 dict 를 워커 프로세스 여러 개에서 동시에 실행
+- 시행 1개가 끝날 때마다 결과 행을 CSV에 바로 추가 (append-only, 열 순서 고정)
+- 같은 출력 파일로 다시 실행하면 이미 끝난 trial_id는 건너뛰고 나머지만 실행 (이어하기)
+를 제공함. 시행 함수는 headless_simulator의 TankSimulator 같은 로컬 모델이나 실제 시뮬레이터 세션 어느 쪽이든 가능하며,
+워커 프로세스에서 실행되므로 모듈 최상위 함수여야 함.
+
+사용 예)
+    run_sweep(turning_trial, {"d_weight": [0.2, 0.6, 1.0], "w_weight": [0.0, 0.5]}, "turning_sweep.csv", repeats=10)
+"""
+import os
+import csv
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+TRIAL_COLUMNS = ["trial_id", "repeat", "seed"]     # 모든 결과 행의 앞쪽 고정 열
+
+
+##### 격자 x 반복 -> 시행 목록 (trial_id는 파라미터 / 반복 번호로 정해져서 다시 만들어도 같음) #####
+def param_grid(grid, repeats=1, base_seed=0):
+    names = list(grid)
+    trials = []
+    for index, values in enumerate(itertools.product(*(grid[name] for name in names))):
+        for repeat in range(repeats):
+            params = dict(zip(names, values))
+            key = "_".join(f"{name}={value}" for name, value in params.items())
+            params.update(trial_id=f"{key}_r{repeat}", repeat=repeat,
+                          seed=base_seed + index * repeats + repeat)
+            trials.append(params)
+    return trials
+
+
+##### 출력 파일에 이미 기록된 trial_id #####
+def completed_trials(out_path):
+    if not os.path.exists(out_path):
+        return set()
+    with open(out_path, newline="", encoding="utf-8") as f:
+        return {row["trial_id"] for row in csv.DictReader(f)}
+
+
+##### 결과 행 추가용 writer (파일이 없으면 헤더부터) #####
+class ResultWriter:
+    def __init__(self, out_path):
+        self.out_path = out_path
+        self.fieldnames = None
+        if os.path.exists(out_path) and os.path.getsize(out_path) > 0:
+            with open(out_path, newline="", encoding="utf-8") as f:
+                self.fieldnames = next(csv.reader(f))
+
+    def write(self, row):
+        new_file = self.fieldnames is None
+        if new_file:
+            rest = [k for k in row if k not in TRIAL_COLUMNS]
+            self.fieldnames = TRIAL_COLUMNS + rest
+            os.makedirs(os.path.dirname(os.path.abspath(self.out_path)), exist_ok=True)
+        missing = set(row) - set(self.fieldnames)
+        if missing:
+            raise ValueError(f"Trial result has columns not in {self.out_path}: {sorted(missing)}")
+        with open(self.out_path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=self.fieldnames)
+            if new_file:
+                writer.writeheader()
+            writer.writerow(row)
+
+
+##### 시행 1개 실행 -> 파라미터 + 결과를 합친 행 #####
+def _run_trial(trial_fn, params):
+    result = trial_fn(dict(params))
+    return {**params, **result}
+
+
+##### 스윕 실행 (끝난 시행은 건너뜀), 이번에 실행한 시행 수 반환 #####
+def run_sweep(trial_fn, grid, out_path, repeats=1, workers=None, base_seed=0, progress=True):
+    trials = param_grid(grid, repeats, base_seed)
+    done = completed_trials(out_path)
+    pending = [t for t in trials if t["trial_id"] not in done]
+    if progress:
+        print(f"sweep: {len(trials)} trials, {len(done)} done, {len(pending)} to run")
+
+    writer = ResultWriter(out_path)
+    if workers == 1:
+        for i, params in enumerate(pending, 1):
+            writer.write(_run_trial(trial_fn, params))
+            if progress:
+                print(f"  [{i}/{len(pending)}] {params['trial_id']}")
+        return len(pending)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_run_trial, trial_fn, params): params for params in pending}
+        for i, future in enumerate(as_completed(futures), 1):
+            writer.write(future.result())
+            if progress:
+                print(f"  [{i}/{len(pending)}] {futures[future]['trial_id']}")
+    return len(pending)
@@ -0,0 +1,85 @@
+"""
+선회 관성(오버슈트) 스윕을 headless 시뮬레이터로 실행
+
+turning_inertial_force.py의 hold -> release -> settle 절차를 TankSimulator 위에서 시행 함수 하나로 만들고
+sweep_runner.run_sweep으로 (W weight x D weight x 반복) 격자를 워커 프로세스에서 돌림.
+출력 CSV가 이미 있으면 끝난 시행은 건너뜀 (중간에 Ctrl+C 후 다시 실행해도 이어서 진행).
+격자 / 절차를 바꿨으면 output_data/turning_inertia_sweep.csv를 지우고 실행해야 새 값으로 다시 돌림 (CSV는 커밋하지 않음).
+
+TankSimulator는 잡음 없는 결정적 모델이라 같은 파라미터의 반복 시행은 항상 같은 값이 나옴 (출발 각도 / hold 시간을
+흔들어도 hold 동안 각속도가 정상 상태에 도달해서 release 이후 값은 같음). 그래서 REPEATS = 1로 두고,
+반복은 실제 시뮬레이터 세션처럼 잡음이 있는 시행 함수로 바꿀 때만 늘림.
+시뮬레이터의 선회 각감속은 측정값이 없어서 각가속과 같다고 가정한 값이므로, 실제 오버슈트 측정을 대체하지는 않음.
+"""
+import os
+import sys
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ADCS_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", ".."))
+sys.path.append(os.path.join(BASE_DIR, "..", "single_module"))
+sys.path.append(os.path.join(ADCS_DIR, "headless_simulator", "single_module"))
+sys.path.append(os.path.join(ADCS_DIR, "signal_estimators", "single_module"))
+
+from sweep_runner import run_sweep
+from tank_simulator import TankSimulator, WS_NONE, WS_FORWARD
+from streaming_estimators import RateEstimator
+
+OUTPUT_PATH = os.path.join(BASE_DIR, "..", "output_data", "turning_inertia_sweep.csv")
+GRID = {
+    "w_weight": [0.0, 0.5, 1.0],
+    "d_weight": [round(n / 65, 3) for n in (5, 10, 20, 30, 40, 50, 65)],
+}
+REPEATS = 1                     # 결정적 모델이라 반복해도 같은 값
+WORKERS = 4
+SPIN_UP_SEC = 4.0               # W 가속 시간(s), w_weight > 0 일 때
+HOLD_SEC = 2.0                  # D 유지 시간(s), turning_inertial_force.py와 동일
+STABLE_OMEGA = 0.5              # 이 각속도(deg/s) 미만이 STABLE_TICKS_REQ 틱 이어지면 정지로 판단
+STABLE_TICKS_REQ = 3
+MAX_SETTLE_SEC = 5.0
+
+
+##### 시행 1개: W로 속도를 올리고 D hold -> release 후 추가 회전각 측정 #####
+def turning_trial(params):
+    sim = TankSimulator(n=1).reset()
+    estimator = RateEstimator()
+    zeros = np.zeros(1)
+
+    def step(ws, ad_w):
+        sim.step_arrays(np.array([ws], dtype=np.int8), np.array([params["w_weight"]]),
+                        np.ones(1) if ad_w > 0 else zeros, np.array([ad_w]), zeros, zeros, zeros, zeros)
+        return estimator.update(sim.time, float(sim.yaw[0]))
+
+    ws = WS_FORWARD if params["w_weight"] > 0 else WS_NONE
+    estimator.update(sim.time, float(sim.yaw[0]))
+    while sim.time < SPIN_UP_SEC * (params["w_weight"] > 0):
+        step(ws, 0.0)
+
+    hold_end = sim.time + HOLD_SEC
+    peak_omega = 0.0
+    while sim.time < hold_end:
+        peak_omega = max(peak_omega, abs(step(ws, params["d_weight"])))
+    omega_release = abs(estimator.rate)
+    release_yaw = estimator.angle
+
+    release_time = sim.time
+    stable_ticks = 0
+    while stable_ticks < STABLE_TICKS_REQ and sim.time - release_time < MAX_SETTLE_SEC:
+        stable_ticks = stable_ticks + 1 if abs(step(ws, 0.0)) < STABLE_OMEGA else 0
+
+    return {
+        "peak_omega": round(peak_omega, 3),
+        "omega_release": round(omega_release, 3),
+        "overshoot_deg": round(abs(estimator.angle - release_yaw), 3),
+        "settle_time": round(sim.time - release_time, 2),
+        "speed": round(float(sim.speed[0]), 3),
+    }
+
+
+if __name__ == "__main__":
+    run_sweep(turning_trial, GRID, OUTPUT_PATH, repeats=REPEATS, workers=WORKERS)
+
+    import pandas as pd
+    result = pd.read_csv(OUTPUT_PATH)
+    table = result.groupby(["w_weight", "d_weight"])[["peak_omega", "overshoot_deg", "settle_time"]].mean()
+    print(table.to_string(float_format=lambda v: f"{v:.2f}"))
@@ -0,0 +1,176 @@
+"""
+헤드리스 전차 운동 시뮬레이터
+
+제어기를 바꿀 때마다 외부 시뮬레이터를 띄워야 했고, navi13_comment.py의 Simulator.step_agent는
+등속 이동 + matplotlib 애니메이션에 묶여 있어서 ADCS/TPP 제어 코드를 반복 검증하는 데 쓸 수 없었음.
+
+이 모듈의 TankSimulator는
+- IBSM / get_action이 돌려주는 명령 dict(moveWS, moveAD, turretQE, turretRF)를 그대로 입력으로 받고
+- 시나리오 n개의 상태(위치, 차체 각도, 속도, 각속도, 포탑 각도)를 (n,) 배열로 들고 한 번에 적분
+- 차체: vehicle_dynamics/vehicle_model.json (최고 속도, 가속, 제동 방법별 감속, 선회 RSM, 선회 각가속/각감속)
+- 포탑: FCS slew_model_stabilizer 의 turret_slew_lut.csv (weight -> 선회 속도)
+- 명령은 COMMAND_DELAY 틱 늦게 반영 (info -> get_action 순서)
+으로 실제 시간보다 훨씬 빠르게 돌아서 제어기 / 경로 계획기를 수천 번씩 벤치마크할 수 있음.
+
+측정 데이터가 없는 부분(S 후진 최고 속도, 포탑이 차체 회전을 따라 도는지)은 아래 상수의 추정값을 사용.
+
+사용 예)
+    sim = TankSimulator(n=64)
+    sim.reset(x=start_x, z=start_z, yaw=0.0)
+    for _ in range(1000):
+        sim.step([get_action_dict(sim.info(i)) for i in range(sim.n)])
+"""
+import os
+import sys
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ADCS_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", ".."))
+RESEARCH_DIR = os.path.abspath(os.path.join(ADCS_DIR, "..", ".."))
+sys.path.append(os.path.join(ADCS_DIR, "vehicle_dynamics", "single_module"))
+sys.path.append(os.path.join(RESEARCH_DIR, "FCS", "archive", "stabilizer", "slew_model_stabilizer", "single_module"))
+
+from vehicle_model import VehicleModel
+from slew_model_stabilizer import TurretSlewModel
+
+TICK = 0.1                      # 적분 주기(s), 주행 로그의 Time 간격
+COMMAND_DELAY = 1               # 명령 반영 지연(틱)
+REVERSE_SPEED_RATIO = 0.5       # S 후진 최고 속도 / 전진 최고 속도, 측정 전 추정값
+TURRET_FOLLOWS_BODY = True      # 차체가 돌면 포탑 world 각도도 같이 돈다고 가정
+TURRET_MIN_PITCH = -5.0         # 포신 최소 각도(°)
+TURRET_MAX_PITCH = 10.0         # 포신 최대 각도(°)
+
+# 명령 문자열 -> 정수 코드
+WS_NONE, WS_FORWARD, WS_REVERSE, WS_STOP = 0, 1, 2, 3
+WS_CODES = {"W": WS_FORWARD, "S": WS_REVERSE, "STOP": WS_STOP}
+AD_SIGNS = {"D": 1.0, "A": -1.0}        # D = 시계방향(yaw 증가)
+QE_SIGNS = {"E": 1.0, "Q": -1.0}
+RF_SIGNS = {"R": 1.0, "F": -1.0}
+
+
+##### 명령 dict 리스트 -> 배열 (n,) 8개 #####
+def encode_actions(actions, n):
+    if isinstance(actions, dict):
+        actions = [actions] * n
+    ws = np.zeros(n, dtype=np.int8)
+    ws_w = np.zeros(n)
+    ad = np.zeros(n)
+    ad_w = np.zeros(n)
+    qe = np.zeros(n)
+    qe_w = np.zeros(n)
+    rf = np.zeros(n)
+    rf_w = np.zeros(n)
+    for i, action in enumerate(actions):
+        move_ws = action.get("moveWS") or {}
+        move_ad = action.get("moveAD") or {}
+        turret_qe = action.get("turretQE") or {}
+        turret_rf = action.get("turretRF") or {}
+        ws[i] = WS_CODES.get(move_ws.get("command", ""), WS_NONE)
+        ws_w[i] = move_ws.get("weight", 0.0)
+        ad[i] = AD_SIGNS.get(move_ad.get("command", ""), 0.0)
+        ad_w[i] = move_ad.get("weight", 0.0)
+        qe[i] = QE_SIGNS.get(turret_qe.get("command", ""), 0.0)
+        qe_w[i] = turret_qe.get("weight", 0.0)
+        rf[i] = RF_SIGNS.get(turret_rf.get("command", ""), 0.0)
+        rf_w[i] = turret_rf.get("weight", 0.0)
+    return ws, ws_w, ad, ad_w, qe, qe_w, rf, rf_w
+
+
+##### 현재 값에서 목표 값으로 step 크기만큼 이동 (넘어가지 않음) #####
+def approach(current, target, step):
+    return np.where(current < target, np.minimum(current + step, target), np.maximum(current - step, target))
+
+
+class TankSimulator:
+    def __init__(self, n=1, vehicle_model=None, slew_model=None, tick=TICK, command_delay=COMMAND_DELAY):
+        self.n = int(n)
+        self.model = vehicle_model or VehicleModel.from_json()
+        self.slew = slew_model or TurretSlewModel.from_csv()
+        self.tick = float(tick)
+        self.command_delay = int(command_delay)
+        self.reset()
+
+    def reset(self, x=0.0, z=0.0, yaw=0.0, speed=0.0, turret_yaw=None, turret_pitch=0.0):
+        shape = (self.n,)
+        self.x = np.broadcast_to(np.asarray(x, dtype=np.float64), shape).copy()
+        self.z = np.broadcast_to(np.asarray(z, dtype=np.float64), shape).copy()
+        self.yaw = np.broadcast_to(np.asarray(yaw, dtype=np.float64), shape).copy() % 360
+        self.speed = np.broadcast_to(np.asarray(speed, dtype=np.float64), shape).copy()
+        self.yaw_rate = np.zeros(shape)
+        turret_yaw = self.yaw if turret_yaw is None else turret_yaw
+        self.turret_yaw = np.broadcast_to(np.asarray(turret_yaw, dtype=np.float64), shape).copy() % 360
+        self.turret_pitch = np.broadcast_to(np.asarray(turret_pitch, dtype=np.float64), shape).copy()
+        self.time = 0.0
+        self.distance = np.zeros(shape)          # 누적 주행 거리(m)
+        idle = encode_actions({}, self.n)
+        self._pending = [idle] * self.command_delay
+        return self
+
+    ##### 명령 dict(리스트 또는 전체 공통 dict 1개)로 1틱 진행 #####
+    def step(self, actions):
+        return self.step_arrays(*encode_actions(actions, self.n))
+
+    ##### 이미 배열로 된 명령으로 1틱 진행 (벡터화된 제어기용) #####
+    def step_arrays(self, ws, ws_w, ad, ad_w, qe, qe_w, rf, rf_w):
+        self._pending.append((ws, ws_w, ad, ad_w, qe, qe_w, rf, rf_w))
+        ws, ws_w, ad, ad_w, qe, qe_w, rf, rf_w = self._pending.pop(0)
+        m = self.model
+        dt = self.tick
+        ws_w = np.clip(ws_w, 0.0, 1.0)
+
+        # --- 차체 속도 ---
+        forward = ws == WS_FORWARD
+        reverse = ws == WS_REVERSE
+        stop = ws == WS_STOP
+        target = np.where(forward, ws_w * m.max_speed,
+                          np.where(reverse, -ws_w * m.max_speed * REVERSE_SPEED_RATIO, 0.0))
+        speeding_up = (np.abs(target) > np.abs(self.speed)) & (np.sign(target) * self.speed >= 0)
+        rate = np.where(speeding_up, m.accel,
+                        np.where(stop, m.decel["stop"],
+                                 np.where(reverse & (self.speed > 0), m.decel["reverse"], m.decel["coast"])))
+        self.speed = approach(self.speed, target, rate * dt)
+
+        # --- 차체 각속도: RSM 목표 각속도까지 각가속, 키업이면 각감속 ---
+        w_now = np.clip(np.abs(self.speed) / m.max_speed, 0.0, 1.0)
+        yaw_target = ad * np.maximum(m.omega(w_now, np.clip(ad_w, 0.0, 1.0)), 0.0)
+        spinning_up = np.abs(yaw_target) > np.abs(self.yaw_rate)
+        yaw_step = np.where(spinning_up, m.yaw_accel, m.yaw_release_decel) * dt
+        self.yaw_rate = approach(self.yaw_rate, yaw_target, yaw_step)
+        body_delta = self.yaw_rate * dt
+        self.yaw = (self.yaw + body_delta) % 360
+
+        rad = np.radians(self.yaw)
+        self.x += self.speed * np.sin(rad) * dt
+        self.z += self.speed * np.cos(rad) * dt
+        self.distance += np.abs(self.speed) * dt
+
+        # --- 포탑 ---
+        turret_delta = qe * self.slew.yaw_rate(np.clip(qe_w, 0.0, 1.0)) * dt
+        if TURRET_FOLLOWS_BODY:
+            turret_delta = turret_delta + body_delta
+        self.turret_yaw = (self.turret_yaw + turret_delta) % 360
+        self.turret_pitch = np.clip(self.turret_pitch + rf * self.slew.pitch_rate(np.clip(rf_w, 0.0, 1.0)) * dt,
+                                    TURRET_MIN_PITCH, TURRET_MAX_PITCH)
+
+        self.time += dt
+        return self
+
+    ##### 시나리오 i의 상태를 시뮬레이터 /info 요청과 같은 형식으로 #####
+    def info(self, i=0):
+        return {
+            "time": self.time,
+            "playerPos": {"x": float(self.x[i]), "y": 0.0, "z": float(self.z[i])},
+            "playerSpeed": float(self.speed[i]),
+            "playerBodyX": float(self.yaw[i]),
+            "playerBodyY": 0.0,
+            "playerBodyZ": 0.0,
+            "playerTurretX": float(self.turret_yaw[i]),
+            "playerTurretY": float(self.turret_pitch[i]),
+        }
+
+    ##### 전체 상태 배열 (복사 없음) #####
+    def state(self):
+        return {
+            "x": self.x, "z": self.z, "yaw": self.yaw, "speed": self.speed, "yaw_rate": self.yaw_rate,
+            "turret_yaw": self.turret_yaw, "turret_pitch": self.turret_pitch, "distance": self.distance,
+        }
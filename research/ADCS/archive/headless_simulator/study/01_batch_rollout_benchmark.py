@@ -0,0 +1,105 @@
+"""
+헤드리스 시뮬레이터 처리 속도 / 폐루프 벤치마크
+
+1. 처리 속도: 시나리오 수별로 무작위 명령을 주고 1000틱 적분했을 때 초당 시뮬레이션 틱 수와 실시간 대비 배속
+2. 폐루프: 원형 코스(generate_circle_nodes 8노드)에서 출발 위치 / 방향을 무작위로 흔든 시나리오들을
+   PurePursuitFollower로 한 번에 돌려서 완주 시간 분포 비교
+"""
+import os
+import sys
+import math
+import time
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ADCS_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", ".."))
+sys.path.append(os.path.join(BASE_DIR, "..", "single_module"))
+sys.path.append(os.path.join(ADCS_DIR, "path_follower", "single_module"))
+sys.path.append(os.path.join(ADCS_DIR, "vehicle_dynamics", "single_module"))
+
+from tank_simulator import TankSimulator, WS_FORWARD
+from path_follower import PurePursuitFollower, densify
+from vehicle_model import VehicleModel
+from speed_profile import speed_profile
+
+SCENARIO_COUNTS = [1, 64, 1024, 8192]
+THROUGHPUT_TICKS = 1000
+CLOSED_LOOP_SCENARIOS = 64
+START_POS_NOISE = 5.0           # 출발 위치 흔들기(m)
+START_YAW_NOISE = 90.0          # 출발 방향 흔들기(°)
+MAX_TIME = 300.0
+
+
+def circle_nodes(x, z, num_nodes, radius):
+    return [(x + radius * math.cos(2 * math.pi * i / num_nodes), z + radius * math.sin(2 * math.pi * i / num_nodes))
+            for i in range(num_nodes)]
+
+
+def throughput(n, rng):
+    sim = TankSimulator(n=n)
+    ws = np.full(n, WS_FORWARD, dtype=np.int8)
+    start = time.perf_counter()
+    for _ in range(THROUGHPUT_TICKS):
+        sim.step_arrays(ws, rng.random(n), rng.choice([-1.0, 0.0, 1.0], n), rng.random(n),
+                        rng.choice([-1.0, 0.0, 1.0], n), rng.random(n), rng.choice([-1.0, 0.0, 1.0], n), rng.random(n))
+    elapsed = time.perf_counter() - start
+    ticks_per_sec = n * THROUGHPUT_TICKS / elapsed
+    return ticks_per_sec, ticks_per_sec * sim.tick
+
+
+def closed_loop(nodes, rng, use_profile):
+    model = VehicleModel.from_json()
+    n = CLOSED_LOOP_SCENARIOS
+    sim = TankSimulator(n=n, vehicle_model=model)
+    sim.reset(x=nodes[0][0] + rng.uniform(-START_POS_NOISE, START_POS_NOISE, n),
+              z=nodes[0][1] + rng.uniform(-START_POS_NOISE, START_POS_NOISE, n),
+              yaw=rng.uniform(-START_YAW_NOISE, START_YAW_NOISE, n))
+
+    followers = []
+    for _ in range(n):
+        path = densify(nodes)
+        if use_profile:
+            _, _, target_speed = speed_profile(path.as_array(), model, v_start=None)
+            followers.append(PurePursuitFollower(path, speed_profile=target_speed, vehicle_model=model))
+        else:
+            followers.append(PurePursuitFollower(path))
+
+    finish_time = np.full(n, np.nan)
+    max_error = np.zeros(n)
+    while sim.time < MAX_TIME and np.isnan(finish_time).any():
+        actions = []
+        for i, follower in enumerate(followers):
+            if follower.is_finished():
+                actions.append({"moveWS": {"command": "STOP", "weight": 1.0}})
+                continue
+            WS_command, WS_weight, AD_command, AD_weight = follower.control(
+                sim.x[i], sim.z[i], sim.yaw[i], sim.speed[i])
+            max_error[i] = max(max_error[i], follower.cross_track_error)
+            if follower.is_finished():
+                finish_time[i] = sim.time
+            actions.append({"moveWS": {"command": WS_command, "weight": WS_weight},
+                            "moveAD": {"command": AD_command, "weight": AD_weight}})
+        sim.step(actions)
+    return finish_time, max_error
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    print("1. 처리 속도 (무작위 명령, 1000틱)")
+    print(f"{'시나리오':>8} | {'틱/초':>12} | {'실시간 배속':>10}")
+    for n in SCENARIO_COUNTS:
+        ticks_per_sec, speedup = throughput(n, rng)
+        print(f"{n:>8} | {ticks_per_sec:>12,.0f} | {speedup:>10,.0f}x")
+
+    nodes = circle_nodes(150, 150, num_nodes=8, radius=100)
+    print(f"\n2. 폐루프 원형 코스 ({CLOSED_LOOP_SCENARIOS}개 시나리오, 출발 위치 ±{START_POS_NOISE}m / 방향 ±{START_YAW_NOISE}°)")
+    print(f"{'방식':<21} | {'완주율':>6} | {'평균(s)':>8} | {'p95(s)':>8} | {'최대이탈 평균(m)':>14} | {'계산시간(s)':>10}")
+    for name, use_profile in (("pure_pursuit", False), ("pure_pursuit+profile", True)):
+        start = time.perf_counter()
+        finish_time, max_error = closed_loop(nodes, np.random.default_rng(1), use_profile)
+        elapsed = time.perf_counter() - start
+        done = ~np.isnan(finish_time)
+        mean_t = np.mean(finish_time[done]) if done.any() else float("nan")
+        p95_t = np.percentile(finish_time[done], 95) if done.any() else float("nan")
+        print(f"{name:<21} | {done.mean() * 100:>5.0f}% | {mean_t:>8.1f} | {p95_t:>8.1f} | "
+              f"{np.mean(max_error):>14.2f} | {elapsed:>10.1f}")
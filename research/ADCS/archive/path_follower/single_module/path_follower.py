@@ -0,0 +1,144 @@
+"""
+Pure Pursuit 경로 추종기
+
+basic_path_tracking.py의 path_tracking()은 맨 앞 웨이포인트 방향으로
+20도 이상이면 1.0, 0.8도 이상이면 0.05 weight로 제자리 회전만 하고, 0.8도 안으로 정렬됐을 때만 W 0.3으로 전진해서
+웨이포인트마다 멈춰서 돌고 다시 출발하는 것을 반복했음.
+
+이 모듈은 웨이포인트를 일정 간격으로 촘촘하게 만든 경로(WaypointPath) 위에서
+- 남은 구간 전체에 현재 위치를 한 번에 투영(nearest_segment)해서 경로상 위치를 찾고
+- 속도에 비례하는 lookahead 거리만큼 앞의 점을 누적 길이 보간으로 구한 뒤
+- pure pursuit 곡률(2 sin α / Ld)로 필요한 각속도 -> AD weight (tank_cornering_w_d 선형회귀 역함수)
+- 곡률로 낼 수 있는 최대 속도, 남은 거리로 멈출 수 있는 속도, 방향 오차(cos α)로 WS weight
+를 매 틱 같이 계산해서 멈추지 않고 연속으로 주행함.
+
+WS weight는 최대 속도 대비 목표 속도 비율로 가정함 (W 0.3 = 저속 전진).
+vehicle_dynamics/speed_profile.py로 만든 점별 목표 속도(speed_profile)를 넘기면 곡률 / 남은 거리 제한 대신 그 값을 사용함.
+vehicle_model(VehicleModel)을 넘기면 AD weight를 선형회귀 대신 선회 RSM 역함수(현재 속도의 W weight 기준)로 계산함.
+
+사용 예)
+    follower = PurePursuitFollower(densify(nodes))
+    WS_command, WS_weight, AD_command, AD_weight = follower.control(player_x, player_z, player_body_x, player_speed)
+"""
+import os
+import sys
+import math
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESEARCH_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", "..", "..", ".."))
+sys.path.append(os.path.join(RESEARCH_DIR, "TPP", "archive", "waypoint_path", "single_module"))
+
+from waypoint_path import WaypointPath
+
+# tank_cornering_w_d 선형회귀: angular_velocity = 40.372 * D_weight - 0.494 (deg/s)
+BODY_YAW_RATE_GAIN = 40.372
+BODY_YAW_RATE_OFFSET = -0.494
+BODY_YAW_RATE_MAX = BODY_YAW_RATE_GAIN + BODY_YAW_RATE_OFFSET
+
+MAX_SPEED = 19.44               # W 1.0 최고 속도(m/s), tank_velocity_65 로그
+COAST_DECEL = 2.47              # W 키업 감속도(m/s^2), stop_velocity_w_keyup 로그
+
+PATH_SPACING = 1.0              # 경로를 촘촘하게 만들 간격(m)
+LOOKAHEAD_MIN = 4.0             # 최소 lookahead 거리(m)
+LOOKAHEAD_GAIN = 0.8            # 속도(m/s)당 추가 lookahead 거리(s)
+MIN_PURSUIT_SPEED = 3.0         # 정지 상태에서도 회전 명령이 나오도록 곡률에 곱하는 최소 속도(m/s)
+SEARCH_DISTANCE = 30.0          # 현재 구간부터 이 경로 길이 안에서만 가장 가까운 구간 검색(m)
+GOAL_TOLERANCE = 1.0            # 마지막 점 도착 판정 거리(m)
+AD_DEAD_BAND = 0.2              # 이보다 작은 각속도(deg/s)는 회전 명령 없음
+
+
+##### 웨이포인트 (N, 2) 배열을 spacing 간격으로 촘촘한 경로로 변환 #####
+def densify(points, spacing=PATH_SPACING):
+    points = np.asarray(points, dtype=np.float64)
+    seg = np.diff(points, axis=0)
+    cum = np.concatenate(([0.0], np.cumsum(np.hypot(seg[:, 0], seg[:, 1]))))
+    s = np.concatenate((np.arange(0.0, cum[-1], spacing), [cum[-1]]))
+    dense = np.column_stack([np.interp(s, cum, points[:, 0]), np.interp(s, cum, points[:, 1])])
+    return WaypointPath(dense)
+
+
+##### 원하는 차체 각속도(deg/s) -> AD weight #####
+def ad_weight_for_rate(rate):
+    return float(np.clip((abs(rate) - BODY_YAW_RATE_OFFSET) / BODY_YAW_RATE_GAIN, 0.0, 1.0))
+
+
+class PurePursuitFollower:
+    def __init__(self, path, max_speed_weight=1.0, lookahead_min=LOOKAHEAD_MIN, lookahead_gain=LOOKAHEAD_GAIN,
+                 speed_profile=None, vehicle_model=None):
+        self.path = path
+        self.vehicle_model = vehicle_model
+        self.speed_profile = None if speed_profile is None else np.asarray(speed_profile, dtype=np.float64)
+        self.max_speed_weight = max_speed_weight
+        self.lookahead_min = lookahead_min
+        self.lookahead_gain = lookahead_gain
+        self.cross_track_error = 0.0        # 마지막 틱의 경로 이탈 거리(m)
+        self.lookahead_point = None
+
+    def is_finished(self):
+        return self.path.is_empty()
+
+    ##### 현재 위치의 경로상 누적 거리(m)와 경로 이탈 거리 #####
+    def _progress(self, x, z):
+        seg, t, dist, _ = self.path.nearest_segment(x, z, max_distance=SEARCH_DISTANCE)
+        cum = self.path.cumulative_length()
+        if seg + 1 < len(cum):
+            self.path.seek(seg + 1)         # 지나간 점은 cursor 이동으로 O(1) 제거
+            return cum[seg] + t * (cum[seg + 1] - cum[seg]), dist
+        return cum[seg], dist
+
+    ##### 경로 추종 명령 (path_tracking()과 같은 반환 형식) #####
+    def control(self, player_x, player_z, player_body_x, player_speed):
+        if self.path.is_empty():
+            return "STOP", 1.0, "", 0.0
+
+        s_now, self.cross_track_error = self._progress(player_x, player_z)
+        cum = self.path.cumulative_length()
+        xz = self.path.planar()
+        remaining = cum[-1] - s_now
+
+        end_x, end_z = xz[-1]
+        if remaining <= GOAL_TOLERANCE and math.hypot(end_x - player_x, end_z - player_z) <= GOAL_TOLERANCE:
+            self.path.seek(len(cum))        # 경로 완료
+            return "STOP", 1.0, "", 0.0
+
+        # lookahead 점: 경로상 누적 거리 s_now + Ld 위치를 보간
+        lookahead = self.lookahead_min + self.lookahead_gain * max(player_speed, 0.0)
+        s_look = min(s_now + lookahead, cum[-1])
+        look_x = float(np.interp(s_look, cum, xz[:, 0]))
+        look_z = float(np.interp(s_look, cum, xz[:, 1]))
+        self.lookahead_point = (look_x, look_z)
+
+        dx = look_x - player_x
+        dz = look_z - player_z
+        distance = max(math.hypot(dx, dz), 1e-6)
+        alpha = (math.degrees(math.atan2(dx, dz)) - player_body_x + 540) % 360 - 180   # -180 ~ 180, 양수면 시계방향(D)
+        sin_alpha = math.sin(math.radians(alpha))
+
+        # --- 차체 A/D 회전 명령: pure pursuit 곡률 * 속도 = 필요한 각속도 ---
+        curvature = 2.0 * sin_alpha / distance
+        rate = math.degrees(max(player_speed, MIN_PURSUIT_SPEED) * curvature)
+        AD_command, AD_weight = "", 0.0
+        if abs(rate) > AD_DEAD_BAND:
+            AD_command = "D" if rate > 0 else "A"
+            if self.vehicle_model is not None:
+                AD_weight = float(self.vehicle_model.d_weight_for_rate(player_speed, rate))
+            else:
+                AD_weight = ad_weight_for_rate(rate)
+
+        # --- 차체 W/S 전진 명령: 곡률, 남은 거리(또는 속도 프로파일), 방향 오차로 제한한 목표 속도 ---
+        target_speed = MAX_SPEED * self.max_speed_weight
+        if self.speed_profile is not None:
+            target_speed = min(target_speed, float(np.interp(s_now, cum, self.speed_profile)))
+        else:
+            if abs(curvature) > 1e-6:
+                target_speed = min(target_speed, math.radians(BODY_YAW_RATE_MAX) / abs(curvature))
+            target_speed = min(target_speed, math.sqrt(2.0 * COAST_DECEL * remaining))
+        target_speed *= max(math.cos(math.radians(alpha)), 0.0)
+
+        if player_speed > target_speed + 1.0 or target_speed <= 0.0:
+            WS_command, WS_weight = "", 0.0          # W 키업 감속
+        else:
+            WS_command, WS_weight = "W", float(np.clip(target_speed / MAX_SPEED, 0.0, 1.0))
+
+        return WS_command, WS_weight, AD_command, AD_weight
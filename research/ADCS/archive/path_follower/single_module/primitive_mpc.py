@@ -0,0 +1,216 @@
+"""
+모션 프리미티브 MPC 경로 추종기 (선택 모드)
+
+basic_path_tracking.py / PurePursuitFollower의 조향은 각도 임계값 if/elif 또는 기하 공식 하나로 명령을 정해서,
+선회 중 속도 변화나 각가속 지연 같은 차체 운동 특성을 명령 선택에 반영하지 못했음.
+
+이 모듈의 PrimitiveMPCFollower는
+- (W weight x AD weight) 조합을 HORIZON 틱 동안 유지했을 때의 궤적(모션 프리미티브)을
+  초기 속도 / 초기 각속도 격자마다 headless_simulator의 TankSimulator(vehicle_model.json)로 한 번에 미리 계산해 배열로 들고 (build_primitive_library)
+- 매 틱 현재 속도 / 각속도 주변 격자를 보간한 프리미티브 전체(P x HORIZON)를 현재 자세로 회전 / 이동한 뒤
+  경로 이탈(프리미티브 이동 거리만큼 앞의 경로 점과의 거리), 목표 속도 오차, 마지막 방향 오차, 명령 변경을 배열 연산 한 번으로 평가해서
+  비용이 가장 작은 프리미티브의 첫 명령을 내보냄.
+틱당 계산은 보간 / 삼각함수 배열 연산 몇 번이라 1ms 안에 끝남 (study/02_compare_primitive_mpc.py).
+
+PurePursuitFollower와 같은 control() 반환 형식이라 get_action에서 그대로 바꿔 쓸 수 있음.
+각속도는 /info에 없어서 차체 각도를 streaming_estimators.RateEstimator로 미분해서 추정함 (control()을 TICK마다 호출한다고 가정).
+
+사용 예)
+    follower = PrimitiveMPCFollower(densify(nodes), speed_profile=target_speed)
+    WS_command, WS_weight, AD_command, AD_weight = follower.control(player_x, player_z, player_body_x, player_speed)
+"""
+import os
+import sys
+import math
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ADCS_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", ".."))
+sys.path.append(BASE_DIR)
+sys.path.append(os.path.join(ADCS_DIR, "headless_simulator", "single_module"))
+sys.path.append(os.path.join(ADCS_DIR, "vehicle_dynamics", "single_module"))
+sys.path.append(os.path.join(ADCS_DIR, "signal_estimators", "single_module"))
+
+from path_follower import SEARCH_DISTANCE, GOAL_TOLERANCE
+from tank_simulator import TankSimulator, WS_NONE, WS_FORWARD
+from vehicle_model import VehicleModel
+from streaming_estimators import RateEstimator
+
+TICK = 0.1                      # 제어 주기(s) = 프리미티브 적분 주기
+HORIZON = 10                    # 프리미티브 길이(틱), 1초 (2초는 명령 1개 유지 가정이 길어서 코너에서 이탈 증가)
+WS_WEIGHTS = (0.0, 0.05, 0.1, 0.2, 0.4, 0.6, 0.8, 1.0)              # 0.0 = W 키업, 0.05 / 0.1 = 도착 직전 저속
+AD_WEIGHTS = (-1.0, -0.6, -0.3, -0.1, 0.0, 0.1, 0.3, 0.6, 1.0)      # 음수 = A, 양수 = D
+SPEED_BINS = 21                 # 초기 속도 격자 수 (0 ~ 최고 속도)
+YAW_RATE_BINS = 9               # 초기 각속도 격자 수 (-최대 ~ +최대)
+
+W_POSITION = 1.0                # 경로 이탈 비용 (m^2당)
+W_SPEED = 0.3                   # 목표 속도 오차 비용 ((m/s)^2당)
+W_HEADING = 0.005               # 마지막 방향 오차 비용 (deg^2당)
+W_SWITCH = 0.5                  # 직전 프리미티브와 다른 명령을 고르는 비용
+APPROACH_SPEED = 2.0            # 목표 속도 하한(m/s), 경로 끝 직전에서 멈춰 버리지 않게 (정지는 위치 비용이 담당)
+
+
+##### 프리미티브 라이브러리: 격자 (속도, 각속도) x 프리미티브 P x HORIZON 의 차체 기준 궤적 #####
+class PrimitiveLibrary:
+    def __init__(self, ws_weight, ad_weight, speed_axis, rate_axis, bx, bz, dyaw, dist, speed):
+        self.ws_weight = ws_weight          # (P,)
+        self.ad_weight = ad_weight          # (P,) 부호 포함
+        self.speed_axis = speed_axis        # (S,)
+        self.rate_axis = rate_axis          # (R,)
+        self.bx = bx                        # (S, R, P, H) 출발 자세 기준 오른쪽(+) 이동(m)
+        self.bz = bz                        # (S, R, P, H) 출발 자세 기준 앞쪽(+) 이동(m)
+        self.dyaw = dyaw                    # (S, R, P, H) 방향 변화(deg)
+        self.dist = dist                    # (S, R, P, H) 누적 이동 거리(m)
+        self.speed = speed                  # (S, R, P, H) 속도(m/s)
+
+    def __len__(self):
+        return len(self.ws_weight)
+
+    ##### (속도, 각속도)에서의 프리미티브 궤적: 주변 격자 4개 bilinear 보간 -> (bx, bz, dyaw, dist, speed) 각 (P, H) #####
+    def trajectories(self, speed, yaw_rate):
+        gs = np.clip((speed - self.speed_axis[0]) / (self.speed_axis[1] - self.speed_axis[0]), 0.0, len(self.speed_axis) - 1)
+        gr = np.clip((yaw_rate - self.rate_axis[0]) / (self.rate_axis[1] - self.rate_axis[0]), 0.0, len(self.rate_axis) - 1)
+        s0 = min(int(gs), len(self.speed_axis) - 2)
+        r0 = min(int(gr), len(self.rate_axis) - 2)
+        ts, tr = gs - s0, gr - r0
+        w = ((1 - ts) * (1 - tr), (1 - ts) * tr, ts * (1 - tr), ts * tr)
+        return tuple(w[0] * a[s0, r0] + w[1] * a[s0, r0 + 1] + w[2] * a[s0 + 1, r0] + w[3] * a[s0 + 1, r0 + 1]
+                     for a in (self.bx, self.bz, self.dyaw, self.dist, self.speed))
+
+
+##### 모든 (초기 속도, 초기 각속도, 프리미티브) 조합을 TankSimulator 하나로 동시에 적분 #####
+def build_primitive_library(model=None, horizon=HORIZON, tick=TICK, ws_weights=WS_WEIGHTS, ad_weights=AD_WEIGHTS,
+                            speed_bins=SPEED_BINS, yaw_rate_bins=YAW_RATE_BINS):
+    model = model or VehicleModel.from_json()
+    ws_w, ad_w = (a.ravel() for a in np.meshgrid(ws_weights, ad_weights, indexing="ij"))
+    speed_axis = np.linspace(0.0, model.max_speed, speed_bins)
+    max_rate = float(model.max_yaw_rate(0.0))
+    rate_axis = np.linspace(-max_rate, max_rate, yaw_rate_bins)
+
+    S, R, P = len(speed_axis), len(rate_axis), len(ws_w)
+    shape = (S, R, P)
+    init_speed = np.broadcast_to(speed_axis[:, None, None], shape).ravel()
+    init_rate = np.broadcast_to(rate_axis[None, :, None], shape).ravel()
+    ws = np.where(np.broadcast_to(ws_w, shape).ravel() > 0, WS_FORWARD, WS_NONE).astype(np.int8)
+    ws_weight = np.broadcast_to(ws_w, shape).ravel()
+    ad = np.sign(np.broadcast_to(ad_w, shape).ravel())
+    ad_weight = np.abs(np.broadcast_to(ad_w, shape).ravel())
+    zeros = np.zeros(S * R * P)
+
+    sim = TankSimulator(n=S * R * P, vehicle_model=model, tick=tick, command_delay=0)
+    sim.reset(speed=init_speed)
+    sim.yaw_rate[:] = init_rate
+    out = np.empty((5, horizon, S * R * P))
+    unwrapped = np.zeros(S * R * P)
+    for k in range(horizon):
+        before = sim.yaw.copy()
+        sim.step_arrays(ws, ws_weight, ad, ad_weight, zeros, zeros, zeros, zeros)
+        unwrapped += (sim.yaw - before + 180.0) % 360.0 - 180.0
+        out[:, k] = sim.x, sim.z, unwrapped, sim.distance, sim.speed
+
+    bx, bz, dyaw, dist, speed = (a.T.reshape(S, R, P, horizon).copy() for a in out)
+    return PrimitiveLibrary(ws_w, ad_w, speed_axis, rate_axis, bx, bz, dyaw, dist, speed)
+
+
+class PrimitiveMPCFollower:
+    def __init__(self, path, max_speed_weight=1.0, speed_profile=None, vehicle_model=None, library=None):
+        self.path = path
+        self.model = vehicle_model or VehicleModel.from_json()
+        self.library = library or build_primitive_library(self.model)
+        self.max_speed_weight = max_speed_weight
+        self.speed_profile = None if speed_profile is None else np.asarray(speed_profile, dtype=np.float64)
+        self.rate_estimator = RateEstimator()
+        self.time = 0.0
+        self.previous = None                # 직전에 고른 프리미티브 번호
+        self.cross_track_error = 0.0
+        self.predicted = None               # 고른 프리미티브의 예측 궤적 (HORIZON, 2) world x, z
+
+        # 점별 경로 접선 단위 벡터 (마지막 점은 마지막 구간 방향), 누적 거리 기준 보간용
+        d = np.diff(self.path.planar(), axis=0)
+        d = np.vstack([d, d[-1:]]) if len(d) else np.array([[0.0, 1.0]])
+        self._tangent = d / np.maximum(np.hypot(d[:, 0], d[:, 1]), 1e-9)[:, None]
+
+    def is_finished(self):
+        return self.path.is_empty()
+
+    ##### 경로상 누적 거리(m)와 이탈 거리 (PurePursuitFollower._progress와 동일) #####
+    def _progress(self, x, z):
+        seg, t, dist, _ = self.path.nearest_segment(x, z, max_distance=SEARCH_DISTANCE)
+        cum = self.path.cumulative_length()
+        if seg + 1 < len(cum):
+            self.path.seek(seg + 1)
+            return cum[seg] + t * (cum[seg + 1] - cum[seg]), dist
+        return cum[seg], dist
+
+    ##### 목표 속도: 속도 프로파일 또는 (최고 속도 x weight, 남은 거리로 멈출 수 있는 속도), 하한 APPROACH_SPEED #####
+    def _reference_speed(self, s, cum):
+        limit = self.model.max_speed * self.max_speed_weight
+        if self.speed_profile is not None:
+            speed = np.minimum(np.interp(s, cum, self.speed_profile), limit)
+        else:
+            speed = np.minimum(limit, np.sqrt(2.0 * self.model.decel["coast"] * np.maximum(cum[-1] - s, 0.0)))
+        return np.maximum(speed, min(APPROACH_SPEED, limit))
+
+    ##### 직전 프리미티브의 첫 틱만큼 자세 예측 #####
+    def _predict_one_tick(self, x, z, body_x, speed, yaw_rate):
+        bx, bz, dyaw, _, next_speed = (a[self.previous, 0] for a in self.library.trajectories(speed, yaw_rate))
+        rad = math.radians(body_x)
+        c, s = math.cos(rad), math.sin(rad)
+        return x + bx * c + bz * s, z - bx * s + bz * c, (body_x + dyaw) % 360.0, float(next_speed), dyaw / TICK
+
+    ##### 프리미티브 전체 비용 (P,) #####
+    def evaluate(self, player_x, player_z, player_body_x, player_speed, yaw_rate, s_now):
+        lib = self.library
+        bx, bz, dyaw, dist, speed = lib.trajectories(player_speed, yaw_rate)
+
+        rad = math.radians(player_body_x)
+        c, s = math.cos(rad), math.sin(rad)
+        wx = player_x + bx * c + bz * s
+        wz = player_z - bx * s + bz * c
+
+        cum = self.path.cumulative_length()
+        xz = self.path.planar()
+        s_ref = np.minimum(s_now + dist, cum[-1])
+        rx = np.interp(s_ref, cum, xz[:, 0])
+        rz = np.interp(s_ref, cum, xz[:, 1])
+        position = ((wx - rx) ** 2 + (wz - rz) ** 2).sum(axis=1)
+        speed_err = ((speed - self._reference_speed(s_ref, cum)) ** 2).sum(axis=1)
+
+        s_end = s_ref[:, -1]
+        tx = np.interp(s_end, cum, self._tangent[:, 0])
+        tz = np.interp(s_end, cum, self._tangent[:, 1])
+        heading_err = (player_body_x + dyaw[:, -1] - np.degrees(np.arctan2(tx, tz)) + 540.0) % 360.0 - 180.0
+
+        cost = W_POSITION * position + W_SPEED * speed_err + W_HEADING * heading_err ** 2
+        if self.previous is not None:
+            cost += W_SWITCH * (np.arange(len(lib)) != self.previous)
+        return cost, wx, wz
+
+    ##### 경로 추종 명령 (path_tracking()과 같은 반환 형식) #####
+    def control(self, player_x, player_z, player_body_x, player_speed):
+        self.time += TICK
+        yaw_rate = self.rate_estimator.update(self.time, player_body_x)
+        if self.path.is_empty():
+            return "STOP", 1.0, "", 0.0
+
+        s_now, self.cross_track_error = self._progress(player_x, player_z)
+        cum = self.path.cumulative_length()
+        end_x, end_z = self.path.planar()[-1]
+        if cum[-1] - s_now <= GOAL_TOLERANCE and math.hypot(end_x - player_x, end_z - player_z) <= GOAL_TOLERANCE:
+            self.path.seek(len(cum))
+            return "STOP", 1.0, "", 0.0
+
+        # 명령은 1틱 늦게 반영되므로, 직전 프리미티브로 1틱 진행한 자세에서 평가
+        if self.previous is not None:
+            player_x, player_z, player_body_x, player_speed, yaw_rate = self._predict_one_tick(
+                player_x, player_z, player_body_x, player_speed, yaw_rate)
+        cost, wx, wz = self.evaluate(player_x, player_z, player_body_x, player_speed, yaw_rate, s_now)
+        best = int(cost.argmin())
+        self.previous = best
+        self.predicted = np.column_stack([wx[best], wz[best]])
+
+        ws_weight = float(self.library.ws_weight[best])
+        ad_weight = float(self.library.ad_weight[best])
+        WS_command, WS_weight = ("W", ws_weight) if ws_weight > 0 else ("", 0.0)
+        AD_command = "D" if ad_weight > 0 else "A" if ad_weight < 0 else ""
+        return WS_command, WS_weight, AD_command, abs(ad_weight)
@@ -0,0 +1,111 @@
+"""
+기존 path_tracking() vs Pure Pursuit 추종기 원형 코스 완주 시간 비교
+
+시뮬레이터 없이, 측정 로그에서 얻은 값으로 만든 간단한 차체 운동 모델로 비교함.
+- W weight * 최고 속도(19.44m/s)까지 2.4m/s^2로 가속, 목표 속도보다 빠르거나 W 키업이면 2.47m/s^2로 감속, STOP은 36m/s^2
+- A/D 각속도 = 40.372 * weight - 0.494 (deg/s)
+- 명령은 1틱 늦게 반영 (info -> get_action 순서)
+코스는 basic_path_tracking.py의 generate_circle_nodes(150, 10, 150, 8, 100) 원형 노드 8개.
+pure_pursuit+profile은 vehicle_dynamics/speed_profile.py의 점별 목표 속도와 선회 RSM 역함수 AD weight를 사용.
+"""
+import os
+import io
+import sys
+import math
+import time
+import contextlib
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ADCS_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", ".."))
+sys.path.append(os.path.join(BASE_DIR, "..", "single_module"))
+sys.path.append(os.path.join(ADCS_DIR, "basic_path_tracking", "single_module"))
+sys.path.append(os.path.join(ADCS_DIR, "vehicle_dynamics", "single_module"))
+
+from path_follower import PurePursuitFollower, densify, MAX_SPEED, COAST_DECEL, BODY_YAW_RATE_GAIN, BODY_YAW_RATE_OFFSET
+from waypoint_path import WaypointPath
+from vehicle_model import VehicleModel
+from speed_profile import speed_profile
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import basic_path_tracking
+
+TICK = 0.1                      # info 호출 주기(s)
+ACCEL = 2.4                     # W 가속도(m/s^2), tank_velocity_65 로그
+STOP_DECEL = 36.0               # STOP 감속도(m/s^2), stop_velocity_stop 로그
+MAX_TIME = 600.0
+
+
+##### 틱 1개 만큼 차체 상태 적분 #####
+def step(state, command):
+    x, z, yaw, speed = state
+    WS_command, WS_weight, AD_command, AD_weight = command
+
+    if WS_command == "STOP":
+        speed = max(speed - STOP_DECEL * TICK, 0.0)
+    else:
+        target = MAX_SPEED * WS_weight if WS_command == "W" else 0.0
+        if speed < target:
+            speed = min(speed + ACCEL * TICK, target)
+        else:
+            speed = max(speed - COAST_DECEL * TICK, target)
+
+    if AD_command in ("A", "D"):
+        rate = max(BODY_YAW_RATE_GAIN * AD_weight + BODY_YAW_RATE_OFFSET, 0.0)
+        yaw = (yaw + (rate if AD_command == "D" else -rate) * TICK) % 360
+
+    x += speed * math.sin(math.radians(yaw)) * TICK
+    z += speed * math.cos(math.radians(yaw)) * TICK
+    return (x, z, yaw, speed)
+
+
+def run(nodes, controller, is_finished):
+    course = WaypointPath(nodes)
+    state = (nodes[0][0], nodes[0][1], 0.0, 0.0)
+    command = ("", 0.0, "", 0.0)
+    travelled, max_error, ticks = 0.0, 0.0, 0
+    while ticks * TICK < MAX_TIME and not is_finished():
+        new_state = step(state, command)
+        travelled += math.hypot(new_state[0] - state[0], new_state[1] - state[1])
+        state = new_state
+        x, z, yaw, speed = state
+        max_error = max(max_error, course.nearest_segment(x, z)[2])
+        command = controller(x, z, yaw, speed)
+        ticks += 1
+    return {
+        "finished": is_finished(),
+        "time": ticks * TICK,
+        "travelled": travelled,
+        "max_error": max_error,
+    }
+
+
+def run_basic(nodes):
+    basic_path_tracking.waypoints = WaypointPath(nodes)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return run(nodes, basic_path_tracking.path_tracking, basic_path_tracking.waypoints.is_empty)
+
+
+def run_pure_pursuit(nodes):
+    follower = PurePursuitFollower(densify(nodes))
+    return run(nodes, follower.control, follower.is_finished)
+
+
+def run_pure_pursuit_profile(nodes):
+    path = densify(nodes)
+    model = VehicleModel.from_json()
+    _, _, target_speed = speed_profile(path.as_array(), model, v_start=None)
+    follower = PurePursuitFollower(path, speed_profile=target_speed, vehicle_model=model)
+    return run(nodes, follower.control, follower.is_finished)
+
+
+if __name__ == "__main__":
+    nodes = basic_path_tracking.generate_circle_nodes(150, 10, 150, num_nodes=8, radius=100)
+    print(f"{'방식':<21} | {'완주':>4} | {'완주시간(s)':>10} | {'주행거리(m)':>10} | {'최대이탈(m)':>10} | {'계산시간(ms)':>11}")
+    runners = (("path_tracking", run_basic), ("pure_pursuit", run_pure_pursuit),
+               ("pure_pursuit+profile", run_pure_pursuit_profile))
+    for name, runner in runners:
+        start = time.perf_counter()
+        r = runner(nodes)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{name:<21} | {str(r['finished']):>4} | {r['time']:>10.1f} | {r['travelled']:>10.1f} | "
+              f"{r['max_error']:>10.2f} | {elapsed:>11.1f}")
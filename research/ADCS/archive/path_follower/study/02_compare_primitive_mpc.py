@@ -0,0 +1,79 @@
+"""
+Pure Pursuit vs 모션 프리미티브 MPC 비교 (headless_simulator 폐루프)
+
+코스 2개(원형 8노드, 지그재그)에서 TankSimulator(vehicle_model.json, 명령 1틱 지연) 위에 추종기를 돌려
+완주 시간, 최대 / 평균 경로 이탈, 틱당 control() 계산 시간(평균 / p99)을 비교함.
+둘 다 vehicle_dynamics/speed_profile.py의 점별 목표 속도를 사용.
+"""
+import os
+import sys
+import math
+import time
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ADCS_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", ".."))
+sys.path.append(os.path.join(BASE_DIR, "..", "single_module"))
+sys.path.append(os.path.join(ADCS_DIR, "headless_simulator", "single_module"))
+sys.path.append(os.path.join(ADCS_DIR, "vehicle_dynamics", "single_module"))
+
+from path_follower import PurePursuitFollower, densify
+from primitive_mpc import PrimitiveMPCFollower, build_primitive_library
+from tank_simulator import TankSimulator
+from vehicle_model import VehicleModel
+from speed_profile import speed_profile
+
+MAX_TIME = 300.0
+
+
+def circle_nodes(x, z, num_nodes, radius):
+    return [(x + radius * math.cos(2 * math.pi * i / num_nodes), z + radius * math.sin(2 * math.pi * i / num_nodes))
+            for i in range(num_nodes)]
+
+
+def zigzag_nodes(x, z, legs, leg_length, width):
+    return [(x + (width if i % 2 else 0.0), z + i * leg_length) for i in range(legs + 1)]
+
+
+def run(follower, nodes, model):
+    start_x, start_z = nodes[0]
+    next_x, next_z = nodes[1]
+    sim = TankSimulator(n=1, vehicle_model=model).reset(
+        x=start_x, z=start_z, yaw=math.degrees(math.atan2(next_x - start_x, next_z - start_z)))
+    errors, tick_times = [], []
+    while sim.time < MAX_TIME and not follower.is_finished():
+        start = time.perf_counter()
+        WS_command, WS_weight, AD_command, AD_weight = follower.control(
+            float(sim.x[0]), float(sim.z[0]), float(sim.yaw[0]), float(sim.speed[0]))
+        tick_times.append(time.perf_counter() - start)
+        errors.append(follower.cross_track_error)
+        sim.step({"moveWS": {"command": WS_command, "weight": WS_weight},
+                  "moveAD": {"command": AD_command, "weight": AD_weight}})
+    finish = sim.time if follower.is_finished() else float("nan")
+    tick_times = np.array(tick_times) * 1000.0
+    return finish, max(errors), float(np.mean(errors)), tick_times.mean(), np.percentile(tick_times, 99)
+
+
+if __name__ == "__main__":
+    model = VehicleModel.from_json()
+    start = time.perf_counter()
+    library = build_primitive_library(model)
+    print(f"프리미티브 라이브러리: {len(library)}개 x 격자 {library.bx.shape[0]}x{library.bx.shape[1]}, "
+          f"생성 {time.perf_counter() - start:.2f}s, {library.bx.nbytes * 5 / 1e6:.1f}MB")
+
+    courses = {
+        "circle": circle_nodes(150, 150, num_nodes=8, radius=100) + [circle_nodes(150, 150, 8, 100)[0]],
+        "zigzag": zigzag_nodes(50, 20, legs=6, leg_length=40, width=30),
+    }
+    print(f"{'코스':<7} | {'방식':<13} | {'완주(s)':>7} | {'최대이탈(m)':>10} | {'평균이탈(m)':>10} | {'틱 평균(ms)':>10} | {'틱 p99(ms)':>10}")
+    for name, nodes in courses.items():
+        for method in ("pure_pursuit", "primitive_mpc"):
+            path = densify(nodes)
+            _, _, target_speed = speed_profile(path.as_array(), model, v_start=None)
+            if method == "pure_pursuit":
+                follower = PurePursuitFollower(path, speed_profile=target_speed, vehicle_model=model)
+            else:
+                follower = PrimitiveMPCFollower(path, speed_profile=target_speed, vehicle_model=model, library=library)
+            finish, max_err, mean_err, tick_mean, tick_p99 = run(follower, nodes, model)
+            print(f"{name:<7} | {method:<13} | {finish:>7.1f} | {max_err:>10.2f} | {mean_err:>10.2f} | "
+                  f"{tick_mean:>10.3f} | {tick_p99:>10.3f}")
@@ -0,0 +1,216 @@
+"""
+제어 루프용 스트리밍 추정기
+
+turning_inertial_force.py는 deque(maxlen=500)에 yaw / omega를 쌓아 두고, 매번 list -> np.array 변환 후
+np.unwrap / np.polyfit으로 전체를 다시 계산했고, dt EMA / 각속도 계산은 전역 변수로 흩어져 있었음.
+ADCS 프로토타입들도 위치 차분 속도를 각자 따로 계산했음.
+
+이 모듈은 샘플 1개마다 O(1)로 갱신되는 추정기를 제공함 (모두 __slots__ 사용, 고정 크기 링버퍼).
+- RingBuffer: 고정 크기 float 링버퍼 (가장 오래된 값 꺼내기 / 시간순 배열 보기)
+- EMA: 지수이동평균 (alpha 고정 또는 시간 상수 tau로 dt에 맞춰 alpha 계산)
+- WindowedSlope: 최근 window개 (t, y)의 선형회귀 기울기 / 절편 (누적합 Σt, Σt², Σy, Σty 갱신)
+- AngleUnwrapper: 0~360 각도를 연속 각도로 (-180~180 차이를 누적)
+- Derivative: 시간 미분 + 선택적 EMA 필터 (위치 -> 속도, 각도 -> 각속도)
+- RateEstimator: AngleUnwrapper + Derivative + WindowedSlope (차체 / 포탑 각속도, 각가속도)
+FCS lead_solver.py의 TargetHistoryBank와 같은 방식(기준 시각 t0를 빼고 누적합 유지)으로 수치 안정성을 확보함.
+
+사용 예)
+    yaw_rate = RateEstimator(window=20)
+    omega = yaw_rate.update(data["time"], data["playerBodyX"])
+    alpha = yaw_rate.acceleration()
+"""
+import math
+import numpy as np
+
+MIN_DT = 1e-3                   # dt 하한(s), 같은 시각 샘플이 두 번 들어와도 0으로 나누지 않게
+
+
+##### 고정 크기 float 링버퍼 #####
+class RingBuffer:
+    __slots__ = ("capacity", "data", "head", "count")
+
+    def __init__(self, capacity):
+        self.capacity = int(capacity)
+        self.data = np.zeros(self.capacity)
+        self.head = 0                   # 다음에 쓸 위치
+        self.count = 0
+
+    ##### 값 추가, 가득 차 있었으면 밀려난 값을 반환 (없으면 None) #####
+    def push(self, value):
+        old = self.data[self.head] if self.count == self.capacity else None
+        self.data[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if old is None:
+            self.count += 1
+        return old
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def last(self):
+        return self.data[(self.head - 1) % self.capacity] if self.count else None
+
+    ##### 오래된 값 -> 최신 값 순서의 배열 (복사본) #####
+    def to_array(self):
+        if self.count < self.capacity:
+            return self.data[:self.count].copy()
+        return np.roll(self.data, -self.head)
+
+    def __len__(self):
+        return self.count
+
+
+##### 지수이동평균 #####
+# alpha를 주면 고정 가중치, tau(s)를 주면 alpha = 1 - exp(-dt / tau)로 샘플 간격에 맞춤
+class EMA:
+    __slots__ = ("alpha", "tau", "value")
+
+    def __init__(self, alpha=None, tau=None, value=None):
+        if (alpha is None) == (tau is None):
+            raise ValueError("EMA needs exactly one of alpha or tau")
+        self.alpha = alpha
+        self.tau = tau
+        self.value = value
+
+    def update(self, x, dt=None):
+        if self.value is None:
+            self.value = x
+            return x
+        a = self.alpha if self.tau is None else 1.0 - math.exp(-max(dt or 0.0, 0.0) / self.tau)
+        self.value += a * (x - self.value)
+        return self.value
+
+    def reset(self, value=None):
+        self.value = value
+
+
+##### 최근 window개 (t, y)의 선형회귀 #####
+class WindowedSlope:
+    __slots__ = ("window", "t0", "ts", "ys", "st", "stt", "sy", "sty")
+
+    def __init__(self, window):
+        self.window = int(window)
+        self.ts = RingBuffer(self.window)
+        self.ys = RingBuffer(self.window)
+        self.reset()
+
+    def reset(self):
+        self.t0 = None                  # 기준 시각 (누적합 수치 안정용)
+        self.ts.clear()
+        self.ys.clear()
+        self.st = self.stt = self.sy = self.sty = 0.0
+
+    def update(self, t, y):
+        if self.t0 is None:
+            self.t0 = t
+        tr = t - self.t0
+        old_t = self.ts.push(tr)
+        old_y = self.ys.push(y)
+        if old_t is not None:           # 창에서 밀려난 값은 누적합에서 제거
+            self.st -= old_t
+            self.stt -= old_t * old_t
+            self.sy -= old_y
+            self.sty -= old_t * old_y
+        self.st += tr
+        self.stt += tr * tr
+        self.sy += y
+        self.sty += tr * y
+        return self
+
+    ##### 기울기 (dy/dt), 샘플 2개 미만이거나 시각이 모두 같으면 0 #####
+    def slope(self):
+        n = len(self.ts)
+        denom = n * self.stt - self.st * self.st
+        if n < 2 or abs(denom) < 1e-12:
+            return 0.0
+        return (n * self.sty - self.st * self.sy) / denom
+
+    ##### 시각 t에서의 회귀 직선 값 #####
+    def predict(self, t):
+        n = len(self.ts)
+        if n == 0:
+            return 0.0
+        b = self.slope()
+        return (self.sy - b * self.st) / n + b * (t - self.t0)
+
+    def __len__(self):
+        return len(self.ts)
+
+
+##### 0~360 각도 -> 연속 각도(deg) #####
+class AngleUnwrapper:
+    __slots__ = ("last", "value")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.last = None
+        self.value = None
+
+    def update(self, angle):
+        if self.last is None:
+            self.value = angle
+        else:
+            self.value += (angle - self.last + 180.0) % 360.0 - 180.0
+        self.last = angle
+        return self.value
+
+
+##### 시간 미분 + EMA 필터 (alpha=1.0이면 필터 없음) #####
+class Derivative:
+    __slots__ = ("last_t", "last_x", "value", "alpha", "dt")
+
+    def __init__(self, alpha=1.0, dt_alpha=0.4):
+        self.alpha = alpha
+        self.dt = EMA(alpha=dt_alpha)   # 샘플 간격 EMA (turning_inertial_force.py의 ema_dt와 같은 0.6/0.4)
+        self.reset()
+
+    def reset(self):
+        self.last_t = None
+        self.last_x = None
+        self.value = 0.0
+        self.dt.reset()
+
+    def update(self, t, x):
+        if self.last_t is not None:
+            dt = max(MIN_DT, t - self.last_t)
+            self.dt.update(dt)
+            self.value += self.alpha * ((x - self.last_x) / dt - self.value)
+        self.last_t = t
+        self.last_x = x
+        return self.value
+
+
+##### 각도 스트림 -> 각속도(deg/s) / 각가속도(deg/s^2) #####
+class RateEstimator:
+    __slots__ = ("unwrapper", "derivative", "rate_slope")
+
+    def __init__(self, window=10, alpha=1.0):
+        self.unwrapper = AngleUnwrapper()
+        self.derivative = Derivative(alpha=alpha)
+        self.rate_slope = WindowedSlope(window)
+
+    def reset(self):
+        self.unwrapper.reset()
+        self.derivative.reset()
+        self.rate_slope.reset()
+
+    def update(self, t, angle):
+        rate = self.derivative.update(t, self.unwrapper.update(angle))
+        if self.derivative.dt.value is not None:    # 첫 샘플은 각속도가 없음
+            self.rate_slope.update(t, rate)
+        return rate
+
+    @property
+    def angle(self):
+        return self.unwrapper.value
+
+    @property
+    def rate(self):
+        return self.derivative.value
+
+    ##### 최근 window개 각속도의 회귀 기울기 = 각가속도 #####
+    def acceleration(self):
+        return self.rate_slope.slope()
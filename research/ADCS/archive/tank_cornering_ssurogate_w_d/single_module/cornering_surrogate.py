@@ -0,0 +1,105 @@
+"""
+선회 RSM surrogate 런타임 계산기
+
+generate_surrogate_model.py는 sklearn으로 2차 다항식을 학습한 뒤 수식을 문자열로 출력만 해서,
+제어 코드에서 쓰려면 sklearn을 다시 import해서 학습하거나 수식을 손으로 옮겨 적어야 했음.
+
+이 모듈은 generate_surrogate_model.py가 저장한 계수 파일(source/cornering_rsm_v1.json)만 읽어서
+- omega(w, d): 각속도(deg/s)
+- d_weight(w, omega): 원하는 각속도에 필요한 d_weight (d에 대한 2차식의 근, 닫힌 형태)
+- build_table / d_weight_from_table: (w, omega) 격자에 d_weight를 미리 계산해 두고 bilinear 보간
+를 계산함. weight 인자는 모두 0~1 (내부에서 65분율로 변환). 스칼라는 math만 쓰는 빠른 경로로 계산함.
+
+사용 예)
+    surrogate = CorneringSurrogate.from_json()
+    AD_weight = surrogate.d_weight(WS_weight, desired_rate)
+"""
+import os
+import json
+import math
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RSM_PATH = os.path.join(BASE_DIR, "..", "source", "cornering_rsm_v1.json")
+
+SUPPORTED_VERSION = 1
+TABLE_W_STEPS = 66              # 미리 계산하는 표의 w 칸 수 (1/65 간격)
+TABLE_OMEGA_STEPS = 201         # 미리 계산하는 표의 omega 칸 수
+
+
+class CorneringSurrogate:
+    def __init__(self, params):
+        # params: cornering_rsm_v1.json 또는 vehicle_model.json 의 "cornering_rsm" 항목
+        version = params.get("version", SUPPORTED_VERSION)
+        if version != SUPPORTED_VERSION:
+            raise ValueError(f"Unsupported cornering RSM version: {version}")
+        self.weight_scale = float(params["weight_scale"])
+        self.coefs = tuple(float(c) for c in params["coefs"])
+        self.table = None
+
+    @classmethod
+    def from_json(cls, path=RSM_PATH):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    ##### 각속도(deg/s) #####
+    def omega(self, w_weight, d_weight):
+        c0, c1, c2, c3, c4, c5 = self.coefs
+        if np.isscalar(w_weight) and np.isscalar(d_weight):
+            w = w_weight * self.weight_scale
+            d = d_weight * self.weight_scale
+            return c0 + c1 * w + c2 * d + c3 * w * w + c4 * w * d + c5 * d * d
+        w = np.asarray(w_weight, dtype=np.float64) * self.weight_scale
+        d = np.asarray(d_weight, dtype=np.float64) * self.weight_scale
+        return c0 + c1 * w + c2 * d + c3 * w * w + c4 * w * d + c5 * d * d
+
+    def max_omega(self, w_weight):
+        return self.omega(w_weight, 1.0)
+
+    ##### 역함수: 각속도 omega(deg/s)에 필요한 d_weight (0~1로 clip) #####
+    # c5 d^2 + (c2 + c4 w) d + (c0 + c1 w + c3 w^2 - omega) = 0 의 근 중 c5 -> 0 일 때 선형해로 가는 근
+    # 2C / (-B - sqrt(B^2 - 4AC)) 형태로 써서 c5가 아주 작아도 자릿수 손실이 없음
+    def d_weight(self, w_weight, omega):
+        c0, c1, c2, c3, c4, c5 = self.coefs
+        if np.isscalar(w_weight) and np.isscalar(omega):
+            w = w_weight * self.weight_scale
+            b = c2 + c4 * w
+            c = c0 + c1 * w + c3 * w * w - abs(omega)
+            disc = b * b - 4.0 * c5 * c
+            if disc < 0.0:
+                return 1.0                                  # 낼 수 없는 각속도 -> 최대
+            d = -2.0 * c / (b + math.sqrt(disc))
+            return min(max(d / self.weight_scale, 0.0), 1.0)
+
+        w = np.asarray(w_weight, dtype=np.float64) * self.weight_scale
+        omega = np.abs(np.asarray(omega, dtype=np.float64))
+        b = c2 + c4 * w
+        c = c0 + c1 * w + c3 * w * w - omega
+        disc = b * b - 4.0 * c5 * c
+        with np.errstate(invalid="ignore"):
+            d = -2.0 * c / (b + np.sqrt(np.maximum(disc, 0.0)))
+        d = np.where(disc < 0.0, self.weight_scale, d)
+        return np.clip(d / self.weight_scale, 0.0, 1.0)
+
+    ##### (w, omega) 격자에 d_weight 미리 계산 #####
+    def build_table(self, w_steps=TABLE_W_STEPS, omega_steps=TABLE_OMEGA_STEPS):
+        w_axis = np.linspace(0.0, 1.0, w_steps)
+        omega_axis = np.linspace(0.0, float(np.max(self.max_omega(w_axis))), omega_steps)
+        grid = self.d_weight(w_axis[:, None], omega_axis[None, :])
+        self.table = (w_axis, omega_axis, grid)
+        return self.table
+
+    ##### 표에서 d_weight bilinear 보간 (표 범위 밖은 가장자리 clamp) #####
+    def d_weight_from_table(self, w_weight, omega):
+        if self.table is None:
+            self.build_table()
+        w_axis, omega_axis, grid = self.table
+        gw = np.clip(np.asarray(w_weight, dtype=np.float64), 0.0, 1.0) * (len(w_axis) - 1)
+        go = np.clip(np.abs(np.asarray(omega, dtype=np.float64)) / omega_axis[-1], 0.0, 1.0) * (len(omega_axis) - 1)
+        i0 = np.minimum(np.floor(gw).astype(np.intp), len(w_axis) - 2)
+        j0 = np.minimum(np.floor(go).astype(np.intp), len(omega_axis) - 2)
+        tw = gw - i0
+        to = go - j0
+        top = grid[i0, j0] * (1.0 - to) + grid[i0, j0 + 1] * to
+        bottom = grid[i0 + 1, j0] * (1.0 - to) + grid[i0 + 1, j0 + 1] * to
+        return top * (1.0 - tw) + bottom * tw
@@ -8,7 +8,12 @@
 - 아이디어와 방식은 선형회귀와 동일합니다. 다만, 1차원의 직선이 아닌 3차원의 곡평면 형태로 인풋에 대한 아웃풋을 도출해냅니다.
 - 선형회귀보다 더 정확한 각속도 output을 도출해낼 수 있을 것입니다.
 - 해당 코드파일은 output들을 서로게이트 모델로 회귀시키고 예측값을 내는 모델 생성 코드입니다.
+4. 계수 저장
+- 학습된 계수를 source/cornering_rsm_v1.json 으로 저장합니다. 제어 코드에서는 cornering_surrogate.py가 이 파일만 읽어서
+  sklearn 없이 각속도와 그 역함수(원하는 각속도에 필요한 d_weight)를 계산합니다.
 """
+import os
+import json
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -18,9 +23,14 @@ from sklearn.metrics import r2_score, mean_squared_error
 from mpl_toolkits.mplot3d import Axes3D
 plt.rc("font", family="Malgun Gothic")
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RSM_VERSION = 1
+WEIGHT_SCALE = 65  # w_weight, d_weight 는 65분율 (n / 65)
+rsm_path = os.path.join(BASE_DIR, "..", "source", f"cornering_rsm_v{RSM_VERSION}.json")
+
 # 데이터 로드
 # 파일 경로와 컬럼명 확인: 'w','d','output'
-df = pd.read_excel("research/body_control/path_planning/tank_cornering_ssurogate_w_d/data/experiment_data.xlsx")
+df = pd.read_excel(os.path.join(BASE_DIR, "..", "source", "input_data", "experiment_data.xlsx"))
 
 X = df[['w_weight','d_weight']].values
 y = df['omega'].values
@@ -47,6 +57,21 @@ print("\nModel terms and coefficients:")
 for name, c in zip(feature_names, coefs):
     print(f"  {name:10s} : {c:+.6e}")
 
+# 계수 파일 저장 (cornering_surrogate.py 에서 사용)
+rsm = {
+    "version": RSM_VERSION,
+    "weight_scale": WEIGHT_SCALE,
+    "terms": ["1", "w", "d", "w^2", "w*d", "d^2"],  # PolynomialFeatures(degree=2) 순서
+    "coefs": [float(c) for c in coefs],
+    "w_range": [float(df['w_weight'].min()), float(df['w_weight'].max())],
+    "d_range": [float(df['d_weight'].min()), float(df['d_weight'].max())],
+    "r2": float(r2),
+    "rmse": float(rmse),
+}
+with open(rsm_path, "w", encoding="utf-8") as f:
+    json.dump(rsm, f, indent=2)
+print(f"\nRSM 계수 저장 -> {rsm_path}")
+
 # 그리드 예측 (시각화를 위한 격자)
 w_lin = np.linspace(df['w_weight'].min(), df['w_weight'].max(), 60)
 d_lin = np.linspace(df['d_weight'].min(), df['d_weight'].max(), 60)
@@ -0,0 +1,202 @@
+"""
+ADCS 실험 로그 분석 도구
+
+stop_velocity/all_methods.py의 process_and_plot은 샘플마다 Python 반복문으로 감속 구간을 찾고 상태 문자열 리스트를 만들었고,
+tank_deaccelate_65.py는 itertools.groupby로 연속 구간을 찾았음. 둘 다 실행할 때마다 xlsx를 새로 읽고,
+분석 결과는 matplotlib 그래프와 print로만 남았음.
+
+이 모듈은
+- 로그를 한 번 읽으면 열(column)별 NumPy 배열로 .npz 캐시에 저장해 두고 다음부터는 캐시를 읽음 (원본 크기/수정시각이 바뀌면 다시 읽음)
+- 속도(위치 차분, x-z 평면), 가속도, 차체 / 포탑 각속도(unwrap)를 배열 연산 + 이동평균 필터로 계산
+- 조건 마스크의 연속 구간을 run-length encoding(run_lengths)으로 찾고, all_methods.py와 같은 규칙의 제동 구간 검출을 배열 연산으로 수행
+- 로그 여러 개를 프로세스 풀로 병렬 분석해서 요약 표(DataFrame)로 반환 (그래프 없음)
+을 제공함.
+
+all_methods.py는 속도를 Player_Pos_X / Player_Pos_Y(높이)로 계산했는데, 여기서는 지면 평면인 X / Z로 계산함.
+
+사용 예)
+    summary = analyze_logs(glob.glob("stop_velocity/input_data/*.xlsx"), workers=4)
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR_NAME = ".telemetry_cache"
+SMOOTH_WINDOW = 5               # 이동평균 창 크기(샘플), all_methods.py와 동일
+STOPPED_SPEED = 0.01            # 이 속도(m/s) 미만이면 정지 상태 (all_methods.py와 동일)
+MIN_RUNNING_TIME = 17.0         # 주행 시작 후 이 시간(s)이 지난 뒤의 감속만 제동으로 판단
+MIN_DECEL_DURATION = 1.5        # 최소 감속 지속 시간(s)
+MIN_DECEL_DROP = 0.2            # 최소 속도 감소량(m/s)
+DECEL_ACCEL_THRESHOLD = -0.01   # 이 가속도(m/s^2)보다 작아야 감속 샘플
+
+
+##### 로그 1개 로딩 (열별 NumPy 배열 .npz 캐시) #####
+def load_log(path, cache_dir=None):
+    path = os.path.abspath(path)
+    cache_dir = cache_dir or os.path.join(os.path.dirname(path), CACHE_DIR_NAME)
+    cache_path = os.path.join(cache_dir, os.path.basename(path) + ".npz")
+    stat = os.stat(path)
+    source_key = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+    if os.path.exists(cache_path):
+        with np.load(cache_path, allow_pickle=False) as data:
+            if np.array_equal(data["__source_key__"], source_key):
+                columns = [str(c) for c in data["__columns__"]]
+                return pd.DataFrame({c: data[c] for c in columns})
+
+    df = pd.read_excel(path) if path.endswith((".xlsx", ".xls")) else pd.read_csv(path)
+    df = df.loc[:, ~df.columns.astype(str).str.startswith("Unnamed")]
+    df = df.apply(pd.to_numeric, errors="coerce")
+    os.makedirs(cache_dir, exist_ok=True)
+    np.savez(cache_path, __source_key__=source_key, __columns__=np.array(df.columns, dtype=str),
+             **{c: df[c].to_numpy() for c in df.columns})
+    return df
+
+
+##### 이동평균 (양 끝은 np.convolve mode="same"과 같이 0으로 패딩) #####
+def moving_average(values, window=SMOOTH_WINDOW):
+    if window <= 1:
+        return np.asarray(values, dtype=np.float64)
+    return np.convolve(values, np.ones(window) / window, mode="same")
+
+
+##### 각도(deg) 열을 unwrap 한 뒤 시간 미분 (deg/s) #####
+def angular_rate(angle_deg, time):
+    unwrapped = np.rad2deg(np.unwrap(np.deg2rad(angle_deg)))
+    return np.gradient(unwrapped, time)
+
+
+##### 속도 / 가속도 / 각속도 열 추가 #####
+def derive(df, window=SMOOTH_WINDOW):
+    time = df["Time"].to_numpy(dtype=np.float64)
+    x = df["Player_Pos_X"].to_numpy(dtype=np.float64)
+    z = df["Player_Pos_Z"].to_numpy(dtype=np.float64)
+    dt = np.diff(time)
+    dt[dt == 0] = 1e-6
+
+    speed = np.hypot(np.diff(x), np.diff(z)) / dt
+    speed = np.append(speed, speed[-1]) if len(speed) else np.zeros(len(time))
+    smooth_speed = moving_average(speed, window)
+    accel = np.diff(smooth_speed) / dt
+    accel = np.append(accel, accel[-1]) if len(accel) else np.zeros(len(time))
+
+    out = df.copy()
+    out["Calc_Speed"] = smooth_speed
+    out["Acceleration"] = moving_average(accel, window)
+    if "Player_Body_X" in df:
+        out["Body_Yaw_Rate"] = angular_rate(df["Player_Body_X"].to_numpy(dtype=np.float64), time)
+    if "Player_Turret_X" in df:
+        out["Turret_Yaw_Rate"] = angular_rate(df["Player_Turret_X"].to_numpy(dtype=np.float64), time)
+    return out
+
+
+##### run-length encoding: (시작 인덱스, 길이, 값) #####
+def run_lengths(values):
+    values = np.asarray(values)
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp), values[:0]
+    change = np.flatnonzero(values[1:] != values[:-1]) + 1
+    starts = np.concatenate(([0], change))
+    lengths = np.diff(np.concatenate((starts, [len(values)])))
+    return starts, lengths, values[starts]
+
+
+##### True 연속 구간의 [start, end) 인덱스 #####
+def true_runs(mask):
+    starts, lengths, values = run_lengths(np.asarray(mask, dtype=bool))
+    keep = values.astype(bool)
+    return starts[keep], starts[keep] + lengths[keep]
+
+
+##### 제동 구간 플래그 (all_methods.py process_and_plot 과 같은 규칙) #####
+def braking_flags(time, smooth_speed, accel, min_running_time=MIN_RUNNING_TIME,
+                  min_duration=MIN_DECEL_DURATION, min_drop=MIN_DECEL_DROP):
+    n = len(time)
+    flags = np.zeros(n, dtype=bool)
+    moving = smooth_speed >= STOPPED_SPEED
+    if n < 2 or not moving.any():
+        return flags
+    moving_start = int(np.argmax(moving))
+
+    cond = np.zeros(n, dtype=bool)
+    cond[1:] = (smooth_speed[1:] < smooth_speed[:-1]) & (accel[1:] < DECEL_ACCEL_THRESHOLD)
+    cond[:moving_start + 1] = False
+    cond &= (time - time[moving_start]) >= min_running_time
+
+    # 감속 샘플 연속 구간 [a, b) -> 구간 시작은 a-1 (감속 직전 샘플 포함)
+    a, b = true_runs(cond)
+    start = a - 1
+    last = b - 1
+    duration = time[last] - time[start]
+    drop = smooth_speed[start] - smooth_speed[last]
+    ok = (duration >= min_duration) & (drop >= min_drop)
+    for s, e in zip(start[ok], b[ok]):
+        flags[s:e] = True
+
+    # 1샘플짜리 빈틈은 연결
+    gap = np.zeros(n, dtype=bool)
+    gap[1:-1] = ~flags[1:-1] & flags[:-2] & flags[2:]
+    return flags | gap
+
+
+##### 제동 구간 표 (구간별 시작/끝 시각, 속도, 거리, 최소 가속도) #####
+def braking_segments(df, **kwargs):
+    d = df if "Calc_Speed" in df else derive(df)
+    time = d["Time"].to_numpy(dtype=np.float64)
+    speed = d["Calc_Speed"].to_numpy()
+    accel = d["Acceleration"].to_numpy()
+    x = d["Player_Pos_X"].to_numpy(dtype=np.float64)
+    z = d["Player_Pos_Z"].to_numpy(dtype=np.float64)
+    step = np.concatenate(([0.0], np.hypot(np.diff(x), np.diff(z))))
+    cum = np.cumsum(step)
+
+    starts, ends = true_runs(braking_flags(time, speed, accel, **kwargs))
+    last = ends - 1
+    return pd.DataFrame({
+        "start_time": time[starts],
+        "end_time": time[last],
+        "duration": time[last] - time[starts],
+        "start_speed": speed[starts],
+        "end_speed": speed[last],
+        "distance": cum[last] - cum[starts],
+        "min_accel": np.array([accel[s:e].min() for s, e in zip(starts, ends)]),
+    })
+
+
+##### 로그 1개 요약 (행 1개) #####
+def summarize_log(path, cache_dir=None):
+    df = derive(load_log(path, cache_dir))
+    speed = df["Calc_Speed"].to_numpy()
+    accel = df["Acceleration"].to_numpy()
+    moving = speed >= STOPPED_SPEED
+    braking = braking_segments(df)
+    row = {
+        "log": os.path.basename(path),
+        "samples": len(df),
+        "duration": float(df["Time"].iloc[-1] - df["Time"].iloc[0]) if len(df) else 0.0,
+        "max_speed": float(speed.max()) if len(speed) else 0.0,
+        "mean_moving_speed": float(speed[moving].mean()) if moving.any() else 0.0,
+        "max_accel": float(accel.max()) if len(accel) else 0.0,
+        "braking_segments": len(braking),
+        "braking_time": float(braking["duration"].sum()),
+        "braking_distance": float(braking["distance"].sum()),
+        "braking_min_accel": float(braking["min_accel"].min()) if len(braking) else 0.0,
+    }
+    if "Body_Yaw_Rate" in df:
+        row["max_body_yaw_rate"] = float(np.abs(df["Body_Yaw_Rate"]).max())
+    if "Turret_Yaw_Rate" in df:
+        row["max_turret_yaw_rate"] = float(np.abs(df["Turret_Yaw_Rate"]).max())
+    return row
+
+
+##### 로그 여러 개 병렬 요약 -> DataFrame #####
+def analyze_logs(paths, workers=None, cache_dir=None):
+    paths = list(paths)
+    if workers == 1 or len(paths) <= 1:
+        rows = [summarize_log(p, cache_dir) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(summarize_log, paths, [cache_dir] * len(paths)))
+    return pd.DataFrame(rows)
@@ -0,0 +1,44 @@
+"""
+ADCS 주행 로그 전체 요약
+
+archive 아래의 모든 주행 로그(xlsx)를 telemetry.analyze_logs로 한 번에 요약하고,
+1. 첫 실행(xlsx 읽기 + 캐시 저장) / 캐시 실행 / 캐시 + 병렬 실행 시간
+2. 로그별 요약 표 (최고 속도, 제동 구간 수 / 시간 / 거리, 최대 각속도)
+를 출력함. 요약 표는 output_data/adcs_log_summary.csv 로 저장.
+"""
+import os
+import sys
+import glob
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ADCS_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", ".."))
+sys.path.append(os.path.join(BASE_DIR, "..", "single_module"))
+
+from telemetry import analyze_logs, load_log
+
+OUTPUT_PATH = os.path.join(BASE_DIR, "..", "output_data", "adcs_log_summary.csv")
+WORKERS = 4
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    paths = sorted(glob.glob(os.path.join(ADCS_DIR, "**", "*.xlsx"), recursive=True))
+    # 주행 로그만 (Time / 위치 열이 있는 파일), 이 단계에서 캐시가 만들어짐
+    logs, first_elapsed = timed(lambda: [p for p in paths if "Player_Pos_Z" in load_log(p)])
+
+    _, cached_elapsed = timed(analyze_logs, logs, workers=1)
+    summary, parallel_elapsed = timed(analyze_logs, logs, workers=WORKERS)
+
+    print(f"로그 {len(logs)}개")
+    print(f"xlsx 읽기 + 캐시 저장: {first_elapsed:.2f}s | 캐시 분석: {cached_elapsed:.2f}s | "
+          f"캐시 + 병렬({WORKERS}) 분석: {parallel_elapsed:.2f}s")
+    print(summary.to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+
+    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
+    summary.to_csv(OUTPUT_PATH, index=False)
@@ -8,9 +8,9 @@ turning_inertial_force_v3.py
 - 릴리즈 직전 ω 기록 + 감속률 α 추정 + yaw unwrap 적용
 """
 
-import os, math
+import os, sys, math
 from datetime import datetime
-from collections import defaultdict, deque
+from collections import defaultdict
 from flask import Flask, request, jsonify
 import matplotlib
 matplotlib.use("Agg")
@@ -18,6 +18,11 @@ import matplotlib.pyplot as plt
 import logging
 import numpy as np
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "..", "signal_estimators", "single_module"))
+
+from streaming_estimators import RateEstimator, WindowedSlope
+
 # ------------------------
 # 저장 경로 설정
 # ------------------------
@@ -47,7 +52,6 @@ DECAY_RECORD_SEC = 1.0  # 감속 구간 샘플링 시간
 # 전역 상태
 # ------------------------
 yaw, time_s = None, None
-_last_yaw, _last_time = None, None
 omega, ema_dt = 0.0, None
 state = "idle"
 curr_speed_idx, curr_repeat = 0, 0
@@ -61,8 +65,9 @@ peakomega_by_speed = defaultdict(list)
 alpha_by_speed = defaultdict(list)
 all_trials = []
 
-yaw_buffer = deque(maxlen=500)
-omega_buffer = deque(maxlen=500)
+# 샘플마다 O(1) 갱신: yaw unwrap + 각속도, 최근 500개 각속도의 회귀 기울기(감속률)
+yaw_rate_est = RateEstimator()
+omega_slope = WindowedSlope(window=500)
 
 ts = datetime.now().strftime("%Y%m%d_%H%M%S")
 CSV_PATH = os.path.join(SAVE_DIR, f"turning_inertia_results.csv")
@@ -72,12 +77,6 @@ CSV_PATH = os.path.join(SAVE_DIR, f"turning_inertia_results.csv")
 # ------------------------
 def norm360(a): return a % 360.0
 def cw_diff(tgt, cur): return (tgt - cur) % 360.0
-def unwrap_yaw(yaw_list):
-    if not yaw_list:
-        return []
-    yaws = np.array(yaw_list)
-    return np.rad2deg(np.unwrap(np.deg2rad(yaws)))
-
 def current_speed():
     if curr_speed_idx >= len(SPEED_LEVELS):
         return SPEED_LEVELS[-1]   # 안전 처리: 마지막 속도로 고정 반환
@@ -138,7 +137,7 @@ def summarize_and_save():
 # ------------------------
 @app.route("/info", methods=["POST"])
 def info():
-    global yaw, time_s, _last_yaw, _last_time, omega, ema_dt, stable_ticks
+    global yaw, time_s, omega, ema_dt, stable_ticks
     data = request.get_json(force=True)
     try:
         yaw = norm360(float(data.get("playerBodyX", yaw)))
@@ -146,16 +145,13 @@ def info():
     except:
         return jsonify({"status": "invalid"})
 
-    if yaw is not None and time_s is not None and _last_yaw is not None and _last_time is not None:
-        dt = max(1e-3, time_s - _last_time)
-        ema_dt = dt if ema_dt is None else (0.6 * ema_dt + 0.4 * dt)
-        d = cw_diff(yaw, _last_yaw)
-        if d > 180: d -= 360
-        omega = d / dt
-        stable_ticks = stable_ticks + 1 if abs(omega) < (5.0 * (current_speed()/65.0)) else 0
-        yaw_buffer.append(yaw)
-        omega_buffer.append(omega)
-    _last_yaw, _last_time = yaw, time_s
+    if yaw is not None and time_s is not None:
+        first_sample = yaw_rate_est.angle is None
+        omega = yaw_rate_est.update(time_s, yaw)
+        ema_dt = yaw_rate_est.derivative.dt.value
+        if not first_sample:
+            stable_ticks = stable_ticks + 1 if abs(omega) < (5.0 * (current_speed()/65.0)) else 0
+            omega_slope.update(time_s, omega)
     return jsonify({"status": "ok"})
 
 @app.route("/get_action", methods=["POST"])
@@ -179,8 +175,7 @@ def get_action():
     w = current_weight()
 
     if state == "idle":
-        yaw_buffer.clear()
-        omega_buffer.clear()
+        omega_slope.reset()
         peak_omega_this_trial = 0.0
         hold_end_time = time_s + HOLD_SEC
         release_yaw = None
@@ -204,15 +199,10 @@ def get_action():
     elif state == "settle":
         elapsed = 0.0 if release_time is None else max(0.0, time_s - release_time)
         if elapsed >= MIN_SETTLE_TIME and stable_ticks >= STABLE_TICKS_REQ:
-            # 감속률 α 추정
-            yaw_unwrapped = unwrap_yaw(list(yaw_buffer))
-            t_decay, omega_decay = np.array(range(len(omega_buffer))), np.array(list(omega_buffer))
+            # 감속률 α 추정 (최근 각속도 회귀 기울기, 누적합으로 O(1))
             alpha_est = 0.0
-            if len(omega_decay) > 5:
-                dt_mean = ema_dt or 0.02
-                t_axis = np.arange(len(omega_decay)) * dt_mean
-                coefs = np.polyfit(t_axis, omega_decay, 1)
-                alpha_est = -coefs[0]
+            if len(omega_slope) > 5:
+                alpha_est = -omega_slope.slope()
 
             final_yaw = yaw
             extra_cw = cw_diff(final_yaw, release_yaw)
@@ -0,0 +1,144 @@
+"""
+차체 운동 모델 계수 피팅 코드
+
+ADCS에 측정 데이터는 여럿 있지만(제동: stop_velocity, 가속: tank_deaccelerate, 선회: tank_cornering_ssurogate_w_d / tank_turn_d,
+선회 후 추가 회전: turning_inertial_force) 각 분석 코드가 그래프와 print만 남기고 끝나서 제어 코드에서는 쓸 수 없었음.
+
+이 코드는 측정 로그에서
+- 최고 속도, W 가속도
+- 제동 방법별(W 키업 / S / STOP) 평균 감속도와 최고 속도에서의 제동 거리
+- 선회 각속도 RSM 2차 다항식 계수 omega(w, d) (w, d는 65분율 weight, sklearn 없이 최소제곱)
+- 선회 시작 각가속도, 선회 키업 후 각감속도(추가 회전각 계산용)
+을 한 번에 피팅해서 source/vehicle_model.json 계수 파일로 저장함. 런타임에서는 vehicle_model.py가 이 파일만 읽음.
+
+turning_inertial_force.py 실험 결과 csv가 없으면 선회 키업 후 각감속도는 선회 시작 각가속도와 같다고 가정함.
+"""
+import os
+import json
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ADCS_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", ".."))
+
+accel_xlsx_path = os.path.join(ADCS_DIR, "tank_deaccelerate", "source", "input_data", "tank_velocity_65.xlsx")
+brake_xlsx_paths = {
+    "coast": os.path.join(ADCS_DIR, "stop_velocity", "input_data", "stop_velocity_w_keyup.xlsx"),
+    "reverse": os.path.join(ADCS_DIR, "stop_velocity", "input_data", "stop_velocity_s.xlsx"),
+    "stop": os.path.join(ADCS_DIR, "stop_velocity", "input_data", "stop_velocity_stop.xlsx"),
+}
+cornering_xlsx_path = os.path.join(ADCS_DIR, "tank_cornering_ssurogate_w_d", "source", "input_data", "experiment_data.xlsx")
+turn_d_dir = os.path.join(ADCS_DIR, "tank_turn_d", "source", "input_data")
+turn_d_weights = [5, 10, 20, 30, 40, 50, 65]
+overshoot_csv_path = os.path.join(ADCS_DIR, "turning_inertial_force", "source", "turning_inertia_results.csv")
+out_path = os.path.join(BASE_DIR, "..", "source", "vehicle_model.json")
+
+MODEL_VERSION = 1
+WEIGHT_SCALE = 65.0             # 실험 weight 분모 (w_weight, d_weight = n / 65)
+STOPPED_SPEED = 0.3             # 이 속도(m/s) 미만이면 정지로 판단
+YAW_MOVING_RATE = 0.5           # 이 각속도(deg/s) 이상이면 선회 중으로 판단
+
+
+##### 최고 속도와 W 가속도 (10% ~ 90% 구간 선형회귀 기울기) #####
+def fit_acceleration(xlsx_path):
+    df = pd.read_excel(xlsx_path)
+    t = df["Time"].to_numpy(dtype=float)
+    v = df["Player_Speed"].to_numpy(dtype=float)
+    max_speed = float(np.median(v[v >= 0.9 * v.max()]))             # 튀는 틱을 피해서 최고 속도 구간의 중앙값
+    first_top = int(np.argmax(v >= 0.9 * max_speed))
+    rising = np.arange(first_top + 1)
+    rising = rising[(v[rising] >= 0.1 * max_speed) & (v[rising] <= 0.9 * max_speed)]
+    accel = float(np.polyfit(t[rising], v[rising], 1)[0])
+    return max_speed, accel
+
+
+##### 제동: 마지막 최고 속도 틱 -> 정지 틱 사이 평균 감속도와 제동 거리 (제동 거리는 틱별 속도 사다리꼴 적분) #####
+def fit_braking(xlsx_path):
+    df = pd.read_excel(xlsx_path)
+    t = df["Time"].to_numpy(dtype=float)
+    v = df["Player_Speed"].to_numpy(dtype=float)
+    peak = int(np.flatnonzero(v >= 0.95 * v.max())[-1])
+    stopped = np.flatnonzero(v[peak:] < STOPPED_SPEED)
+    stop = peak + int(stopped[0]) if len(stopped) else len(v) - 1   # 로그가 완전 정지 전에 끝나면 마지막 틱까지
+    v_seg, t_seg = v[peak:stop + 1], t[peak:stop + 1]
+    decel = float((v_seg[0] - v_seg[-1]) / (t_seg[-1] - t_seg[0]))
+    distance = float(np.sum(0.5 * (v_seg[1:] + v_seg[:-1]) * np.diff(t_seg)))
+    return {"decel": decel, "from_speed": float(v_seg[0]), "distance": distance, "time": float(t_seg[-1] - t_seg[0])}
+
+
+##### 선회 각속도 RSM: omega = c0 + c1 w + c2 d + c3 w^2 + c4 w d + c5 d^2 #####
+def fit_cornering_rsm(xlsx_path):
+    df = pd.read_excel(xlsx_path)
+    w = df["w_weight"].to_numpy(dtype=float)
+    d = df["d_weight"].to_numpy(dtype=float)
+    omega = df["omega"].to_numpy(dtype=float)
+    X = np.column_stack([np.ones_like(w), w, d, w * w, w * d, d * d])
+    coefs, *_ = np.linalg.lstsq(X, omega, rcond=None)
+    residual = omega - X @ coefs
+    r2 = 1.0 - np.sum(residual ** 2) / np.sum((omega - omega.mean()) ** 2)
+    return coefs, float(r2), float(np.sqrt(np.mean(residual ** 2)))
+
+
+##### 선회 시작 각가속도: 정상 각속도 / 90% 도달 시간 (tank_turn_d 로그별 중앙값) #####
+def fit_yaw_accel(turn_d_dir, weights):
+    accels = []
+    for n in weights:
+        df = pd.read_excel(os.path.join(turn_d_dir, f"tank_d_turn_{n}.xlsx"))
+        t = df["Time"].to_numpy(dtype=float)
+        yaw = np.rad2deg(np.unwrap(np.deg2rad(df["Player_Body_X"].to_numpy(dtype=float))))
+        rate = np.abs(np.diff(yaw) / np.diff(t))
+        moving = np.flatnonzero(rate >= YAW_MOVING_RATE)
+        if len(moving) < 3:
+            continue
+        steady = float(np.median(rate[moving]))
+        reached = moving[rate[moving] >= 0.9 * steady][0]
+        spin_up = t[reached + 1] - t[moving[0]]         # 회전 시작 틱 ~ 90% 도달 틱 끝
+        accels.append(steady / spin_up)
+    return float(np.median(accels))
+
+
+def fit_vehicle_model(out_path):
+    max_speed, accel = fit_acceleration(accel_xlsx_path)
+    braking = {name: fit_braking(path) for name, path in brake_xlsx_paths.items()}
+    rsm_coefs, rsm_r2, rsm_rmse = fit_cornering_rsm(cornering_xlsx_path)
+    yaw_accel = fit_yaw_accel(turn_d_dir, turn_d_weights)
+
+    if os.path.exists(overshoot_csv_path):
+        yaw_release_decel = float(pd.read_csv(overshoot_csv_path)["alpha_est"].abs().median())
+        release_source = "turning_inertia_results.csv"
+    else:
+        yaw_release_decel = yaw_accel
+        release_source = "assumed_equal_to_yaw_accel"
+
+    model = {
+        "version": MODEL_VERSION,
+        "max_speed": max_speed,                         # m/s
+        "accel": accel,                                 # m/s^2
+        "braking": braking,                             # 방법별 decel(m/s^2), 최고 속도에서의 제동 거리(m)/시간(s)
+        "cornering_rsm": {
+            "weight_scale": WEIGHT_SCALE,
+            "terms": ["1", "w", "d", "w^2", "w*d", "d^2"],
+            "coefs": [float(c) for c in rsm_coefs],     # omega(deg/s)
+            "r2": rsm_r2,
+            "rmse": rsm_rmse,
+        },
+        "yaw_accel": yaw_accel,                         # deg/s^2
+        "yaw_release_decel": yaw_release_decel,         # deg/s^2
+        "yaw_release_source": release_source,
+    }
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(model, f, indent=2)
+
+    print("차체 운동 모델 피팅 결과")
+    print(f"최고 속도: {max_speed:.2f} m/s, W 가속도: {accel:.3f} m/s^2")
+    for name, b in braking.items():
+        print(f"제동({name}): {b['decel']:.2f} m/s^2, {b['from_speed']:.2f} m/s -> 정지 {b['distance']:.2f} m / {b['time']:.2f} s")
+    print(f"선회 RSM: R^2 = {rsm_r2:.4f}, RMSE = {rsm_rmse:.4f} deg/s")
+    print(f"선회 각가속도: {yaw_accel:.1f} deg/s^2, 키업 후 각감속도: {yaw_release_decel:.1f} deg/s^2 ({release_source})")
+    print(f"saved -> {out_path}")
+    return model
+
+
+if __name__ == "__main__":
+    fit_vehicle_model(out_path)
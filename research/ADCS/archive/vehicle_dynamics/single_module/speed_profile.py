@@ -0,0 +1,96 @@
+"""
+경로 속도 프로파일 생성기
+
+기존 경로 추종은 속도를 상수(W 0.3)로 두거나 코너 앞에서 멈췄다가 돌아서 직선에서도 빨리 달리지 못했고,
+코너에 빠르게 들어가면 선회 관성 때문에 경로를 벗어났음.
+
+이 모듈은 촘촘한 경로(x, z) 점마다 목표 속도를 정해 줌.
+1. 곡률 제한: 점마다 앞뒤 CURVATURE_SPAN 거리의 세 점으로 곡률을 구하고, VehicleModel.max_corner_speed로 제한 속도 계산
+2. 선회 지연: 선회 각속도가 올라가는 동안 달리는 거리만큼 코너 제한 속도를 앞당겨 적용
+3. forward pass: 가속도 제한 v_i^2 <= v_(i-1)^2 + 2 a ds
+4. backward pass: 감속도 제한 v_i^2 <= v_(i+1)^2 + 2 d ds (코너 / 종점 앞에서 미리 감속)
+제어용(경로 추종기 목표 속도)으로 쓸 때는 v_start=None으로 출발 속도 제한을 빼서, 정지 상태에서도 목표 속도가 0이 되지 않게 함.
+forward / backward pass는 v^2 = 2as + minimum.accumulate(...) 형태로 바꿔서 반복문 없이 배열 연산으로 계산함.
+
+사용 예)
+    model = VehicleModel.from_json()
+    s, curvature, target_speed = speed_profile(path_xz, model, v_start=None)
+    follower = PurePursuitFollower(WaypointPath(path_xz), speed_profile=target_speed)
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+CURVATURE_SPAN = 8.0            # 곡률 계산에 쓰는 앞뒤 점 사이 거리(m), 꺾인 웨이포인트를 pure pursuit이 도는 반경 정도
+DECEL_METHOD = "coast"          # 계획에 쓰는 감속 방법 (W 키업), "reverse"(S) / "stop"(STOP)도 가능
+
+
+##### 점별 누적 경로 길이 #####
+def arc_length(points):
+    seg = np.diff(points, axis=0)
+    return np.concatenate(([0.0], np.cumsum(np.hypot(seg[:, 0], seg[:, 1]))))
+
+
+##### 세 점(i-k, i, i+k) 외접원 곡률(1/m), 부호는 시계방향(+) #####
+def path_curvature(points, spacing, span=CURVATURE_SPAN):
+    points = np.asarray(points, dtype=np.float64)
+    n = len(points)
+    k = max(int(round(span / max(spacing, 1e-6))), 1)
+    idx = np.arange(n)
+    a = points[np.clip(idx - k, 0, n - 1)]
+    b = points
+    c = points[np.clip(idx + k, 0, n - 1)]
+    ab = b - a
+    bc = c - b
+    ac = c - a
+    cross = ab[:, 1] * bc[:, 0] - ab[:, 0] * bc[:, 1]          # x, z 평면에서 시계방향 회전이면 양수
+    denom = np.hypot(ab[:, 0], ab[:, 1]) * np.hypot(bc[:, 0], bc[:, 1]) * np.hypot(ac[:, 0], ac[:, 1])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        curvature = np.where(denom > 1e-9, 2.0 * cross / denom, 0.0)
+    return curvature
+
+
+##### 뒤쪽(진행 방향) window 점 안의 최소값: 코너 제한 속도를 window 만큼 앞당김 #####
+def forward_min(values, window):
+    if window <= 1:
+        return values
+    padded = np.concatenate((values, np.full(window - 1, values[-1])))
+    return sliding_window_view(padded, window).min(axis=1)
+
+
+def speed_profile(points, model, v_start=0.0, v_end=0.0, max_speed_weight=1.0, decel_method=DECEL_METHOD):
+    points = np.asarray(points, dtype=np.float64)
+    s = arc_length(points)
+    if len(points) < 2:
+        return s, np.zeros(len(points)), np.zeros(len(points))
+    spacing = s[-1] / (len(points) - 1)
+
+    curvature = path_curvature(points, spacing)
+    limit = np.minimum(model.max_corner_speed(curvature), model.max_speed * max_speed_weight)
+
+    # 선회 각속도가 다 올라갈 때까지 달리는 거리만큼 코너 제한을 먼저 적용
+    lead = model.max_speed * max_speed_weight * float(model.yaw_spin_up_time(model.max_yaw_rate(model.max_speed)))
+    limit = forward_min(limit, int(np.ceil(lead / max(spacing, 1e-6))) + 1)
+
+    u_limit = limit ** 2
+    if v_start is not None:
+        u_limit[0] = min(u_limit[0], v_start ** 2)
+    u_limit[-1] = min(u_limit[-1], v_end ** 2)
+
+    # forward pass (가속 제한): u_i = min_j<=i (u_limit_j + 2a (s_i - s_j))
+    a2 = 2.0 * model.accel
+    u_forward = a2 * s + np.minimum.accumulate(u_limit - a2 * s)
+
+    # backward pass (감속 제한): u_i = min_j>=i (u_limit_j + 2d (s_j - s_i))
+    d2 = 2.0 * model.decel[decel_method]
+    u_backward = -d2 * s + np.minimum.accumulate((u_limit + d2 * s)[::-1])[::-1]
+
+    speed = np.sqrt(np.maximum(np.minimum(u_forward, u_backward), 0.0))
+    return s, curvature, speed
+
+
+##### 프로파일대로 달렸을 때 예상 주행 시간(s) #####
+def profile_time(s, speed):
+    ds = np.diff(s)
+    mean_speed = 0.5 * (speed[1:] + speed[:-1])
+    with np.errstate(divide="ignore"):
+        return float(np.sum(np.where(mean_speed > 1e-6, ds / mean_speed, 0.0)))
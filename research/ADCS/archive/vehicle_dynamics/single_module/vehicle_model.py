@@ -0,0 +1,81 @@
+"""
+차체 운동 모델 (런타임)
+
+fit_vehicle_model.py가 저장한 계수 파일(source/vehicle_model.json)만 읽어서
+제어 / 경로 계획 코드에서 필요한 값을 배열 연산으로 계산함. pandas, sklearn 불필요.
+
+- omega(w_weight, d_weight): 선회 각속도 RSM (weight는 0~1), d_weight_for_rate: 그 역함수
+  (계산은 tank_cornering_ssurogate_w_d/cornering_surrogate.py의 CorneringSurrogate 사용)
+- max_yaw_rate(speed): 해당 속도(W weight)에서 D 1.0으로 낼 수 있는 최대 각속도
+- max_corner_speed(curvature): 곡률(1/m)을 따라 돌 수 있는 최대 속도
+- braking_distance(speed, method): 제동 방법별 정지 거리
+- overshoot_angle(rate): 선회 키업 후 관성으로 더 도는 각도
+"""
+import os
+import sys
+import json
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ADCS_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", ".."))
+MODEL_PATH = os.path.join(BASE_DIR, "..", "source", "vehicle_model.json")
+sys.path.append(os.path.join(ADCS_DIR, "tank_cornering_ssurogate_w_d", "single_module"))
+
+from cornering_surrogate import CorneringSurrogate
+
+SUPPORTED_VERSION = 1
+
+
+class VehicleModel:
+    def __init__(self, params):
+        if params.get("version") != SUPPORTED_VERSION:
+            raise ValueError(f"Unsupported vehicle model version: {params.get('version')}")
+        self.params = params
+        self.max_speed = float(params["max_speed"])
+        self.accel = float(params["accel"])
+        self.decel = {name: float(b["decel"]) for name, b in params["braking"].items()}
+        self.cornering = CorneringSurrogate(params["cornering_rsm"])
+        self.yaw_accel = float(params["yaw_accel"])
+        self.yaw_release_decel = float(params["yaw_release_decel"])
+
+    @classmethod
+    def from_json(cls, path=MODEL_PATH):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    ##### 선회 각속도(deg/s), w_weight / d_weight는 0~1 #####
+    def omega(self, w_weight, d_weight):
+        return self.cornering.omega(w_weight, d_weight)
+
+    ##### 속도(m/s)에서 각속도 rate(deg/s)를 내는 데 필요한 AD weight #####
+    def d_weight_for_rate(self, speed, rate):
+        return self.cornering.d_weight(np.clip(speed / self.max_speed, 0.0, 1.0), rate)
+
+    ##### 속도(m/s)에서 낼 수 있는 최대 각속도(deg/s), W weight = 속도 / 최고 속도로 가정 #####
+    def max_yaw_rate(self, speed):
+        w = np.clip(np.asarray(speed, dtype=np.float64) / self.max_speed, 0.0, 1.0)
+        return self.omega(w, 1.0)
+
+    ##### 곡률(1/m)을 따라 돌 수 있는 최대 속도(m/s): v * |k| <= max_yaw_rate(v) #####
+    # 최대 각속도가 속도에 따라 조금씩 변해서 고정점 반복 몇 번으로 계산
+    def max_corner_speed(self, curvature, iterations=3):
+        k = np.abs(np.asarray(curvature, dtype=np.float64))
+        speed = np.full(k.shape, self.max_speed)
+        with np.errstate(divide="ignore"):
+            for _ in range(iterations):
+                speed = np.minimum(np.radians(self.max_yaw_rate(speed)) / k, self.max_speed)
+        return speed
+
+    ##### 제동 거리(m): method는 "coast"(W 키업), "reverse"(S), "stop"(STOP) #####
+    def braking_distance(self, speed, method="coast"):
+        speed = np.asarray(speed, dtype=np.float64)
+        return speed * speed / (2.0 * self.decel[method])
+
+    ##### 선회 키업 후 추가 회전각(deg) #####
+    def overshoot_angle(self, rate):
+        rate = np.asarray(rate, dtype=np.float64)
+        return rate * rate / (2.0 * self.yaw_release_decel)
+
+    ##### 선회 각속도가 rate(deg/s)까지 올라가는 시간(s) #####
+    def yaw_spin_up_time(self, rate):
+        return np.abs(np.asarray(rate, dtype=np.float64)) / self.yaw_accel
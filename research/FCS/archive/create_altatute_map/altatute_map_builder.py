@@ -0,0 +1,170 @@
+"""
+주행 로그 -> 고도 래스터 통합 빌드 도구
+
+기존 1~3단계 가공 코드(01_, 02_, 03_altatute_map_step_*.py)를 하나로 합친 버전
+
+기존 방식은 300*300 격자와 pandas merge -> X별 groupby.apply 보간 -> pivot/stack -> merge 를 거쳐
+csv로 저장했고, 3단계에서는 900만 행짜리 csv를 만들었음.
+
+이 도구는
+- 주행 로그를 chunk 단위로 읽어서(스트리밍) np.bincount로 셀별 고도 합/개수를 누적 (여러 로그를 순서대로 추가 가능)
+- 빈 셀은 Z방향 -> X방향 2-pass 선형 보간을 배열 연산으로 한 번에 채움 (기존 2단계와 같은 규칙)
+- CELL_SIZE=0.1 로 3000*3000 래스터를 바로 빌드 (기존 3단계의 셀 복제 불필요)
+- 결과를 .npz 바이너리 래스터(height, count, occupancy, cell_size)로 저장
+- 누적 상태(합/개수)도 저장해 두었다가 새 주행 로그만 추가로 반영할 수 있음
+래스터는 raster[z, x] 형태 (FCS의 grid[y, x]와 같은 배치, topview y = 시뮬레이터 z)
+"""
+import os
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MAP_SIZE = 300                  # 맵 한 변 길이(m)
+CELL_SIZE = 1.0                 # 래스터 셀 한 변 길이(m), 0.1이면 3000*3000
+CHUNK_ROWS = 1_000_000           # 주행 로그를 한 번에 읽을 행 수
+LOG_COLUMNS = ["Player_Pos_X", "Player_Pos_Y", "Player_Pos_Z"]
+
+drive_log_dir = os.path.join(BASE_DIR, "original_drive_log")
+drive_log_names = ["00_forest_and_river_map_info_scan_log_fixed.csv"]
+state_path = os.path.join(BASE_DIR, "original_drive_log", "altitude_state_00_forest_and_river.npz")
+out_path = os.path.join(BASE_DIR, "original_drive_log", "altitude_raster_00_forest_and_river.npz")
+
+
+class AltitudeRasterBuilder:
+    def __init__(self, map_size=MAP_SIZE, cell_size=CELL_SIZE):
+        self.map_size = float(map_size)
+        self.cell_size = float(cell_size)
+        self.n = int(round(self.map_size / self.cell_size))                 # 한 변 셀 개수
+        self.height_sum = np.zeros(self.n * self.n, dtype=np.float64)       # 셀별 고도 합 (raster[z, x] 를 1차원으로 편 것)
+        self.count = np.zeros(self.n * self.n, dtype=np.int64)              # 셀별 샘플 개수
+        self.logs = []                                                      # 반영한 주행 로그 이름
+
+    ##### 이전에 저장한 누적 상태에 이어서 빌드 #####
+    @classmethod
+    def load_state(cls, path):
+        data = np.load(path, allow_pickle=False)
+        builder = cls(float(data["map_size"]), float(data["cell_size"]))
+        builder.height_sum = data["height_sum"].astype(np.float64)
+        builder.count = data["count"].astype(np.int64)
+        builder.logs = [str(name) for name in data["logs"]]
+        return builder
+
+    def save_state(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez(path, map_size=self.map_size, cell_size=self.cell_size,
+                 height_sum=self.height_sum, count=self.count, logs=np.array(self.logs, dtype=str))
+
+    ##### 좌표 배열을 셀에 누적 (chunk 1개) #####
+    def add_points(self, x, y, z):
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        z = np.asarray(z, dtype=np.float64)
+        ok = np.isfinite(x) & np.isfinite(y) & np.isfinite(z)
+        xi = np.floor(x[ok] / self.cell_size).astype(np.int64)               # 소수점 버림 (기존 1단계와 동일)
+        zi = np.floor(z[ok] / self.cell_size).astype(np.int64)
+        inside = (xi >= 0) & (xi < self.n) & (zi >= 0) & (zi < self.n)
+        flat = zi[inside] * self.n + xi[inside]
+        size = self.n * self.n
+        self.height_sum += np.bincount(flat, weights=y[ok][inside], minlength=size)
+        self.count += np.bincount(flat, minlength=size)
+        return int(inside.sum())
+
+    ##### 주행 로그 csv 1개를 chunk 단위로 읽어서 누적 #####
+    def add_log(self, csv_path, chunk_rows=CHUNK_ROWS):
+        name = os.path.basename(csv_path)
+        if name in self.logs:
+            print(f"[skip] 이미 반영된 주행 로그: {name}")
+            return 0
+        used = 0
+        for chunk in pd.read_csv(csv_path, usecols=LOG_COLUMNS, chunksize=chunk_rows):
+            chunk = chunk.apply(pd.to_numeric, errors="coerce")
+            used += self.add_points(chunk["Player_Pos_X"].to_numpy(),
+                                    chunk["Player_Pos_Y"].to_numpy(),
+                                    chunk["Player_Pos_Z"].to_numpy())
+        self.logs.append(name)
+        print(f"[add] {name}: {used} points")
+        return used
+
+    ##### 관측 셀 비율 #####
+    def coverage(self):
+        return float(np.count_nonzero(self.count)) / self.count.size
+
+    ##### 셀 평균 고도 (관측 없는 셀은 NaN) #####
+    def mean_height(self):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self.height_sum / self.count
+        return mean.reshape(self.n, self.n)
+
+    ##### 빈 셀 보간까지 끝낸 고도 래스터 #####
+    def build(self):
+        raster = self.mean_height()
+        raster = fill_along_axis(raster, axis=0)        # 1단계: 같은 X 내에서 Z방향 보간
+        raster = fill_along_axis(raster, axis=1)        # 2단계: 같은 Z 라인에서 X방향 보간
+        return raster
+
+    def save_raster(self, path):
+        raster = self.build()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez(path,
+                 height=raster.astype(np.float32),
+                 count=self.count.reshape(self.n, self.n).astype(np.uint32),
+                 occupancy=np.zeros((self.n, self.n), dtype=np.uint8),     # occupancy_status=0 (기존과 동일)
+                 cell_size=self.cell_size)
+        return raster
+
+
+##### 한 축 방향 선형 보간을 배열 전체에 한 번에 적용 #####
+# 양 끝의 빈 값은 가장 가까운 관측값으로 채움 (pandas interpolate limit_direction="both"와 동일)
+# 관측값이 하나도 없는 줄은 NaN으로 남겨서 다른 축 보간에서 채움
+def fill_along_axis(raster, axis):
+    a = np.moveaxis(np.asarray(raster, dtype=np.float64), axis, -1)
+    rows, n = a.shape
+    valid = np.isfinite(a)
+    idx = np.arange(n)
+
+    prev_idx = np.where(valid, idx, -1)
+    np.maximum.accumulate(prev_idx, axis=1, out=prev_idx)                  # 왼쪽에서 가장 가까운 관측 위치
+    next_idx = np.where(valid, idx, n)
+    next_idx = np.minimum.accumulate(next_idx[:, ::-1], axis=1)[:, ::-1]   # 오른쪽에서 가장 가까운 관측 위치
+
+    has_prev = prev_idx >= 0
+    has_next = next_idx < n
+    p = np.clip(prev_idx, 0, n - 1)
+    q = np.clip(next_idx, 0, n - 1)
+    r = np.arange(rows)[:, None]
+    vp = a[r, p]
+    vq = a[r, q]
+
+    span = np.where(q > p, q - p, 1)
+    t = (idx - p) / span
+    filled = np.where(has_prev & has_next, vp + (vq - vp) * t,
+                      np.where(has_prev, vp, vq))                          # 한쪽만 있으면 가장 가까운 값
+    out = np.where(valid, a, filled)
+    return np.moveaxis(out, -1, axis)
+
+
+def build_altitude_raster(log_paths, out_path, state_path=None, map_size=MAP_SIZE, cell_size=CELL_SIZE):
+    if state_path and os.path.exists(state_path):
+        builder = AltitudeRasterBuilder.load_state(state_path)
+        print(f"[state] 이전 누적 상태 로딩: {len(builder.logs)}개 로그")
+    else:
+        builder = AltitudeRasterBuilder(map_size, cell_size)
+
+    for path in log_paths:
+        builder.add_log(path)
+    if state_path:
+        builder.save_state(state_path)
+
+    raster = builder.save_raster(out_path)
+    print("[build] Altitude Raster Summary")
+    print(f" - raster_shape      : {raster.shape}")
+    print(f" - coverage          : {builder.coverage() * 100:.2f}% (관측된 셀 비율)")
+    print(f" - missing_after     : {int(np.isnan(raster).sum())}")
+    print(f" - saved -> {out_path}")
+    return raster
+
+
+if __name__ == "__main__":
+    log_paths = [os.path.join(drive_log_dir, name) for name in drive_log_names]
+    build_altitude_raster(log_paths, out_path, state_path)
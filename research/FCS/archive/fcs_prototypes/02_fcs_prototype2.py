@@ -13,6 +13,10 @@ from flask import Flask, request, jsonify
 import math
 import pandas as pd
 import numpy as np
+from terrain_sampler import TerrainSampler
+from engagement_scheduler import compute_firing_solutions, plan_engagement_order
+from lead_solver import TargetHistoryBank, reported_velocity, solve_lead
+from enemy_state_estimator import EnemyStateEstimator, lidar_points_xy, lidar_centroids
 
 ##### Flask 추가 #####
 app = Flask(__name__)
@@ -21,10 +25,13 @@ app = Flask(__name__)
 altitude_df = None              # csv 파일을 데이터프레임화 시킨 것을 저장할 전역 변수
 altitude_grid = None            # altitude_df를 numpy 2d grid화 시킨 것을 저장할 전역변수
 altitude_grid_shape = None      # (y크기, x크기) 형태로 그리드 크기 저장할 전역변수
+terrain = None                  # altitude_grid 위에서 보간/경사 계산을 하는 TerrainSampler 전역변수
+target_history = TargetHistoryBank()    # 표적별 최근 위치 링버퍼 (리드 계산용 속도 추정)
+enemy_state = EnemyStateEstimator()     # info / vision / lidar 측정을 융합하는 표적별 상태 추정기
 
 ##### 맵 종류에 맞는 Altatude Map csv 파일을 읽어와서 판다스 데이터프레임에 저장, 그리고 넘파이 2D그리드화(최초 1회) #####
 def check_maptype(maptype: int):
-    global altitude_df, altitude_grid, altitude_grid_shape
+    global altitude_df, altitude_grid, altitude_grid_shape, terrain
 
     if getattr(check_maptype, "_loaded_mt", None) == maptype and altitude_df is not None:
         return  # 이전과 같은 맵이라면, 맵 정보 재로딩을 하지 않음.
@@ -55,23 +62,19 @@ def check_maptype(maptype: int):
     grid[y_arr, x_arr] = z_arr              # 각 (y, x)에 고도값(z)들을 넣기
     altitude_grid = grid                    # 위 2차원 넘파이 배열을 전역변수화
     altitude_grid_shape = grid.shape        # 위 2차원 넘파이 배열의 크기의 전역변수화
+    terrain = TerrainSampler(grid)          # 보간/경사 계산용 샘플러 생성
     check_maptype._loaded_mt = maptype      # 로딩한 맵 타입을 저장, 다음 로딩에는 생략할 수 있게 
 
 
 ##### x와 y값을 입력받아 csv로 만든 넘파이 그리드를 참고해 z값(고도)을 반환하는 매서드 #####
+# 셀 사이 좌표는 bilinear 보간, 그리드 밖 좌표는 가장자리 고도로 clamp (0 반환 X)
 def altitude_calculator(x, y):
-    global altitude_grid, altitude_grid_shape
+    global terrain
 
-    if altitude_grid is None:
+    if terrain is None:
         return 0                    # 맵 고도값 그리드가 없을 경우, 0을 반환하는 예외처리
-    
-    xi = int(round(x))              # 매서드로 들어온 x값의 소숫점 단위 이하를 제거
-    yi = int(round(y))              # 매서드로 들어온 y값의 소숫점 단위 이하를 제거
-    max_y, max_x = altitude_grid_shape              # 그리드 배열의 크기 불러오기
-    if 0 <= yi < max_y and 0 <= xi < max_x:         # 매서드로 들어온 x, y값이 그리드 안에 해당할 경우,
-        return float(altitude_grid[yi, xi])         # 해당하는 고도값 반환
-    else:
-        return 0                    # 들어온 x, y값이 그리드 범위를 넘어가는 숫자일 경우 0을 반환하는 예외처리
+
+    return float(terrain.sample(x, y))
 
 ##### 고각 계산기 매서드 #####
 # 수평거리 x, 높이차 y, 포구속도 v0이 주어졌을때, 어떤 발사각 θ에서 명중하는지 찾는 함수
@@ -121,6 +124,20 @@ def fcs_function(payload: dict):
     my_body_y = float(payload.get("ally_turret_angle", {}).get("Y", 0))    # 내 차체(+포탑) 수직 기울기
     simulator_time = float(payload.get("time", 0))                     # IDMS 기준 시간
     my_speed = float(payload.get("ally_speed", 0))                     # 내 차체의 속도
+    enemy_speed = float(payload.get("ibsm_target_speed", 0))           # 적 차체의 속도
+    enemy_body_x = float(payload.get("ibsm_target_body_angle", {}).get("x", 0))    # 적 차체 수평 방위각
+
+    ### 리드 계산: 적 위치 기록으로 속도를 추정하고, 포탄 비행시간 동안 이동할 위치를 조준점으로 사용
+    target_id = payload.get("ibsm_target", {}).get("id", 0)
+    target_history.push(target_id, simulator_time, enemy_pos_x, enemy_pos_y)
+    enemy_vx, enemy_vy = target_history.velocity([target_id])
+    if np.isnan(enemy_vx[0]):       # 위치 기록이 2개 미만이면 /info의 속도, 방위각 사용
+        enemy_vx, enemy_vy = reported_velocity([enemy_speed], [enemy_body_x])
+    lead = solve_lead((my_pos_x, my_pos_y), [enemy_pos_x], [enemy_pos_y], enemy_vx, enemy_vy, terrain)
+    enemy_pos_x = float(lead["aim_x"][0])      # 이후 계산은 예측 조준점 기준
+    enemy_pos_y = float(lead["aim_y"][0])
+    print(f"리드 조준점: x={enemy_pos_x:.2f}, y={enemy_pos_y:.2f}, 리드각={float(lead['lead_azimuth'][0]):.2f}도")
+
     enemy_alt = altitude_calculator(enemy_pos_x, enemy_pos_y)   #위 읽어온 csv altatude map을 기반으로 현재 고도를 판단
     my_alt = altitude_calculator(my_pos_x, my_pos_y)  #위 읽어온 csv altatude map을 기반으로 현재 고도를 판단
     G = 9.81 # 중력가속도
@@ -279,6 +296,154 @@ def get_fcs():
     # 호출자(IBSM)에게 결과 반환
     return jsonify(result)
 
+##### 다중 표적 FCS 주요 로직 (표적 N개를 한 번의 벡터 연산으로 처리) #####
+def fcs_batch_function(payload: dict):
+    maptype = int(payload.get("Map_type", 0))                   # 맵 타입
+    check_maptype(maptype)
+    my_pos_x = float(payload.get("ally_body_pos", {}).get("x", 0))     # 내 x좌표 (topview 기준)
+    my_pos_y = float(payload.get("ally_body_pos", {}).get("y", 0))     # 내 y좌표 (topview 기준)
+    my_body_x = float(payload.get("ally_turret_angle", {}).get("X", 0))    # 내 포탑 수평 기울기
+    my_body_y = float(payload.get("ally_turret_angle", {}).get("Y", 0))    # 내 차체(+포탑) 수직 기울기
+    simulator_time = float(payload.get("time", 0))                     # IDMS 기준 시간
+    targets = payload.get("ibsm_targets", [])                          # [{"id", "x", "y", "speed", "body_x", "priority"}, ...]
+
+    if not targets:
+        return {"targets": [], "engagement_order": [], "total_cost": 0.0,
+                "QE_command": "", "QE_weight": 0, "RF_command": "", "RF_weight": 0,
+                "Fire_command": False, "Fire_target": None}
+
+    ids = [t.get("id", i) for i, t in enumerate(targets)]
+    targets_xy = np.array([[float(t.get("x", 0)), float(t.get("y", 0))] for t in targets])
+    priority = np.array([float(t.get("priority", 1.0)) for t in targets])
+
+    ### 표적별 리드 계산 (위치 기록 속도 우선, 기록이 부족하면 보고된 속도/방위각 사용)
+    target_history.push_many(ids, simulator_time, targets_xy[:, 0], targets_xy[:, 1])
+    vx, vy = target_history.velocity(ids)
+    rep_vx, rep_vy = reported_velocity([float(t.get("speed", 0)) for t in targets],
+                                       [float(t.get("body_x", 0)) for t in targets])
+    vx = np.where(np.isnan(vx), rep_vx, vx)
+    vy = np.where(np.isnan(vy), rep_vy, vy)
+    lead = solve_lead((my_pos_x, my_pos_y), targets_xy[:, 0], targets_xy[:, 1], vx, vy, terrain)
+    targets_xy = np.stack([lead["aim_x"], lead["aim_y"]], axis=1)
+
+    solutions = compute_firing_solutions((my_pos_x, my_pos_y), my_body_x, my_body_y, targets_xy, terrain)
+    order, total_cost = plan_engagement_order(solutions, my_body_x, my_body_y, weights=priority)
+
+    ### 표적별 사격 제원
+    target_results = []
+    for i in range(len(targets)):
+        elevation = solutions["elevation"][i]
+        target_results.append({
+            "id": ids[i],
+            "azimuth": float(solutions["azimuth"][i]),
+            "elevation": None if np.isnan(elevation) else float(elevation),
+            "time_of_flight": None if np.isnan(elevation) else float(solutions["time_of_flight"][i]),
+            "slew_time": float(solutions["slew_time"][i]),
+            "distance_3d": float(solutions["distance_3d"][i]),
+            "los": bool(solutions["los"][i]),
+            "can_fire": bool(solutions["can_fire"][i]),
+            "fire_target": [float(targets_xy[i, 0]), float(targets_xy[i, 1]), float(solutions["target_alt"][i])],
+        })
+
+    ### 교전 순서의 첫 번째 표적에 대해서만 포탑 명령 생성
+    qe_command, qe_weight, rf_command, rf_weight = "", 0, "", 0
+    fire_command, fire_target = False, None
+    if order:
+        first = order[0]
+        delta_yaw = float(solutions["d_yaw"][first])
+        delta_pitch = float(solutions["d_pitch"][first])
+        qe_command = "E" if delta_yaw > 0 else "Q"      # d_yaw는 -180 ~ 180, 시계방향이 +
+        rf_command = "R" if delta_pitch > 0 else "F"
+        qe_weight = angle_to_weight(delta_yaw, max_angle=60.0, dead_zone=1.0)
+        rf_weight = angle_to_weight(delta_pitch, max_angle=20.0, dead_zone=0.5)
+        fire_command = qe_weight == 0 and rf_weight == 0    # 조준이 끝난 경우에만 사격
+        fire_target = target_results[first]["fire_target"]
+
+    result = {
+        "targets": target_results,                          # 표적별 사격 제원, list형
+        "engagement_order": [ids[i] for i in order],        # 교전 순서(표적 id), list형
+        "total_cost": total_cost,                           # 우선순위 가중 완료시각 합(s)
+        "QE_command" : qe_command,
+        "QE_weight" : qe_weight,
+        "RF_command" : rf_command,
+        "RF_weight" : rf_weight,
+        "Fire_command" : fire_command,
+        "Fire_target" : fire_target,
+    }
+    return result
+
+
+##### IBSM이 다중 표적을 한 번에 보낼 때 호출할 엔드포인트 #####
+@app.post("/get_fcs_batch")
+def get_fcs_batch():
+    payload = request.get_json(force=True, silent=True) or {}
+    result = fcs_batch_function(payload)
+    print(result)
+    return jsonify(result)
+
+##### 적 측정 입력 엔드포인트 (소스마다 비동기로 호출) #####
+# payload: {"source": "info" / "vision" / "lidar", "time": t, "targets": [{("id"), "x", "y", ("speed", "body_x")}]}
+# source가 lidar이고 "lidar_points"(/info의 lidarPoints)가 있으면 이미 추적 중인 표적의 예측 위치 주변 점 중심을 측정으로 사용
+# vision / lidar 표적에 "id"(FCS 표적 id)가 없으면 예측 위치 gate로 기존 표적에 배정 (VDRS trackingId는 표적 id로 쓰지 않음)
+# 응답: {"updated": 반영된 측정 수, "ids": targets 순서대로 배정된 표적 id}
+@app.post("/enemy_measurement")
+def enemy_measurement():
+    payload = request.get_json(force=True, silent=True) or {}
+    source = payload.get("source", "vision")
+    targets = payload.get("targets", [])
+    ids = []
+    try:
+        t = float(payload.get("time", 0))
+        if source == "info":
+            ids = [tg.get("id", 0) for tg in targets]
+            updated = sum(enemy_state.update_info(target_id, t, (float(tg.get("x", 0)), float(tg.get("y", 0))),
+                                                  float(tg.get("speed", 0)), float(tg.get("body_x", 0)))
+                          for target_id, tg in zip(ids, targets))
+        elif source == "lidar" and "lidar_points" in payload and enemy_state.slots:
+            predicted = enemy_state.query(t)
+            centroids, _ = lidar_centroids(lidar_points_xy(payload["lidar_points"]),
+                                           np.column_stack([predicted["x"], predicted["y"]]))
+            found = np.isfinite(centroids[:, 0])
+            ids = [i for i, ok in zip(predicted["ids"], found) if ok]
+            updated = enemy_state.update_positions(ids, t, centroids[found], source="lidar")
+        elif targets:
+            positions = [[float(tg.get("x", 0)), float(tg.get("y", 0))] for tg in targets]
+            known = [i for i, tg in enumerate(targets) if "id" in tg]
+            unknown = [i for i, tg in enumerate(targets) if "id" not in tg]
+            ids = [None] * len(targets)
+            updated = 0
+            if known:
+                for i in known:
+                    ids[i] = targets[i]["id"]
+                updated += enemy_state.update_positions([ids[i] for i in known], t,
+                                                        [positions[i] for i in known], source=source)
+            if unknown:
+                assigned, count = enemy_state.associate_positions(t, [positions[i] for i in unknown], source=source)
+                for i, target_id in zip(unknown, assigned):
+                    ids[i] = target_id
+                updated += count
+        else:
+            updated = 0
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({"updated": int(updated), "ids": ids})
+
+##### 시각 time의 융합 적 상태 조회 엔드포인트 (payload: {"time": t, "ids": [...] (없으면 전체)}) #####
+@app.post("/enemy_state")
+def get_enemy_state():
+    payload = request.get_json(force=True, silent=True) or {}
+    try:
+        t = float(payload.get("time", 0))
+        enemy_state.prune(t)
+        state = enemy_state.query(t, payload.get("ids"))
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+    targets = [{"id": target_id, "x": float(state["x"][i]), "y": float(state["y"][i]),
+                "vx": float(state["vx"][i]), "vy": float(state["vy"][i]),
+                "pos_std": float(state["pos_std"][i]), "age": float(state["age"][i])}
+               for i, target_id in enumerate(state["ids"])]
+    return jsonify({"time": t, "targets": targets})
+
 ##### 메인 메서드 #####
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5000, debug=True)
\ No newline at end of file
@@ -0,0 +1,262 @@
+"""
+적 상태 추정기: /info, 영상 탐지, LiDAR 측정을 표적별 칼만 필터로 융합
+
+IBSM은 /info의 enemyPos / enemySpeed를, VDRS는 탐지 박스(localization으로 월드 좌표)를 따로 받고,
+/init의 saveLidarData로 LiDAR 점도 받을 수 있지만 이 값들을 합치는 곳이 없었음.
+lead_solver.TargetHistoryBank는 한 소스(위치 기록)의 회귀 속도만 추정하고, 시각이 어긋난 측정은 다룰 수 없었음.
+
+이 모듈의 EnemyStateEstimator는
+- 표적별 등속 모델 상태 [x, y, vx, vy] (topview, FCS 함수들과 같은 좌표)와 공분산을 (표적 수, 4) / (표적 수, 4, 4) 배열에 두고
+- 측정이 올 때마다 해당 표적 행만 마지막 측정 시각 -> 측정 시각으로 예측한 뒤 갱신 (표적 1개당 O(1), 여러 표적은 한 번의 배열 연산)
+- 소스별 측정 잡음: info(위치 + enemySpeed / enemyBodyX로 만든 속도), vision(위치), lidar(위치)
+- 마지막 측정보다 늦게 도착한 측정(MAX_LAG 이내)은 현재 속도 추정으로 위치를 옮기고 그만큼 잡음을 키워서 반영
+- query(t)로 아무 시각의 융합 위치 / 속도 / 위치 표준편차를 상태 변경 없이 계산
+을 함. 같은 시각의 측정 여러 개는 update 1번으로 넣는 것이 표적별로 따로 넣는 것보다 훨씬 빠름 (배열 연산 1번).
+시각은 모든 소스가 같은 시계(시뮬레이터 time)를 써야 함.
+LiDAR 점은 lidar_points_xy로 topview 배열로 바꾸고 lidar_centroids로 예측 위치 주변 점들의 중심을 측정으로 사용.
+영상 탐지의 trackingId(VDRS SORT)는 /info 표적 id와 맞지 않으므로 vision 측정은 associate_positions로
+측정 시각의 예측 위치 gate 안에 있는 표적에 1:1 배정하고, 어느 gate에도 안 들어가는 측정만 새 표적으로 만듦.
+
+사용 예)
+    estimator.update_info(0, data["time"], (pos["x"], pos["z"]), data["enemySpeed"], data["enemyBodyX"])
+    target_ids, _ = estimator.associate_positions(t, topview(localize(tracks, ...)), source="vision")
+    state = estimator.query(t_now)
+"""
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+from scipy.spatial import cKDTree
+
+from lead_solver import reported_velocity, MAX_TRACKS
+
+ACCEL_STD = 2.0                 # 등속 모델 가속도 잡음 표준편차(m/s²), 측정 전 추정값
+SOURCE_POS_STD = {              # 소스별 위치 측정 표준편차(m), 측정 전 추정값
+    "info": 0.5,
+    "vision": 3.0,
+    "lidar": 0.5,
+}
+INFO_VEL_STD = 1.0              # /info 속도(enemySpeed + enemyBodyX) 표준편차(m/s), 측정 전 추정값
+INIT_POS_STD = 100.0            # 첫 측정 전 위치 표준편차(m)
+INIT_VEL_STD = 10.0             # 첫 측정 전 속도 표준편차(m/s)
+MAX_LAG = 1.0                   # 마지막 측정보다 이만큼(s) 이상 늦게 온 측정은 버림
+TRACK_TIMEOUT = 5.0             # 이 시간(s) 동안 측정이 없는 표적은 prune에서 제거
+LIDAR_GATE = 5.0                # 예측 위치에서 이 거리(m) 안의 LiDAR 점만 그 표적 측정으로 사용
+LIDAR_MIN_POINTS = 3            # 표적 1개의 LiDAR 측정에 필요한 최소 점 수
+ASSOCIATION_GATE = 3.0          # 예측 위치와의 거리가 이 배수 x (예측 + 측정) 반경 표준편차 안이면 같은 표적 후보
+
+_H_POS = np.array([[1.0, 0, 0, 0], [0, 1.0, 0, 0]])
+_H_POS_VEL = np.eye(4)
+
+
+##### 시간 간격 dt (N,) -> 등속 모델 전이 행렬 F, 프로세스 잡음 Q (N, 4, 4) #####
+def transition(dt, accel_std=ACCEL_STD):
+    dt = np.asarray(dt, dtype=np.float64)
+    n = len(dt)
+    F = np.broadcast_to(np.eye(4), (n, 4, 4)).copy()
+    F[:, 0, 2] = dt
+    F[:, 1, 3] = dt
+    q = accel_std ** 2
+    dt2, dt3, dt4 = dt ** 2, dt ** 3 / 2.0, dt ** 4 / 4.0
+    Q = np.zeros((n, 4, 4))
+    Q[:, 0, 0] = Q[:, 1, 1] = q * dt4
+    Q[:, 0, 2] = Q[:, 2, 0] = Q[:, 1, 3] = Q[:, 3, 1] = q * dt3
+    Q[:, 2, 2] = Q[:, 3, 3] = q * dt2
+    return F, Q
+
+
+class EnemyStateEstimator:
+    def __init__(self, max_targets=MAX_TRACKS, accel_std=ACCEL_STD, source_pos_std=None, max_lag=MAX_LAG):
+        self.max_targets = max_targets
+        self.accel_std = accel_std
+        self.source_pos_std = dict(SOURCE_POS_STD if source_pos_std is None else source_pos_std)
+        self.max_lag = max_lag
+        self.slots = {}                                         # 표적 id -> 행 번호
+        self._free = list(range(max_targets - 1, -1, -1))       # 빈 행 (pop으로 O(1))
+        self.x = np.zeros((max_targets, 4))                     # [x, y, vx, vy]
+        self.P = np.zeros((max_targets, 4, 4))
+        self.t_last = np.zeros(max_targets)                     # 행별 마지막 측정 시각
+        self.updates = np.zeros(max_targets, dtype=np.intp)     # 행별 측정 횟수
+        self._spawned = 0                                       # associate_positions가 만든 표적 수 (새 id 번호)
+
+    ##### 표적 id 목록 -> 행 번호 배열. 검사(중복, 미등록, 빈 행 수)를 모두 통과한 뒤에만 새 행을 할당 #####
+    def _rows(self, target_ids, create):
+        if len(set(target_ids)) != len(target_ids):
+            raise ValueError("Duplicate target ids in one update")
+        new_ids = [target_id for target_id in target_ids if target_id not in self.slots]
+        if new_ids and not create:
+            raise ValueError(f"Unknown target id {new_ids[0]!r}")
+        if len(new_ids) > len(self._free):
+            raise ValueError(f"Too many tracked targets: {self.max_targets}")
+        for target_id in new_ids:
+            row = self._free.pop()
+            self.slots[target_id] = row
+            self.x[row] = 0.0
+            self.P[row] = np.diag([INIT_POS_STD ** 2, INIT_POS_STD ** 2, INIT_VEL_STD ** 2, INIT_VEL_STD ** 2])
+            self.t_last[row] = np.nan                           # update에서 첫 측정 시각으로 채움
+            self.updates[row] = 0
+        return np.array([self.slots[target_id] for target_id in target_ids], dtype=np.intp)
+
+    ##### 표적 여러 개에 같은 시각의 측정을 반영 (표적마다 측정 1개) #####
+    # positions: (N, 2) topview 위치, velocities: (N, 2) 또는 None, 반영된 측정 수 반환
+    def update(self, target_ids, t, positions, pos_std, velocities=None, vel_std=INFO_VEL_STD):
+        t = float(t)
+        target_ids = list(target_ids)
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        if len(positions) != len(target_ids):
+            raise ValueError(f"Got {len(positions)} positions for {len(target_ids)} targets")
+        if velocities is not None:
+            velocities = np.asarray(velocities, dtype=np.float64).reshape(-1, 2)
+            if len(velocities) != len(target_ids):
+                raise ValueError(f"Got {len(velocities)} velocities for {len(target_ids)} targets")
+        rows = self._rows(target_ids, create=True)              # 입력 검사가 끝난 뒤에 행 할당
+        first = np.isnan(self.t_last[rows])
+        self.t_last[rows[first]] = t
+        lag = self.t_last[rows] - t                             # > 0 이면 늦게 도착한 측정
+        keep = lag <= self.max_lag
+        rows, positions, lag = rows[keep], positions[keep], np.maximum(lag[keep], 0.0)
+        if velocities is not None:
+            velocities = velocities[keep]
+        if not len(rows):
+            return 0
+
+        # 예측: 마지막 측정 시각 -> 측정 시각 (늦은 측정은 예측 없이 현재 상태에 반영)
+        F, Q = transition(np.maximum(t - self.t_last[rows], 0.0), self.accel_std)
+        x = np.matmul(F, self.x[rows][:, :, None])[:, :, 0]
+        P = np.matmul(np.matmul(F, self.P[rows]), F.transpose(0, 2, 1)) + Q
+
+        # 늦은 측정: 지난 시간만큼 현재 속도로 위치를 옮기고, 속도 불확실성만큼 잡음 추가
+        positions = positions + x[:, 2:] * lag[:, None]
+        pos_var = pos_std ** 2 + (lag ** 2) * np.maximum(P[:, 2, 2], P[:, 3, 3])
+
+        if velocities is None:
+            H, z = _H_POS, positions
+            R = np.zeros((len(rows), 2, 2))
+            R[:, 0, 0] = R[:, 1, 1] = pos_var
+        else:
+            H, z = _H_POS_VEL, np.column_stack([positions, velocities])
+            R = np.zeros((len(rows), 4, 4))
+            R[:, 0, 0] = R[:, 1, 1] = pos_var
+            R[:, 2, 2] = R[:, 3, 3] = vel_std ** 2
+
+        # 갱신: K = P Hᵀ S⁻¹
+        PHt = np.matmul(P, H.T)
+        S = np.matmul(H, PHt) + R
+        K = np.linalg.solve(S, PHt.transpose(0, 2, 1)).transpose(0, 2, 1)
+        innovation = z - x @ H.T
+        x = x + np.matmul(K, innovation[:, :, None])[:, :, 0]
+        P = P - np.matmul(K, np.matmul(H, P))
+        P = (P + P.transpose(0, 2, 1)) / 2.0
+
+        self.x[rows] = x
+        self.P[rows] = P
+        self.t_last[rows] = np.maximum(self.t_last[rows], t)
+        self.updates[rows] += 1
+        return len(rows)
+
+    ##### /info 측정 1개: enemyPos의 topview (x, z) + enemySpeed(m/s) / enemyBodyX(deg)로 만든 속도 #####
+    def update_info(self, target_id, t, position, speed, body_yaw_deg):
+        vx, vy = reported_velocity([speed], [body_yaw_deg])
+        return self.update([target_id], t, [position], self.source_pos_std["info"],
+                           velocities=np.column_stack([vx, vy]))
+
+    ##### vision / lidar 위치 측정 여러 개 (같은 시각) #####
+    def update_positions(self, target_ids, t, positions, source="vision"):
+        if source not in self.source_pos_std:
+            raise ValueError(f"Unknown source {source!r}, expected one of {tuple(self.source_pos_std)}")
+        return self.update(target_ids, t, positions, self.source_pos_std[source])
+
+    ##### 표적 id를 모르는 위치 측정 여러 개 (같은 시각) -> 기존 표적에 배정 후 반영, (측정별 표적 id 목록, 반영된 측정 수) #####
+    # 측정 시각의 예측 위치와 거리가 gate 안인 (측정, 표적) 쌍 중에서 거리² 합이 최소인 1:1 배정을 고르고,
+    # 어느 표적에도 배정되지 않은 측정만 새 표적 "{source}-{번호}"로 만듦
+    def associate_positions(self, t, positions, source="vision", gate=ASSOCIATION_GATE):
+        if source not in self.source_pos_std:
+            raise ValueError(f"Unknown source {source!r}, expected one of {tuple(self.source_pos_std)}")
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        pos_std = self.source_pos_std[source]
+        target_ids = [None] * len(positions)
+        candidates = list(self.slots)
+        if candidates and len(positions):
+            predicted = self.query(t, candidates)
+            d2 = ((positions[:, None, 0] - predicted["x"][None, :]) ** 2
+                  + (positions[:, None, 1] - predicted["y"][None, :]) ** 2)
+            limit = gate ** 2 * (predicted["pos_std"] ** 2 + 2.0 * pos_std ** 2)    # 반경 분산: 예측 + 측정(2축)
+            inside = d2 <= limit[None, :]
+            # gate 밖 쌍은 gate 안 비용 합보다 큰 비용으로 두고 배정 후 버림 (gate 안 쌍 수를 먼저 최대로)
+            # 비용은 거리²만 써서 불확실성이 큰 새 표적이 가까운 기존 표적의 측정을 뺏지 않음
+            outside_cost = d2[inside].sum() + 1.0
+            rows, cols = linear_sum_assignment(np.where(inside, d2, outside_cost))
+            for i, j in zip(rows, cols):
+                if inside[i, j]:
+                    target_ids[i] = candidates[j]
+        for i, target_id in enumerate(target_ids):
+            if target_id is None:
+                target_ids[i] = self._new_target_id(source)
+        return target_ids, self.update(target_ids, t, positions, pos_std)
+
+    def _new_target_id(self, source):
+        target_id = f"{source}-{self._spawned}"
+        while target_id in self.slots:
+            self._spawned += 1
+            target_id = f"{source}-{self._spawned}"
+        self._spawned += 1
+        return target_id
+
+    ##### 시각 t의 융합 상태 (상태는 바꾸지 않음), target_ids가 None이면 전체 표적 #####
+    def query(self, t, target_ids=None):
+        ids = list(self.slots) if target_ids is None else list(target_ids)
+        rows = self._rows(ids, create=False)
+        dt = float(t) - self.t_last[rows]
+        x, P = self.x[rows], self.P[rows]
+        q = self.accel_std ** 2
+        adt = np.abs(dt)
+        # 위치 분산: Pxx + 2 dt Pxv + dt² Pvv + q dt⁴ / 4 (축별)
+        var_x = P[:, 0, 0] + 2 * dt * P[:, 0, 2] + dt ** 2 * P[:, 2, 2] + q * adt ** 4 / 4.0
+        var_y = P[:, 1, 1] + 2 * dt * P[:, 1, 3] + dt ** 2 * P[:, 3, 3] + q * adt ** 4 / 4.0
+        return {
+            "ids": ids,
+            "x": x[:, 0] + x[:, 2] * dt,
+            "y": x[:, 1] + x[:, 3] * dt,
+            "vx": x[:, 2].copy(),
+            "vy": x[:, 3].copy(),
+            "pos_std": np.sqrt(np.maximum(var_x + var_y, 0.0)),     # 위치 오차 반경 표준편차(m)
+            "age": dt,                                              # 마지막 측정 이후 시간(s)
+        }
+
+    def drop(self, target_id):
+        row = self.slots.pop(target_id, None)
+        if row is not None:
+            self._free.append(row)
+
+    ##### t 기준 timeout초 이상 측정이 없는 표적 제거, 제거한 id 목록 반환 #####
+    def prune(self, t, timeout=TRACK_TIMEOUT):
+        stale = [target_id for target_id, row in self.slots.items() if t - self.t_last[row] > timeout]
+        for target_id in stale:
+            self.drop(target_id)
+        return stale
+
+
+##### /info lidarPoints -> 감지된 점의 topview 좌표 (P, 2) [x, z] #####
+def lidar_points_xy(lidar_points):
+    xy = [(p["position"]["x"], p["position"]["z"]) for p in lidar_points if p.get("isDetected")]
+    return np.array(xy, dtype=np.float64).reshape(-1, 2)
+
+
+##### LiDAR 점 (P, 2) -> 예측 위치 (K, 2)별 gate 안 점들의 중심 (K, 2), 점 수 (K,) #####
+# 점은 가장 가까운 예측 위치 하나에만 배정, 점이 min_points 미만이면 중심은 NaN
+def lidar_centroids(points, predicted, gate=LIDAR_GATE, min_points=LIDAR_MIN_POINTS):
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    predicted = np.asarray(predicted, dtype=np.float64).reshape(-1, 2)
+    k = len(predicted)
+    centroids = np.full((k, 2), np.nan)
+    if not len(points) or not k:
+        return centroids, np.zeros(k, dtype=np.intp)
+
+    _, nearest = cKDTree(predicted).query(points, distance_upper_bound=gate)     # gate 밖이면 nearest == k
+    inside = nearest < k
+    owner = nearest[inside]
+    counts = np.bincount(owner, minlength=k)
+    sum_x = np.bincount(owner, weights=points[inside, 0], minlength=k)
+    sum_y = np.bincount(owner, weights=points[inside, 1], minlength=k)
+    enough = counts >= min_points
+    centroids[enough, 0] = sum_x[enough] / counts[enough]
+    centroids[enough, 1] = sum_y[enough] / counts[enough]
+    return centroids, counts
@@ -0,0 +1,221 @@
+"""
+FCS 다중 표적 교전 스케줄러
+
+/get_fcs는 ibsm_target 1개만 처리하기 때문에, VDRS나 탐지 스트림이 여러 객체(TANK1, CAR2 ...)를
+한 번에 보고하면 표적마다 HTTP 왕복이 필요했음.
+
+이 모듈은 N개의 표적에 대해
+- 사격 고각 / 방위각 / 비행시간(탄도 폐형해)
+- 포탑 선회 시간(yaw, pitch 동시 회전 기준)
+- 탄도 궤적의 지형 차폐(LOS) 여부
+를 한 번의 벡터 연산으로 계산하고, (선회 시간 + 탄착 시간)의 누적 합이 최소가 되는 교전 순서를 돌려줌.
+"""
+import os
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# 포탑 선회 속도는 스테빌라이저와 같은 룩업 테이블(fit_turret_slew_model.py 출력)에서 읽음
+SLEW_LUT_PATH = os.path.join(BASE_DIR, "..", "stabilizer", "slew_model_stabilizer", "source", "turret_slew_lut.csv")
+
+G = 9.81                        # 중력가속도
+MUZZLE_VELOCITY = 61.0          # 포탄의 초기속도(61m/s)
+TURRET_MIN_PITCH = -5.0         # 차체 대비 포신 최저 각도
+TURRET_MAX_PITCH = 10.0         # 차체 대비 포신 최대 각도
+MUZZLE_HEIGHT = 2.0             # 지면 대비 포구 높이(m)
+TARGET_HEIGHT = 1.5             # 지면 대비 조준점(표적 중심) 높이(m)
+LOS_SAMPLES = 32                # 탄도 궤적 차폐 검사 샘플 수
+EXACT_ORDER_MAX = 8             # 이 개수 이하의 표적은 전수(DP) 탐색, 초과 시 greedy
+
+
+##### 선회 속도 룩업 테이블의 weight 최대 행 -> (좌/우, 상/하) 최대 선회 속도(°/s) #####
+def load_turret_rates(lut_path=SLEW_LUT_PATH):
+    table = np.genfromtxt(lut_path, delimiter=",", skip_header=2)     # 첫 줄 메타 주석, 둘째 줄 헤더
+    return float(table[-1, 1]), float(table[-1, 2])
+
+
+TURRET_YAW_RATE, TURRET_PITCH_RATE = load_turret_rates()    # 포탑 좌/우, 포신 상/하 최대 선회 속도(°/s)
+
+
+##### 수평거리 x, 높이차 y 배열에 대한 저각(low angle) 발사 고각 폐형해 #####
+# tanθ = (v² - sqrt(v⁴ - g(g·x² + 2·y·v²))) / (g·x), 해가 없으면 NaN
+def solve_elevation(horizontal_distance, height_diff, v0=MUZZLE_VELOCITY, g=G):
+    x = np.maximum(np.asarray(horizontal_distance, dtype=np.float64), 1e-6)
+    y = np.asarray(height_diff, dtype=np.float64)
+    v2 = v0 * v0
+    disc = v2 * v2 - g * (g * x * x + 2.0 * y * v2)
+    with np.errstate(invalid="ignore"):
+        tan_theta = (v2 - np.sqrt(disc)) / (g * x)
+    elevation = np.degrees(np.arctan(tan_theta))
+    elevation = np.where(disc >= 0.0, elevation, np.nan)
+    time_of_flight = x / (v0 * np.cos(np.radians(elevation)))
+    return elevation, time_of_flight
+
+
+##### 12시 기준 시계방향 방위각(도) #####
+def azimuth_12oclock(dx, dy):
+    return (90.0 - np.degrees(np.arctan2(dy, dx))) % 360.0
+
+
+##### -180 ~ 180 범위의 각도 차이 #####
+def wrap_angle(diff):
+    return (np.asarray(diff) + 180.0) % 360.0 - 180.0
+
+
+##### 포탑 선회 시간: yaw / pitch 축이 동시에 돌기 때문에 두 축 중 오래 걸리는 쪽 #####
+def slew_time(d_yaw, d_pitch, yaw_rate=TURRET_YAW_RATE, pitch_rate=TURRET_PITCH_RATE):
+    d_pitch = np.nan_to_num(np.asarray(d_pitch, dtype=np.float64))
+    return np.maximum(np.abs(wrap_angle(d_yaw)) / yaw_rate, np.abs(d_pitch) / pitch_rate)
+
+
+##### 탄도 궤적이 지형 위로 지나가는지 (N, LOS_SAMPLES) 한 번에 검사 #####
+def trajectory_clear(terrain, my_x, my_y, my_z, target_x, target_y, elevation,
+                     v0=MUZZLE_VELOCITY, g=G, samples=LOS_SAMPLES):
+    target_x = np.asarray(target_x, dtype=np.float64)
+    target_y = np.asarray(target_y, dtype=np.float64)
+    if terrain is None:
+        return np.ones(target_x.shape, dtype=bool)
+
+    t = np.linspace(0.0, 1.0, samples + 2)[1:-1]                    # 양 끝점(포구, 표적) 제외
+    px = my_x + (target_x[:, None] - my_x) * t                        # (N, S)
+    py = my_y + (target_y[:, None] - my_y) * t
+    s = np.hypot(target_x - my_x, target_y - my_y)[:, None] * t        # 포구로부터의 수평거리
+    theta = np.radians(np.nan_to_num(elevation))[:, None]
+    shell_z = my_z + s * np.tan(theta) - (g * s * s) / (2.0 * v0 * v0 * np.cos(theta) ** 2)
+    ground_z = terrain.sample(px, py)
+    clear = np.all(shell_z > ground_z, axis=1)
+    return clear & ~np.isnan(elevation)
+
+
+##### N개 표적의 사격 제원을 벡터 연산으로 일괄 계산 #####
+def compute_firing_solutions(my_pos, turret_yaw, turret_pitch, targets_xy, terrain=None,
+                             body_pitch=0.0, max_range=None, v0=MUZZLE_VELOCITY, g=G,
+                             yaw_rate=TURRET_YAW_RATE, pitch_rate=TURRET_PITCH_RATE):
+    # my_pos: (x, y) topview 기준 내 위치
+    # targets_xy: (N, 2) 표적 topview 좌표 배열
+    targets_xy = np.asarray(targets_xy, dtype=np.float64).reshape(-1, 2)
+    tx, ty = targets_xy[:, 0], targets_xy[:, 1]
+    my_x, my_y = float(my_pos[0]), float(my_pos[1])
+
+    if terrain is not None:
+        my_alt = float(terrain.sample(my_x, my_y)) + MUZZLE_HEIGHT
+        target_alt = terrain.sample(tx, ty)
+    else:
+        my_alt = MUZZLE_HEIGHT
+        target_alt = np.zeros_like(tx)
+
+    dx = tx - my_x
+    dy = ty - my_y
+    horizontal_distance = np.hypot(dx, dy)
+    height_diff = target_alt + TARGET_HEIGHT - my_alt
+    distance_3d = np.sqrt(horizontal_distance ** 2 + height_diff ** 2)
+
+    elevation, time_of_flight = solve_elevation(horizontal_distance, height_diff, v0, g)
+    azimuth = azimuth_12oclock(dx, dy)
+
+    d_yaw = wrap_angle(azimuth - turret_yaw)
+    d_pitch = elevation - turret_pitch
+    slew = slew_time(d_yaw, d_pitch, yaw_rate, pitch_rate)
+
+    if max_range is None:
+        max_range = (v0 ** 2) * np.sin(2 * np.radians(TURRET_MAX_PITCH)) / g    # 발사각 10도 기준 사정거리
+    in_range = distance_3d <= max_range
+    with np.errstate(invalid="ignore"):
+        in_limits = (elevation >= body_pitch + TURRET_MIN_PITCH) & (elevation <= body_pitch + TURRET_MAX_PITCH)
+    los = trajectory_clear(terrain, my_x, my_y, my_alt, tx, ty, elevation, v0, g)
+
+    return {
+        "azimuth": azimuth,                     # 12시 기준 시계방향 방위각(도)
+        "elevation": elevation,                 # 발사 고각(도), 해가 없으면 NaN
+        "target_alt": target_alt,               # 표적 지형 고도
+        "distance_3d": distance_3d,             # 직선 거리
+        "time_of_flight": time_of_flight,       # 포탄 비행시간(s)
+        "d_yaw": d_yaw,                         # 현재 포탑 대비 방위각 차이(도)
+        "d_pitch": d_pitch,                     # 현재 포신 대비 고각 차이(도)
+        "slew_time": slew,                      # 현재 포탑 자세에서의 선회 시간(s)
+        "in_range": in_range,
+        "in_limits": in_limits,
+        "los": los,
+        "can_fire": in_range & in_limits & los,
+    }
+
+
+##### 교전 순서 계획 #####
+# 표적 i를 k번째로 쏘면 완료 시각 C_i = Σ(선회 시간 + 비행시간), 목표는 Σ w_i · C_i 최소화
+def plan_engagement_order(solutions, turret_yaw, turret_pitch, weights=None,
+                          yaw_rate=TURRET_YAW_RATE, pitch_rate=TURRET_PITCH_RATE):
+    candidates = np.flatnonzero(solutions["can_fire"])
+    n = len(candidates)
+    if n == 0:
+        return [], 0.0
+
+    az = solutions["azimuth"][candidates]
+    el = solutions["elevation"][candidates]
+    tof = solutions["time_of_flight"][candidates]
+    w = np.ones(n) if weights is None else np.asarray(weights, dtype=np.float64)[candidates]
+
+    # 시작 자세 -> 표적, 표적 -> 표적 선회 시간 행렬 (n, n)
+    start_cost = slew_time(az - turret_yaw, el - turret_pitch, yaw_rate, pitch_rate) + tof
+    step_cost = slew_time(az[None, :] - az[:, None], el[None, :] - el[:, None], yaw_rate, pitch_rate) + tof[None, :]
+
+    if n <= EXACT_ORDER_MAX:
+        order, cost = _order_exact(start_cost, step_cost, w)
+    else:
+        order, cost = _order_greedy(start_cost, step_cost, w)
+    return [int(candidates[i]) for i in order], float(cost)
+
+
+def _order_exact(start_cost, step_cost, w):
+    # 부분집합 DP: dp[mask, last] = mask를 모두 쏘고 last에서 끝났을 때의 최소 가중 완료시각 합
+    n = len(w)
+    full = (1 << n) - 1
+    mask_ids = np.arange(1 << n)
+    member = (mask_ids[:, None] >> np.arange(n)) & 1                  # (2^n, n)
+    remaining_w = w.sum() - member @ w                                # mask 밖에 남은 표적 가중치 합
+
+    dp = np.full((1 << n, n), np.inf)
+    parent = np.full((1 << n, n), -1, dtype=np.int64)
+    for i in range(n):
+        dp[1 << i, i] = start_cost[i] * w.sum()
+
+    for mask in range(1, full + 1):
+        row = dp[mask]
+        if not np.isfinite(row).any():
+            continue
+        # mask에서 다음 표적 j로 갈 때 비용은 아직 남은 모든 표적의 완료시각을 그만큼 늦춤
+        nxt = row[:, None] + step_cost * remaining_w[mask]            # (last, j)
+        for j in np.flatnonzero(member[mask] == 0):
+            new_mask = mask | (1 << j)
+            last = int(np.argmin(nxt[:, j]))
+            if nxt[last, j] < dp[new_mask, j]:
+                dp[new_mask, j] = nxt[last, j]
+                parent[new_mask, j] = last
+
+    last = int(np.argmin(dp[full]))
+    cost = dp[full, last]
+    order = []
+    mask = full
+    while last >= 0:
+        order.append(last)
+        prev = parent[mask, last]
+        mask ^= 1 << last
+        last = int(prev)
+    return order[::-1], cost
+
+
+def _order_greedy(start_cost, step_cost, w):
+    # 표적이 많으면 (가중치 대비 소요시간)이 가장 작은 표적을 매번 선택
+    n = len(w)
+    left = np.ones(n, dtype=bool)
+    cost_now = start_cost.copy()
+    elapsed, total = 0.0, 0.0
+    order = []
+    for _ in range(n):
+        score = np.where(left, cost_now / w, np.inf)
+        j = int(np.argmin(score))
+        elapsed += cost_now[j]
+        total += w[j] * elapsed
+        order.append(j)
+        left[j] = False
+        cost_now = step_cost[j]
+    return order, total
+
@@ -0,0 +1,130 @@
+"""
+FCS 이동 표적 리드(lead) 계산기
+
+FCS는 표적의 '현재' 위치를 조준하기 때문에, 움직이는 적 전차는 포탄 비행시간 동안 이동한 만큼 빗나감.
+
+이 모듈은
+- 표적별 고정 크기 링버퍼(TargetHistoryBank)에 (시간, x, y)를 쌓고
+  누적합(Σt, Σt², Σx, Σtx ...)을 갱신해서 구간 선형회귀 속도를 O(1)로 추정
+- 예측 위치 -> 발사 고각/비행시간 -> 예측 위치 ... 를 고정 횟수만큼 반복하는 리드 해법(solve_lead)
+을 제공함. 모든 계산은 표적 N개 배열 단위로 동작함.
+"""
+import numpy as np
+
+from engagement_scheduler import (solve_elevation, azimuth_12oclock, wrap_angle,
+                                  MUZZLE_VELOCITY, MUZZLE_HEIGHT, TARGET_HEIGHT, G)
+
+HISTORY_WINDOW = 10             # 표적별 위치 기록 개수 (info 주기 약 0.1초 -> 약 1초 구간)
+MAX_TRACKS = 64                 # 동시에 추적할 수 있는 최대 표적 수
+LEAD_ITERATIONS = 4             # 비행시간 <-> 예측위치 반복 횟수 (고정, 틱당 상수 시간)
+
+
+##### 표적별 고정 크기 링버퍼 + 선형회귀 누적합 #####
+class TargetHistoryBank:
+    def __init__(self, window=HISTORY_WINDOW, max_tracks=MAX_TRACKS):
+        self.window = window
+        self.max_tracks = max_tracks
+        self.slots = {}                                         # 표적 id -> 행 번호
+        self.t0 = np.zeros(max_tracks)                          # 표적별 기준 시각 (누적합 수치 안정용)
+        self.buf = np.zeros((max_tracks, window, 3))            # (행, 링버퍼, [t, x, y])
+        self.head = np.zeros(max_tracks, dtype=np.intp)         # 다음에 쓸 위치
+        self.count = np.zeros(max_tracks, dtype=np.intp)        # 채워진 개수
+        # 누적합: [Σt, Σt², Σx, Σy, Σtx, Σty]
+        self.sums = np.zeros((max_tracks, 6))
+
+    def _slot(self, target_id):
+        slot = self.slots.get(target_id)
+        if slot is None:
+            if len(self.slots) >= self.max_tracks:
+                raise ValueError(f"Too many tracked targets: {self.max_tracks}")
+            used = set(self.slots.values())
+            slot = next(i for i in range(self.max_tracks) if i not in used)
+            self.slots[target_id] = slot
+            self.head[slot] = 0
+            self.count[slot] = 0
+            self.sums[slot] = 0.0
+        return slot
+
+    ##### 표적 1개의 새 위치 기록, O(1) #####
+    def push(self, target_id, t, x, y):
+        slot = self._slot(target_id)
+        if self.count[slot] == 0:
+            self.t0[slot] = t
+        tr = t - self.t0[slot]
+
+        if self.count[slot] == self.window:                 # 버퍼가 가득 찼으면 가장 오래된 값을 누적합에서 제거
+            ot, ox, oy = self.buf[slot, self.head[slot]]
+            self.sums[slot] -= (ot, ot * ot, ox, oy, ot * ox, ot * oy)
+        else:
+            self.count[slot] += 1
+
+        self.buf[slot, self.head[slot]] = (tr, x, y)
+        self.sums[slot] += (tr, tr * tr, x, y, tr * x, tr * y)
+        self.head[slot] = (self.head[slot] + 1) % self.window
+
+    ##### 여러 표적을 한 번에 기록 #####
+    def push_many(self, target_ids, t, xs, ys):
+        for target_id, x, y in zip(target_ids, xs, ys):
+            self.push(target_id, t, float(x), float(y))
+
+    def drop(self, target_id):
+        self.slots.pop(target_id, None)
+
+    ##### 구간 선형회귀 속도 (vx, vy), 기록이 2개 미만이면 NaN #####
+    def velocity(self, target_ids):
+        rows = np.array([self.slots[i] for i in target_ids], dtype=np.intp)
+        n = self.count[rows].astype(np.float64)
+        st, stt, sx, sy, stx, sty = self.sums[rows].T
+        denom = n * stt - st * st
+        with np.errstate(invalid="ignore", divide="ignore"):
+            vx = np.where((n >= 2) & (denom > 1e-12), (n * stx - st * sx) / denom, np.nan)
+            vy = np.where((n >= 2) & (denom > 1e-12), (n * sty - st * sy) / denom, np.nan)
+        return vx, vy
+
+    ##### 가장 최근 기록 위치 #####
+    def latest(self, target_ids):
+        rows = np.array([self.slots[i] for i in target_ids], dtype=np.intp)
+        last = (self.head[rows] - 1) % self.window
+        pts = self.buf[rows, last]
+        return pts[:, 1], pts[:, 2]
+
+
+##### /info의 enemySpeed, enemyBodyX로부터 속도 벡터 계산 (기록이 부족할 때 사용) #####
+# enemySpeed: m/s 그대로 사용 (시뮬레이터 속도 단위는 m/s, vehicle_model.json의 max_speed 19.44 = 약 70km/h)
+# enemyBodyX: 12시 기준 시계방향 차체 방위각(도)
+def reported_velocity(speed, body_yaw_deg):
+    speed = np.asarray(speed, dtype=np.float64)
+    yaw = np.radians(np.asarray(body_yaw_deg, dtype=np.float64))
+    return speed * np.sin(yaw), speed * np.cos(yaw)
+
+
+##### 리드 해법: 비행시간 동안 이동한 예측 위치를 조준점으로 반복 계산 #####
+def solve_lead(my_pos, target_x, target_y, target_vx, target_vy, terrain=None,
+               iterations=LEAD_ITERATIONS, v0=MUZZLE_VELOCITY, g=G):
+    my_x, my_y = float(my_pos[0]), float(my_pos[1])
+    tx = np.asarray(target_x, dtype=np.float64)
+    ty = np.asarray(target_y, dtype=np.float64)
+    vx = np.nan_to_num(np.asarray(target_vx, dtype=np.float64))
+    vy = np.nan_to_num(np.asarray(target_vy, dtype=np.float64))
+    my_alt = (float(terrain.sample(my_x, my_y)) if terrain is not None else 0.0) + MUZZLE_HEIGHT
+
+    time_of_flight = np.zeros_like(tx)
+    for _ in range(iterations):
+        px = tx + vx * time_of_flight
+        py = ty + vy * time_of_flight
+        target_alt = terrain.sample(px, py) if terrain is not None else np.zeros_like(px)
+        elevation, new_tof = solve_elevation(np.hypot(px - my_x, py - my_y),
+                                             target_alt + TARGET_HEIGHT - my_alt, v0, g)
+        time_of_flight = np.nan_to_num(new_tof)         # 사정거리 밖이면 현재 위치 조준으로 되돌아감
+
+    px = tx + vx * time_of_flight
+    py = ty + vy * time_of_flight
+    azimuth = azimuth_12oclock(px - my_x, py - my_y)
+    return {
+        "aim_x": px,                                    # 예측 조준점 x
+        "aim_y": py,                                    # 예측 조준점 y
+        "azimuth": azimuth,
+        "elevation": elevation,                         # 발사 고각(도), 해가 없으면 NaN
+        "time_of_flight": time_of_flight,
+        "lead_azimuth": wrap_angle(azimuth - azimuth_12oclock(tx - my_x, ty - my_y)),   # 현재 위치 대비 리드각
+    }
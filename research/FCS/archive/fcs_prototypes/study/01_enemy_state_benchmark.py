@@ -0,0 +1,134 @@
+"""
+EnemyStateEstimator 업데이트 / 조회 비용과 융합 정확도
+
+시뮬레이터 없이 표적 N개가 일정 속도로 선회하는 궤적을 만들고, 세 소스의 측정을 서로 다른 주기 / 지연으로 흘려 넣음.
+- info   : 10Hz, 위치 잡음 0.5m + enemySpeed / enemyBodyX (지연 없음)
+- vision : 5Hz, 위치 잡음 3m, 0.15s 늦게 도착 (추론 + localization 지연), 표적 id 없이 associate_positions로 배정
+- lidar  : 10Hz, 예측 위치 주변 점 중심 (lidar_centroids), 점 잡음 0.3m
+표적 수별로 소스 호출 1번당 시간, 전체 표적 조회 시간, 20Hz 조회 시점의 위치 / 속도 오차(RMSE)를 출력함.
+비교용으로 vision만 넣은 추정기, 마지막 info 위치를 그대로 쓰는 경우의 오차도 같이 출력함.
+(vision만은 info 표적 없이 배정해서, 속도를 모르는 초반에 가까운 표적끼리 뒤바뀐 오차가 포함됨)
+vision 측정이 info 표적이 아닌 다른 표적에 배정된 비율(오배정)과 배정 실패로 새로 생긴 표적 수도 출력함.
+"""
+import os
+import sys
+import time
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, ".."))
+
+from enemy_state_estimator import EnemyStateEstimator, lidar_centroids
+
+TARGET_COUNTS = [10, 30, 60]
+DURATION = 10.0                 # 시뮬레이션 시간(s)
+QUERY_HZ = 20.0
+SOURCES = {                     # 주기(s), 위치 잡음(m), 도착 지연(s)
+    "info": (0.1, 0.5, 0.0),
+    "vision": (0.2, 3.0, 0.15),
+    "lidar": (0.1, 0.3, 0.0),
+}
+LIDAR_POINTS_PER_TARGET = 12
+
+
+##### 표적 궤적: 시각 t -> 위치 (N, 2), 속도 (N, 2) (일정 속력 + 일정 선회율) #####
+def make_trajectories(n, rng):
+    start = rng.uniform(0, 300, (n, 2))
+    speed = rng.uniform(2.0, 10.0, n)                   # m/s
+    heading = rng.uniform(0, 2 * np.pi, n)              # 12시 기준 시계방향
+    turn_rate = rng.uniform(-0.2, 0.2, n)               # rad/s
+
+    def state(t):
+        if np.ndim(t) == 0:
+            t = np.full(n, t)
+        yaw = heading + turn_rate * t
+        safe = np.where(np.abs(turn_rate) < 1e-9, 1e-9, turn_rate)
+        x = start[:, 0] + speed / safe * (np.cos(heading) - np.cos(yaw))
+        y = start[:, 1] + speed / safe * (np.sin(yaw) - np.sin(heading))
+        return np.column_stack([x, y]), np.column_stack([speed * np.sin(yaw), speed * np.cos(yaw)]), yaw
+    return state
+
+
+##### (도착 시각, 소스, 측정 시각) 이벤트 목록, 도착 시각 순 #####
+def make_events():
+    events = []
+    for source, (period, _, delay) in SOURCES.items():
+        for t in np.arange(period, DURATION, period):
+            events.append((t + delay, source, t))
+    for t in np.arange(0.0, DURATION, 1.0 / QUERY_HZ):
+        events.append((t + 1e-6, "query", t))
+    return sorted(events)
+
+
+def run(n, rng, sources):
+    state = make_trajectories(n, rng)
+    ids = [None] * n                                        # 실제 표적 번호 -> 추정기 표적 id (처음 배정된 id)
+    estimator = EnemyStateEstimator(max_targets=2 * max(n, 1))
+    last_info = None
+    cost = {name: [] for name in list(SOURCES) + ["query"]}
+    errors, vel_errors, hold_errors = [], [], []
+    misassigned = vision_count = 0
+
+    for arrival, source, t in make_events():
+        truth, velocity, yaw = state(t)
+        if source == "query":
+            if None in ids:
+                continue
+            start = time.perf_counter()
+            fused = estimator.query(arrival, ids)
+            cost["query"].append(time.perf_counter() - start)
+            truth_now, velocity_now, _ = state(arrival)
+            if min(estimator.updates[estimator.slots[i]] for i in ids) >= 3:
+                errors.append(np.hypot(fused["x"] - truth_now[:, 0], fused["y"] - truth_now[:, 1]))
+                vel_errors.append(np.hypot(fused["vx"] - velocity_now[:, 0], fused["vy"] - velocity_now[:, 1]))
+                if last_info is not None:
+                    hold_errors.append(np.linalg.norm(last_info - truth_now, axis=1))
+            continue
+        if source not in sources:
+            continue
+
+        pos_std = SOURCES[source][1]
+        start = time.perf_counter()
+        if source == "info":
+            measured = truth + rng.normal(0, pos_std, truth.shape)
+            last_info = measured
+            speed = np.hypot(velocity[:, 0], velocity[:, 1])  # /info enemySpeed와 같은 m/s
+            for i in range(n):                              # /info는 표적마다 따로 들어온다고 가정
+                ids[i] = i
+                estimator.update_info(i, t, measured[i], speed[i], np.degrees(yaw[i]))
+        elif source == "vision":
+            assigned, _ = estimator.associate_positions(t, truth + rng.normal(0, pos_std, truth.shape), source="vision")
+            for i, target_id in enumerate(assigned):
+                if ids[i] is None:
+                    ids[i] = target_id
+                misassigned += target_id != ids[i]
+            vision_count += n
+        else:
+            if None in ids:
+                continue
+            points = (np.repeat(truth, LIDAR_POINTS_PER_TARGET, axis=0)
+                      + rng.normal(0, pos_std, (n * LIDAR_POINTS_PER_TARGET, 2)))
+            predicted = estimator.query(t, ids)
+            centroids, _ = lidar_centroids(points, np.column_stack([predicted["x"], predicted["y"]]))
+            found = np.isfinite(centroids[:, 0])
+            estimator.update_positions([i for i, ok in zip(ids, found) if ok], t, centroids[found], source="lidar")
+        cost[source].append(time.perf_counter() - start)
+
+    rmse = float(np.sqrt(np.mean(np.concatenate(errors) ** 2))) if errors else float("nan")
+    vel_rmse = float(np.sqrt(np.mean(np.concatenate(vel_errors) ** 2))) if vel_errors else float("nan")
+    hold = float(np.sqrt(np.mean(np.concatenate(hold_errors) ** 2))) if hold_errors else float("nan")
+    mean_us = {name: np.mean(values) * 1e6 if values else float("nan") for name, values in cost.items()}
+    association = (misassigned / vision_count if vision_count else 0.0, len(estimator.slots) - n)
+    return mean_us, rmse, vel_rmse, hold, association
+
+
+if __name__ == "__main__":
+    print(f"{'표적 수':>6} | {'info 1개(us)':>12} | {'vision(us)':>10} | {'lidar(us)':>10} | {'조회(us)':>9} | "
+          f"{'융합 RMSE(m)':>12} | {'속도 RMSE(m/s)':>14} | {'vision만(m)':>11} | {'info 유지(m)':>12} | "
+          f"{'vision 오배정':>11} | {'추가 표적':>8}")
+    for n in TARGET_COUNTS:
+        mean_us, rmse, vel_rmse, hold, (wrong, extra) = run(n, np.random.default_rng(n), set(SOURCES))
+        _, vision_rmse, _, _, _ = run(n, np.random.default_rng(n), {"vision"})
+        print(f"{n:>6} | {mean_us['info'] / n:>12.1f} | {mean_us['vision']:>10.1f} | {mean_us['lidar']:>10.1f} | "
+              f"{mean_us['query']:>9.1f} | {rmse:>12.3f} | {vel_rmse:>14.3f} | {vision_rmse:>11.3f} | {hold:>12.3f} | "
+              f"{wrong:>11.2%} | {extra:>8}")
@@ -0,0 +1,124 @@
+"""
+FCS 지형 고도 샘플러
+
+altitude_calculator(x, y)는 가장 가까운 정수 셀로 반올림한 고도 1개만 돌려주고,
+그리드 밖 좌표에는 0을 반환해서 맵 가장자리 근처의 고저차 계산이 틀어지는 문제가 있었음.
+
+이 모듈은 로딩된 고도 래스터(grid[y, x]) 위에서
+- (x, y) 배열을 한 번에 받아 bilinear / bicubic 보간 (가장자리는 clamp)
+- 경사(gradient, slope)와 법선 벡터(normal)
+를 벡터화해서 계산함. FCS, TPP 코스트맵, ADCS 피치 보정에서 대량 질의용으로 사용.
+"""
+import numpy as np
+import pandas as pd
+
+
+class TerrainSampler:
+    def __init__(self, grid, cell_size=1.0):
+        # grid: (y크기, x크기) 형태의 고도 2차원 배열, grid[y, x] = z
+        # cell_size: 셀 1칸이 맵 좌표계에서 차지하는 길이(m)
+        self.grid = np.ascontiguousarray(grid, dtype=np.float64)
+        self.shape = self.grid.shape
+        self.cell_size = float(cell_size)
+
+        # 셀 단위 gradient를 미리 1회 계산해 둠 (가장자리는 한쪽 차분)
+        grad_y, grad_x = np.gradient(self.grid, self.cell_size)
+        self._grad_x = grad_x
+        self._grad_y = grad_y
+
+    ##### altitude map csv(x, y, z 컬럼)로부터 샘플러 생성 #####
+    @classmethod
+    def from_csv(cls, csv_path, cell_size=1.0):
+        df = pd.read_csv(csv_path)
+        x_arr = df["x"].to_numpy(dtype=int)
+        y_arr = df["y"].to_numpy(dtype=int)
+        z_arr = df["z"].to_numpy(dtype=float)
+        grid = np.zeros((y_arr.max() + 1, x_arr.max() + 1), dtype=float)
+        grid[y_arr, x_arr] = z_arr
+        return cls(grid, cell_size=cell_size)
+
+    ##### altatute_map_builder.py가 저장한 바이너리 래스터(.npz)로부터 샘플러 생성 #####
+    @classmethod
+    def from_raster(cls, npz_path):
+        data = np.load(npz_path, allow_pickle=False)
+        return cls(data["height"], cell_size=float(data["cell_size"]))
+
+    ##### 맵 좌표 -> 그리드 인덱스(실수) 변환, 가장자리 clamp #####
+    def _to_grid(self, x, y):
+        max_y, max_x = self.shape
+        gx = np.clip(np.asarray(x, dtype=np.float64) / self.cell_size, 0.0, max_x - 1)
+        gy = np.clip(np.asarray(y, dtype=np.float64) / self.cell_size, 0.0, max_y - 1)
+        return np.broadcast_arrays(gx, gy)
+
+    @staticmethod
+    def _bilinear(grid, gx, gy):
+        max_y, max_x = grid.shape
+        x0 = np.floor(gx).astype(np.intp)
+        y0 = np.floor(gy).astype(np.intp)
+        x1 = np.minimum(x0 + 1, max_x - 1)
+        y1 = np.minimum(y0 + 1, max_y - 1)
+        tx = gx - x0
+        ty = gy - y0
+
+        top = grid[y0, x0] * (1.0 - tx) + grid[y0, x1] * tx
+        bottom = grid[y1, x0] * (1.0 - tx) + grid[y1, x1] * tx
+        return top * (1.0 - ty) + bottom * ty
+
+    @staticmethod
+    def _cubic_weights(t):
+        # Catmull-Rom(Keys, a=-0.5) 4탭 가중치, t: 0~1
+        t2 = t * t
+        t3 = t2 * t
+        w0 = -0.5 * t3 + t2 - 0.5 * t
+        w1 = 1.5 * t3 - 2.5 * t2 + 1.0
+        w2 = -1.5 * t3 + 2.0 * t2 + 0.5 * t
+        w3 = 0.5 * t3 - 0.5 * t2
+        return (w0, w1, w2, w3)
+
+    @classmethod
+    def _bicubic(cls, grid, gx, gy):
+        max_y, max_x = grid.shape
+        x0 = np.floor(gx).astype(np.intp)
+        y0 = np.floor(gy).astype(np.intp)
+        wx = cls._cubic_weights(gx - x0)
+        wy = cls._cubic_weights(gy - y0)
+
+        out = np.zeros(gx.shape, dtype=np.float64)
+        for j in range(4):
+            yj = np.clip(y0 + j - 1, 0, max_y - 1)
+            row = np.zeros(gx.shape, dtype=np.float64)
+            for i in range(4):
+                xi = np.clip(x0 + i - 1, 0, max_x - 1)
+                row += wx[i] * grid[yj, xi]
+            out += wy[j] * row
+        return out
+
+    ##### (x, y) 배열의 고도값을 한 번에 계산 #####
+    def sample(self, x, y, method="bilinear"):
+        gx, gy = self._to_grid(x, y)
+        if method == "bilinear":
+            return self._bilinear(self.grid, gx, gy)
+        if method == "bicubic":
+            return self._bicubic(self.grid, gx, gy)
+        raise ValueError(f"Invalid interpolation method: {method}")
+
+    ##### (N, 2) 형태의 점 배열을 받아 고도 배열(N,) 반환 #####
+    def sample_points(self, points, method="bilinear"):
+        points = np.asarray(points, dtype=np.float64)
+        return self.sample(points[..., 0], points[..., 1], method=method)
+
+    ##### 경사 (dz/dx, dz/dy) #####
+    def gradient(self, x, y):
+        gx, gy = self._to_grid(x, y)
+        return self._bilinear(self._grad_x, gx, gy), self._bilinear(self._grad_y, gx, gy)
+
+    ##### 경사각(도 단위, 0 = 평지) #####
+    def slope(self, x, y):
+        dzdx, dzdy = self.gradient(x, y)
+        return np.degrees(np.arctan(np.hypot(dzdx, dzdy)))
+
+    ##### 지면 법선 단위벡터 (..., 3) = (nx, ny, nz), nz는 항상 양수 #####
+    def normal(self, x, y):
+        dzdx, dzdy = self.gradient(x, y)
+        n = np.stack([-dzdx, -dzdy, np.ones_like(dzdx)], axis=-1)
+        return n / np.linalg.norm(n, axis=-1, keepdims=True)
@@ -0,0 +1,65 @@
+"""
+포탑 선회 속도 모델 피팅 코드
+
+turret_velocity 측정 데이터(Player_Turret_X, Time)로부터
+- 360 -> 0 점프를 unwrap 한 포탑 각도
+- 실제로 회전 중인 구간의 틱별 각속도 (중앙값 = 최대 선회 속도)
+- 정지 -> 최대 속도 도달까지 걸린 시간(가속 지연)
+을 계산하고, weight(0~1) 별 선회 속도 룩업 테이블을 csv로 저장함.
+
+차체 회전(tank_cornering_w_d)에서 각속도가 weight에 거의 정비례(절편 약 0)했기 때문에,
+포탑도 최대 선회 속도 x weight 로 선형 모델링함. 포신 상/하(pitch) 속도는 측정 데이터가 없어 추정값을 사용.
+"""
+import os
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESEARCH_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", "..", "..", "..", ".."))
+input_xlsx_path = os.path.join(RESEARCH_DIR, "ADCS", "archive", "turret_velocity", "data", "turret_angular_velocity.xlsx")
+out_path = os.path.join(BASE_DIR, "..", "source", "turret_slew_lut.csv")
+
+PITCH_MAX_RATE = 10.0           # 포신 상/하 최대 속도(°/s), 측정 전 추정값
+WEIGHT_STEP = 0.05              # 룩업 테이블 weight 간격
+MOVING_THRESHOLD = 1.0          # 이 각속도(°/s) 이상이면 회전 중인 틱으로 판단
+
+
+def fit_turret_slew_model(input_xlsx_path, out_path):
+    df = pd.read_excel(input_xlsx_path)
+    time_sec = df["Time"].to_numpy(dtype=float)
+    angle_deg = df["Player_Turret_X"].to_numpy(dtype=float)
+
+    # 360도 => 0도 점프 문제 해결
+    angle_unwrapped = np.rad2deg(np.unwrap(np.deg2rad(angle_deg)))
+    rate = np.diff(angle_unwrapped) / np.diff(time_sec)
+
+    moving = np.abs(rate) >= MOVING_THRESHOLD
+    yaw_max_rate = float(np.median(np.abs(rate[moving])))          # 최대 선회 속도 (중앙값이라 튀는 틱에 강함)
+
+    # 회전 시작 틱부터 최대 속도의 90%에 처음 도달한 틱까지의 시간 = 가속 지연
+    first_moving = int(np.argmax(moving))
+    reached = np.flatnonzero(np.abs(rate[first_moving:]) >= 0.9 * yaw_max_rate)
+    spin_up_time = float(time_sec[first_moving + reached[0]] - time_sec[first_moving]) if len(reached) else 0.0
+    tick = float(np.median(np.diff(time_sec)))                        # info 호출 주기
+
+    weights = np.round(np.arange(0.0, 1.0 + WEIGHT_STEP / 2, WEIGHT_STEP), 4)
+    lut = pd.DataFrame({
+        "weight": weights,
+        "yaw_rate": weights * yaw_max_rate,         # °/s
+        "pitch_rate": weights * PITCH_MAX_RATE,     # °/s
+    })
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with open(out_path, "w", encoding="utf-8", newline="") as f:
+        f.write(f"# yaw_max_rate={yaw_max_rate:.5f},spin_up_time={spin_up_time:.3f},tick={tick:.3f}\n")
+        lut.to_csv(f, index=False, float_format="%.5f")
+
+    print("포탑 선회 모델 피팅 결과")
+    print(f"최대 선회 속도: {yaw_max_rate:.5f} °/s")
+    print(f"가속 지연: {spin_up_time:.3f} s")
+    print(f"info 호출 주기: {tick:.3f} s")
+    print(f"saved -> {out_path}")
+    return out_path
+
+
+if __name__ == "__main__":
+    fit_turret_slew_model(input_xlsx_path, out_path)
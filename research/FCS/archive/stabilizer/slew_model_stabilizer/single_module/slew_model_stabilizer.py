@@ -0,0 +1,173 @@
+"""
+포탑 선회 속도 모델 기반 스테빌라이저
+
+기존 stabilizer()는 오차가 크면 1.0, 작으면 0.15/0.1 의 bang-bang weight와 1도 dead band를 사용해서
+목표 근처에서 좌우로 흔들리며(oscillation) 틱을 낭비했음.
+
+이 모듈은 fit_turret_slew_model.py가 만든 룩업 테이블(weight -> 선회 속도)을 읽어서
+- 다음 몇 틱 안에 오차를 없앨 수 있는 '필요 선회 속도'를 구하고, 역으로 weight를 찾아 비례 명령
+- 현재 오차로부터 정렬 완료까지 걸릴 시간(time-to-align) 예측
+- 틱별 추적 오차 기록(TrackingMetrics)으로 수렴 속도 벤치마크
+를 제공함.
+
+사용 예)
+    slew_model = TurretSlewModel.from_csv(LUT_PATH)
+    metrics = TrackingMetrics()
+    QE_command, QE_weight, RF_command, RF_weight = stabilizer(
+        player_x, player_y, player_z, player_turret_x, player_turret_y,
+        enemy_x, enemy_y, enemy_z, slew_model, metrics=metrics, time=time)
+"""
+import os
+import math
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LUT_PATH = os.path.join(BASE_DIR, "..", "source", "turret_slew_lut.csv")
+
+DEAD_BAND = 0.1                 # 이 각도(°)보다 오차가 작으면 회전하지 않음
+TRACK_HORIZON_TICKS = 2.0       # 오차를 이 틱 수 안에 없애는 속도로 명령 (1틱 명령 지연 고려)
+SETTLE_TOLERANCE = 0.5          # 수렴 판정 오차(°)
+
+
+##### weight <-> 선회 속도 룩업 테이블 모델 #####
+class TurretSlewModel:
+    def __init__(self, weights, yaw_rates, pitch_rates, spin_up_time=0.0, tick=0.13):
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.yaw_rates = np.asarray(yaw_rates, dtype=np.float64)
+        self.pitch_rates = np.asarray(pitch_rates, dtype=np.float64)
+        self.yaw_max_rate = float(self.yaw_rates[-1])
+        self.pitch_max_rate = float(self.pitch_rates[-1])
+        self.spin_up_time = float(spin_up_time)
+        self.tick = float(tick)
+
+    ##### fit_turret_slew_model.py가 저장한 csv 로딩 (첫 줄 주석에 메타 정보) #####
+    @classmethod
+    def from_csv(cls, csv_path=LUT_PATH):
+        with open(csv_path, encoding="utf-8") as f:
+            header = f.readline().lstrip("#").strip()
+        meta = dict(item.split("=") for item in header.split(","))
+        table = np.genfromtxt(csv_path, delimiter=",", skip_header=2)
+        return cls(table[:, 0], table[:, 1], table[:, 2],
+                   spin_up_time=float(meta.get("spin_up_time", 0.0)),
+                   tick=float(meta.get("tick", 0.13)))
+
+    def yaw_rate(self, weight):
+        return np.interp(weight, self.weights, self.yaw_rates)
+
+    def pitch_rate(self, weight):
+        return np.interp(weight, self.weights, self.pitch_rates)
+
+    def yaw_weight_for_rate(self, rate):
+        return np.interp(rate, self.yaw_rates, self.weights)
+
+    def pitch_weight_for_rate(self, rate):
+        return np.interp(rate, self.pitch_rates, self.weights)
+
+    ##### 오차(°)를 없애기 위한 weight: TRACK_HORIZON_TICKS 틱 안에 도달하는 속도, 최대 1.0 #####
+    def yaw_weight(self, angle_error):
+        rate = abs(angle_error) / (TRACK_HORIZON_TICKS * self.tick)
+        return float(self.yaw_weight_for_rate(rate))
+
+    def pitch_weight(self, angle_error):
+        rate = abs(angle_error) / (TRACK_HORIZON_TICKS * self.tick)
+        return float(self.pitch_weight_for_rate(rate))
+
+    ##### 정렬 완료까지 예상 시간(s): yaw / pitch 축은 동시에 돌기 때문에 오래 걸리는 쪽 #####
+    def time_to_align(self, yaw_error, pitch_error):
+        yaw_time = abs(yaw_error) / self.yaw_max_rate if abs(yaw_error) > DEAD_BAND else 0.0
+        pitch_time = abs(pitch_error) / self.pitch_max_rate if abs(pitch_error) > DEAD_BAND else 0.0
+        t = max(yaw_time, pitch_time)
+        return t + self.spin_up_time if t > 0 else 0.0
+
+
+##### 틱별 추적 오차 기록 #####
+class TrackingMetrics:
+    def __init__(self, tolerance=SETTLE_TOLERANCE):
+        self.tolerance = tolerance
+        self.times = []
+        self.yaw_errors = []
+        self.pitch_errors = []
+        self.predicted_align = []
+
+    def record(self, time, yaw_error, pitch_error, predicted_align):
+        self.times.append(float(time))
+        self.yaw_errors.append(float(yaw_error))
+        self.pitch_errors.append(float(pitch_error))
+        self.predicted_align.append(float(predicted_align))
+
+    def reset(self):
+        self.__init__(self.tolerance)
+
+    ##### 수렴 속도 요약 #####
+    def summary(self):
+        if not self.times:
+            return {"ticks": 0}
+        t = np.asarray(self.times)
+        yaw = np.asarray(self.yaw_errors)
+        pitch = np.asarray(self.pitch_errors)
+        err = np.maximum(np.abs(yaw), np.abs(pitch))
+
+        # 마지막으로 허용오차를 벗어난 틱 다음부터 끝까지 허용오차 안 -> 그 시점이 수렴 시각
+        outside = np.flatnonzero(err > self.tolerance)
+        if len(outside) == 0:
+            settle_idx = 0
+        elif outside[-1] + 1 < len(err):
+            settle_idx = outside[-1] + 1
+        else:
+            settle_idx = None
+
+        # 허용오차 밖에서 yaw 오차 부호가 바뀐 횟수 = 목표를 지나친(overshoot) 횟수
+        big = np.abs(yaw) > self.tolerance
+        sign = np.sign(yaw[big])
+        overshoots = int(np.count_nonzero(sign[1:] != sign[:-1])) if len(sign) > 1 else 0
+
+        return {
+            "ticks": len(t),
+            "settle_ticks": None if settle_idx is None else int(settle_idx),
+            "settle_time": None if settle_idx is None else float(t[settle_idx] - t[0]),
+            "predicted_align_time": self.predicted_align[0],      # 첫 틱에서 예측한 정렬 시간
+            "yaw_rms": float(np.sqrt(np.mean(yaw ** 2))),
+            "pitch_rms": float(np.sqrt(np.mean(pitch ** 2))),
+            "max_error": float(err.max()),
+            "final_error": float(err[-1]),
+            "overshoots": overshoots,
+        }
+
+
+##### 목표 yaw / pitch 계산 (시뮬레이터 좌표계: x, z 평면 / y 높이) #####
+def target_angles(player_x, player_y, player_z, enemy_x, enemy_y, enemy_z):
+    dx = enemy_x - player_x  # X축 차이
+    dz = enemy_z - player_z  # Z축 차이
+    dy = enemy_y - player_y  # Y축 차이 (높이)
+
+    distance_xz = math.hypot(dx, dz)
+    target_pitch = math.degrees(math.atan2(dy, distance_xz))   # 포신 상하 각도
+    target_yaw = math.degrees(math.atan2(dx, dz)) % 360         # 터렛 좌/우 회전 각도
+    return target_yaw, target_pitch
+
+
+##### 스테빌라이저: 선회 모델로 비례 weight 계산 #####
+def stabilizer(player_x, player_y, player_z, player_turret_x, player_turret_y, enemy_x, enemy_y, enemy_z,
+               slew_model, metrics=None, time=0.0):
+    QE_command, QE_weight, RF_command, RF_weight = "", 0.0, "", 0.0
+
+    target_yaw, target_pitch = target_angles(player_x, player_y, player_z, enemy_x, enemy_y, enemy_z)
+
+    yaw_angle_diff = (target_yaw - player_turret_x + 540) % 360 - 180   # -180 ~ 180도 범위로 정규화
+    pitch_angle_diff = target_pitch - player_turret_y
+
+    # --- 터렛 Q/E 회전 명령 계산 ---
+    if abs(yaw_angle_diff) > DEAD_BAND:
+        QE_command = "Q" if yaw_angle_diff < 0 else "E"
+        QE_weight = slew_model.yaw_weight(yaw_angle_diff)
+
+    # --- 터렛 R/F 회전 명령 계산 ---
+    if abs(pitch_angle_diff) > DEAD_BAND:
+        RF_command = "R" if pitch_angle_diff > 0 else "F"
+        RF_weight = slew_model.pitch_weight(pitch_angle_diff)
+
+    if metrics is not None:
+        metrics.record(time, yaw_angle_diff, pitch_angle_diff,
+                       slew_model.time_to_align(yaw_angle_diff, pitch_angle_diff))
+
+    return QE_command, QE_weight, RF_command, RF_weight
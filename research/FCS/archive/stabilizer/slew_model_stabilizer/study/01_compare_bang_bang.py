@@ -0,0 +1,62 @@
+"""
+기존 bang-bang 스테빌라이저 vs 선회 모델 비례 스테빌라이저 수렴 속도 비교
+
+시뮬레이터 없이, 룩업 테이블의 선회 속도로 포탑 각도를 틱마다 적분하는 간단한 모델로 비교함.
+명령은 1틱 늦게 반영되는 것으로 가정 (info -> get_action 순서).
+"""
+import os
+import sys
+import math
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "single_module"))
+
+from slew_model_stabilizer import TurretSlewModel, TrackingMetrics, stabilizer, LUT_PATH
+
+INITIAL_YAW_ERRORS = [3.0, 15.0, 45.0, 120.0, 175.0]
+MAX_TICKS = 200
+
+
+##### basic_path_tracking.py의 기존 stabilizer (yaw 축만) #####
+def bang_bang_yaw(yaw_angle_diff):
+    if abs(yaw_angle_diff) > 1.0:
+        command = "Q" if yaw_angle_diff < 0 else "E"
+        weight = 1.0 if abs(yaw_angle_diff) >= 20.0 else 0.15
+        return command, weight
+    return "", 0.0
+
+
+def run(slew_model, initial_error, use_model):
+    turret_yaw = 0.0
+    target_yaw = initial_error % 360
+    metrics = TrackingMetrics()
+    command, weight = "", 0.0
+    for k in range(MAX_TICKS):
+        time = k * slew_model.tick
+        # 지난 틱의 명령으로 포탑 회전
+        direction = 1.0 if command == "E" else -1.0 if command == "Q" else 0.0
+        turret_yaw = (turret_yaw + direction * float(slew_model.yaw_rate(weight)) * slew_model.tick) % 360
+
+        # 적은 포탑 기준 (0, 0, 100)을 target_yaw 만큼 돌린 위치
+        enemy_x = 100 * math.sin(math.radians(target_yaw))
+        enemy_z = 100 * math.cos(math.radians(target_yaw))
+        if use_model:
+            command, weight, _, _ = stabilizer(0, 0, 0, turret_yaw, 0, enemy_x, 0, enemy_z,
+                                               slew_model, metrics=metrics, time=time)
+        else:
+            diff = (target_yaw - turret_yaw + 540) % 360 - 180
+            metrics.record(time, diff, 0.0, slew_model.time_to_align(diff, 0.0))
+            command, weight = bang_bang_yaw(diff)
+    return metrics.summary()
+
+
+if __name__ == "__main__":
+    slew_model = TurretSlewModel.from_csv(LUT_PATH)
+    print(f"{'초기오차':>8} | {'방식':<10} | {'수렴틱':>6} | {'수렴시간':>8} | {'예측정렬':>8} | {'overshoot':>9} | {'최종오차':>8}")
+    for initial_error in INITIAL_YAW_ERRORS:
+        for name, use_model in (("bang-bang", False), ("slew-LUT", True)):
+            s = run(slew_model, initial_error, use_model)
+            settle_ticks = "-" if s["settle_ticks"] is None else s["settle_ticks"]
+            settle_time = "-" if s["settle_time"] is None else f"{s['settle_time']:.2f}"
+            print(f"{initial_error:>8.1f} | {name:<10} | {settle_ticks:>6} | {settle_time:>8} | "
+                  f"{s['predicted_align_time']:>8.2f} | {s['overshoots']:>9} | {s['final_error']:>8.3f}")
@@ -18,69 +18,21 @@ credit by : oixxta
 
 추가로, 해당 매서드로 생성된 좌표들을 WaypointList에 넣고 확인해 볼 수 있는 예시코드도 함께 동봉됨.
 
-위의 class WaypointNode와 WaypointList는 techgyu가 제작한 웨이포인트 관리 단방향 Linked-list,
-generate_circle_nodes 매서드가 개발물.
+웨이포인트 관리는 techgyu가 제작한 단방향 Linked-list(WaypointNode, WaypointList)에서
+배열 기반 WaypointPath(TPP/archive/waypoint_path)로 교체됨, generate_circle_nodes 매서드가 개발물.
 import math 필요함.
 """
 
 
-# --- 연결 리스트 형태의 웨이포인트(목표) 관리 ---
-class WaypointNode:
-    def __init__(self, x, z, arrived=False):
-        self.x = float(x)
-        self.z = float(z)
-        self.arrived = bool(arrived)
-        self.next = None
-
-class WaypointList:
-    def __init__(self):
-        self.head = None
-        self.tail = None
-        self._len = 0
-
-    def append(self, x, z, arrived=False):
-        node = WaypointNode(x, z, arrived)
-        if not self.head:
-            self.head = self.tail = node
-        else:
-            self.tail.next = node
-            self.tail = node
-        self._len += 1
-        return node
-
-    def peek(self):
-        return self.head
-
-    def pop(self):
-        if not self.head:
-            return None
-        node = self.head
-        self.head = node.next
-        if not self.head:
-            self.tail = None
-        node.next = None
-        self._len -= 1
-        return node
-
-    def mark_head_arrived(self):
-        if self.head:
-            self.head.arrived = True
-            return True
-        return False
-
-    def is_empty(self):
-        return self.head is None
-
-    def to_list(self):
-        out = []
-        cur = self.head
-        while cur:
-            out.append({'x': cur.x, 'z': cur.z, 'arrived': cur.arrived})
-            cur = cur.next
-        return out
+# --- 웨이포인트(목표) 관리: 배열 기반 WaypointPath (TPP/archive/waypoint_path) ---
+import os
+import sys
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "..", "waypoint_path", "single_module"))
+from waypoint_path import WaypointPath
 
 # 전역 웨이포인트 리스트 인스턴스 (기본값: 빈 리스트)
-waypoints = WaypointList()
+waypoints = WaypointPath()
 
 # x, y, z 값을 입력받아 원형 노드 좌표를 생성하는 매서드.
 import math                         # 필수
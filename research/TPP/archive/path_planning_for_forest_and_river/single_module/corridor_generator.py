@@ -0,0 +1,144 @@
+"""
+포레스트 앤 리버 안전 통로(corridor) 생성기
+
+create_node_for_forest_and_river.py는 강 좌편 / 우편마다 z 구간별 최대 안전 x를 손으로 적은 zones 표와
+max_safe_x_for(z) 중첩 함수로 줄마다 찾아서, 강 모양이나 buffer_distance가 바뀌면 표를 다시 손으로 고쳐야 했음.
+
+이 모듈의 ClearanceField는
+- 맵 occupancy 래스터(fcs_prototypes/map_csvs의 occupancy_status, 1 = 강 / 금지구역)에서
+  scipy.ndimage.distance_transform_edt로 모든 셀의 '가장 가까운 장애물 / 맵 가장자리까지 거리(m)'를 맵당 1번 계산
+- 거리 >= buffer 인 안전 영역 중 시작점(seed)과 연결된 영역만 남기고 (ndimage.label)
+- 모든 z 줄의 안전 x 구간(시작점 쪽 첫 연속 구간)을 누적합 마스크로 한 번에 구해서
+  중심선(centerline) / 지그재그 커버리지 경로(coverage_waypoints)를 배열로 만들어 줌.
+
+셀 (ix, iz)는 맵 좌표 (ix * cell_size, iz * cell_size)로 봄. (TerrainSampler와 같은 규칙)
+
+사용 예)
+    field = ClearanceField.from_csv()
+    nodes = field.coverage_waypoints(buffer=5, z_move=5, seed=LEFT_BANK_SEED)
+"""
+import os
+import numpy as np
+import pandas as pd
+from scipy import ndimage
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESEARCH_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", "..", "..", ".."))
+MAP_CSV_PATH = os.path.join(RESEARCH_DIR, "FCS", "archive", "fcs_prototypes", "map_csvs",
+                            "00_forest_and_river_300x300.csv")
+
+LEFT_BANK_SEED = (5.0, 295.0)       # 강 좌편 주행 시작점 (x, z), create_node_for_forest_and_river.py와 동일
+RIGHT_BANK_SEED = (295.0, 295.0)    # 강 우편 주행 시작점 (x, z)
+
+
+class ClearanceField:
+    def __init__(self, occupancy, cell_size=1.0, border_is_obstacle=True):
+        # occupancy: (z크기, x크기) 배열, occupancy[iz, ix] != 0 이면 장애물
+        self.occupancy = np.asarray(occupancy) != 0
+        self.shape = self.occupancy.shape
+        self.cell_size = float(cell_size)
+
+        # 장애물 셀까지 유클리드 거리 (장애물이 없으면 무한대)
+        if self.occupancy.any():
+            distance = ndimage.distance_transform_edt(~self.occupancy) * self.cell_size
+        else:
+            distance = np.full(self.shape, np.inf)
+        if border_is_obstacle:                  # 맵 경계(0 ~ 크기 x cell_size)까지 거리도 같이 고려
+            iz, ix = np.indices(self.shape)
+            edge = np.minimum.reduce([ix, self.shape[1] - ix, iz, self.shape[0] - iz]) * self.cell_size
+            distance = np.minimum(distance, edge)
+        self.distance = distance
+
+    ##### 맵 csv(x, y, occupancy_status 컬럼, y가 맵 z좌표)로부터 생성 #####
+    @classmethod
+    def from_csv(cls, csv_path=MAP_CSV_PATH, cell_size=1.0, border_is_obstacle=True):
+        df = pd.read_csv(csv_path, usecols=["x", "y", "occupancy_status"])
+        x_arr = df["x"].to_numpy(dtype=int)
+        z_arr = df["y"].to_numpy(dtype=int)
+        grid = np.zeros((z_arr.max() + 1, x_arr.max() + 1), dtype=np.int8)
+        grid[z_arr, x_arr] = df["occupancy_status"].to_numpy(dtype=np.int8)
+        return cls(grid, cell_size=cell_size, border_is_obstacle=border_is_obstacle)
+
+    ##### 맵 좌표 -> 셀 인덱스 (가장 가까운 셀, 가장자리 clamp) #####
+    def _to_cell(self, x, z):
+        ix = np.clip(np.rint(np.asarray(x, dtype=np.float64) / self.cell_size), 0, self.shape[1] - 1).astype(np.intp)
+        iz = np.clip(np.rint(np.asarray(z, dtype=np.float64) / self.cell_size), 0, self.shape[0] - 1).astype(np.intp)
+        return ix, iz
+
+    ##### 좌표 배열의 장애물까지 거리(m) #####
+    def clearance(self, x, z):
+        ix, iz = self._to_cell(x, z)
+        return self.distance[iz, ix]
+
+    ##### 거리 >= buffer 인 안전 셀, seed를 주면 seed와 연결된 영역만 #####
+    def safe_mask(self, buffer, seed=None):
+        safe = self.distance >= buffer
+        if seed is None:
+            return safe
+        labels, _ = ndimage.label(safe)
+        ix, iz = self._to_cell(*seed)
+        label = labels[iz, ix]
+        if label == 0:
+            raise ValueError(f"Seed {seed} is closer than {buffer}m to an obstacle")
+        return labels == label
+
+    ##### 모든 z 줄의 안전 x 구간 [lo, hi] (m), 구간이 없는 줄은 NaN #####
+    # 줄마다 seed 쪽에서 처음 만나는 연속 구간만 사용 (강 건너편 / 고립된 구간 제외)
+    def row_intervals(self, buffer, seed=None):
+        mask = self.safe_mask(buffer, seed)
+        if seed is not None and seed[0] / self.cell_size > self.shape[1] / 2:
+            mask = mask[:, ::-1]                # seed가 오른쪽이면 오른쪽에서부터 첫 구간
+            flipped = True
+        else:
+            flipped = False
+
+        started = np.cumsum(mask, axis=1) > 0
+        broken = np.cumsum(started & ~mask, axis=1) > 0
+        run = mask & ~broken
+        has = run.any(axis=1)
+        first = run.argmax(axis=1)
+        last = run.shape[1] - 1 - run[:, ::-1].argmax(axis=1)
+        if flipped:
+            first, last = run.shape[1] - 1 - last, run.shape[1] - 1 - first
+
+        lo = np.where(has, first * self.cell_size, np.nan)
+        hi = np.where(has, last * self.cell_size, np.nan)
+        return lo, hi
+
+    ##### 통로 중심선 (N, 2) [x, z]: 줄마다 안전 구간의 가운데, z_step 간격, 위(z 큰 쪽)에서 아래로 #####
+    def centerline(self, buffer, seed=None, z_step=1.0):
+        lo, hi = self.row_intervals(buffer, seed)
+        rows = self._rows(z_step, lo)
+        return np.column_stack([(lo[rows] + hi[rows]) / 2.0, rows * self.cell_size])
+
+    ##### 지그재그 커버리지 경로 (N, 2) [x, z] #####
+    # 줄마다 seed 쪽 끝에서 반대쪽 끝까지 가로 주행 후 z_move만큼 세로 이동. 세로 이동은 두 줄 모두 안전한 x에서 함.
+    def coverage_waypoints(self, buffer, z_move, seed=LEFT_BANK_SEED):
+        lo, hi = self.row_intervals(buffer, seed)
+        rows = self._rows(z_move, lo, start_z=seed[1])
+        lo, hi = lo[rows], hi[rows]
+        z = rows * self.cell_size
+        n = len(rows)
+        if n == 0:
+            return np.zeros((0, 2))
+
+        from_seed_side = seed[0] / self.cell_size <= self.shape[1] / 2
+        near = lo if from_seed_side else hi                # seed 쪽 끝
+        far = hi if from_seed_side else lo                 # 반대쪽 끝
+        inner_far = np.minimum if from_seed_side else np.maximum     # 두 줄 모두 안전한 쪽으로
+        inner_near = np.maximum if from_seed_side else np.minimum
+        # 짝수 줄: near -> far, 홀수 줄: far -> near. 줄 끝의 세로 이동 x는 다음 줄과 공유되는 끝점
+        turn = np.where(np.arange(n) % 2 == 0, np.r_[inner_far(far[:-1], far[1:]), far[-1]],
+                        np.r_[inner_near(near[:-1], near[1:]), near[-1]])
+        enter = np.r_[near[0], turn[:-1]]                   # 직전 줄의 끝 x에서 세로로 내려와 진입
+
+        points = np.empty((2 * n, 2))
+        points[0::2] = np.column_stack([enter, z])
+        points[1::2] = np.column_stack([turn, z])
+        return points
+
+    ##### 위(z 큰 쪽)부터 step 간격의 줄 인덱스 중 안전 구간이 있는 줄 #####
+    def _rows(self, step, lo, start_z=None):
+        top = self.shape[0] - 1 if start_z is None else int(round(start_z / self.cell_size))
+        rows = np.arange(top, -1, -max(int(round(step / self.cell_size)), 1))
+        return rows[~np.isnan(lo[rows])]
@@ -11,8 +11,12 @@ credit by : oixxta
 """
 
 from flask import Flask, request, jsonify
+import os
+import sys
 import math
 
+from corridor_generator import ClearanceField, LEFT_BANK_SEED, RIGHT_BANK_SEED
+
 ################################################################################
 #  이 곳에서 강 좌편 주행과 우편 주행을 결정하시오. True : 좌편 주행, False : 우편 주행
 
@@ -34,141 +38,17 @@ global_fire_command = False
 
 # -------------------------------------------------------------------
 
-# info | Waypoint : Linked List
-class WaypointNode:
-    def __init__(self, x, z):
-        self.x = float(x) # pos x
-        self.z = float(z) # pos y 
-        self.next = None # next node
-
-class WaypointList:
-    def __init__(self):
-        self.head = None # head node (first waypoint)
-        self.tail = None # tail node (last waypoint)
-        self._len = 0 # length (number of waypoints)
-
-    def append(self, x, z):
-        # Add a new waypoint to the end of the list
-        node = WaypointNode(x, z)
-        if not self.head:
-            self.head = self.tail = node # If list is empty, set head and tail
-        else:
-            self.tail.next = node # Link new node to the end
-            self.tail = node      # Update tail to new node
-        self._len += 1
-        return node
-    
-    def peek(self):
-        # Return the first waypoint (head) without removing it
-        return self.head
-
-    def pop(self):
-        # Remove and return the first waypoint (head)
-        if not self.head:
-            return None
-        node = self.head
-        self.head = node.next
-        if not self.head:
-            self.tail = None # If list is now empty, reset tail
-        node.next = None
-        self._len -= 1
-        return node
-
-    def is_empty(self):
-        # Check if the waypoint list is empty
-        return self.head is None
-
-    def to_list(self):
-        # Convert the linked list of waypoints to a Python list of dicts
-        out = []
-        cur = self.head
-        while cur:
-            out.append({'x': cur.x, 'z': cur.z})
-            cur = cur.next
-        return out
+# info | Waypoint : 배열 기반 WaypointPath (TPP/archive/waypoint_path)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "waypoint_path", "single_module"))
+from waypoint_path import WaypointPath
 
 # --------------------------------------------------------------------
 
 # Path Planning
-waypoints = WaypointList()
-
-def create_nodes_for_leftside(z, z_move, buffer_distance, waypoints):
-    # 1) z 상한 (버퍼만큼 아래 여유 두기)
-    z_limit = 300 - buffer_distance
-
-    # 2) z-구간별 최대 안전 x 정의(필요시 값만 바꾸면 됨)
-    zones = [
-        (30, 145),
-        (120, 175),
-        (300, 205),
-    ]
-
-    def max_safe_x_for(z):
-        # z가 속한 첫 구간의 x를 반환
-        for z_top, mx in zones:
-            if z < z_top:
-                return mx
-        return zones[-1][1]  # 안전망
-
-    # 3) 줄 개수 미리 산출 (마지막 줄 포함, 세로 이동 노드는 마지막에 추가하지 않음)
-    n_lines = int(math.floor((z_limit - z) / z_move)) + 1
-
-    for i in range(n_lines):
-        cz = z + i * z_move
-        mx = max_safe_x_for(cz)
-
-        if i % 2 == 0:
-            sx, ex = buffer_distance, mx
-        else:
-            sx, ex = mx, buffer_distance
-
-        # 가로 주행
-        waypoints.append(sx, abs(cz - 300))     # z좌표가 좌 상단이 0이 아니라 300이기 때문에 재 계산 후 웨이포인트에 추가
-        waypoints.append(ex, abs(cz - 300))     # z좌표가 좌 상단이 0이 아니라 300이기 때문에 재 계산 후 웨이포인트에 추가
-
-        # 다음 줄로 내려가는 세로 이동 (마지막 줄은 생략)
-        if i < n_lines - 1:
-            waypoints.append(ex, abs((cz + z_move) - 300))      # z좌표가 좌 상단이 0이 아니라 300이기 때문에 재 계산 후 웨이포인트에 추가
-
-    return waypoints
-
-def create_nodes_for_rightside(z, z_move, buffer_distance, waypoints):
-    zones = [
-        (270, 210),
-        (240, 225),
-        (210, 245),
-        (120, 270),
-        (0,   285),
-    ]
-
-    def max_safe_x_for(zpos):
-        for thr, lx in zones:
-            if zpos > thr + buffer_distance:
-                return lx + buffer_distance
-        # 마지막 구간(>0+buffer)과 동일
-        return zones[-1][1] + buffer_distance
-
-    right_x = 300 - buffer_distance
-    z_pos = z
-    waypoints.append(right_x, z_pos)
-
-    while z_pos > buffer_distance:
-        left_x = max_safe_x_for(z_pos)
-
-        waypoints.append(left_x, z_pos)
-        z_pos -= z_move
-        waypoints.append(left_x, z_pos)
-        waypoints.append(right_x, z_pos)
-        z_pos -= z_move
-        if z_pos > buffer_distance:
-            waypoints.append(right_x, z_pos)
-
-    return waypoints
-
-if drive_left_side == True:
-    create_nodes_for_leftside(5, z_move=5, buffer_distance=5, waypoints=waypoints)
-else:
-    create_nodes_for_rightside(295, z_move = 5, buffer_distance=5, waypoints=waypoints)
+# 강(occupancy_status = 1)까지 거리 필드로 buffer_distance 이상 떨어진 지그재그 경로 생성 (corridor_generator.py)
+clearance_field = ClearanceField.from_csv()
+bank_seed = LEFT_BANK_SEED if drive_left_side == True else RIGHT_BANK_SEED
+waypoints = WaypointPath(clearance_field.coverage_waypoints(buffer=5, z_move=5, seed=bank_seed))
 
 
 print(waypoints.to_list())      # 웨이포인트 정상 주입 확인용
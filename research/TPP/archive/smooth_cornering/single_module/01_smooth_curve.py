@@ -1,8 +1,6 @@
 from flask import Flask, request, jsonify
 import os
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
-import torch
-from ultralytics import YOLO
 import csv
 from datetime import datetime
 import math
@@ -46,64 +44,14 @@ first_call_get_action = True  # get_action 최초 실행 판별용 플래그
 
 # -------------------------------------------------------------
 
-# --- 연결 리스트 형태의 웨이포인트(목표) 관리 ---
-class WaypointNode:
-    def __init__(self, x, z, arrived=False, type="static"):
-        self.x = float(x)
-        self.z = float(z)
-        self.arrived = bool(arrived)
-        self.type = type  # "static", "start", "dynamic", "out"
-        self.next = None
-
-class WaypointList:
-    def __init__(self):
-        self.head = None
-        self.tail = None
-        self._len = 0
-
-    def append(self, x, z, arrived=False, type="static"):
-        node = WaypointNode(x, z, arrived, type)
-        if not self.head:
-            self.head = self.tail = node
-        else:
-            self.tail.next = node
-            self.tail = node
-        self._len += 1
-        return node
-
-    def peek(self):
-        return self.head
-
-    def pop(self):
-        if not self.head:
-            return None
-        node = self.head
-        self.head = node.next
-        if not self.head:
-            self.tail = None
-        node.next = None
-        self._len -= 1
-        return node
-
-    def mark_head_arrived(self):
-        if self.head:
-            self.head.arrived = True
-            return True
-        return False
-
-    def is_empty(self):
-        return self.head is None
-
-    def to_list(self):
-        out = []
-        cur = self.head
-        while cur:
-            out.append({'x': cur.x, 'z': cur.z, 'arrived': cur.arrived, 'type': cur.type})
-            cur = cur.next
-        return out
+# --- 웨이포인트(목표) 관리: 배열 기반 WaypointPath (TPP/archive/waypoint_path) ---
+import sys
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "..", "waypoint_path", "single_module"))
+from waypoint_path import WaypointPath  # 점별 type("static", "start", "dynamic", "out") / arrived 포함
 
 # 전역 웨이포인트 리스트 인스턴스 (기본값: 빈 리스트)
-waypoints = WaypointList()
+waypoints = WaypointPath()
 # 웨이포인트 샘플
 waypoints.append(30, 30, type="static")
 waypoints.append(90, 90, type="static")
@@ -117,7 +65,6 @@ waypoints.append(270, 270, type="static")
 
 # --- main 코드 부분 ---
 app = Flask(__name__)
-model = YOLO('yolov8n.pt')
 
 combined_commands = [
     {
@@ -156,7 +103,7 @@ def get_corner_point(p_from, p_to, offset):
     return (p_from[0] + dx * ratio, p_from[1] + dz * ratio)
 
 wps = waypoints.to_list()
-smooth_path_nodes = []
+smooth_path_nodes = WaypointPath()
 
 corner_offset = 30  # 코너 진입/아웃 거리 (m)
 
@@ -170,20 +117,20 @@ for i in range(1, len(wps)-1):
     out_pt = get_corner_point(p_cur, p_next, corner_offset)
 
     # 직선: p_prev → in_pt
-    smooth_path_nodes.append(WaypointNode(p_prev[0], p_prev[1], type="static"))
-    smooth_path_nodes.append(WaypointNode(in_pt[0], in_pt[1], type="start"))
+    smooth_path_nodes.append(p_prev[0], p_prev[1], type="static")
+    smooth_path_nodes.append(in_pt[0], in_pt[1], type="start")
 
     # 곡선: in_pt → out_pt (Catmull-Rom)
     segment = catmull_rom_spline(p_prev, in_pt, out_pt, p_next, n_points=20)
     for pt in segment:
-        smooth_path_nodes.append(WaypointNode(pt[0], pt[1], type="dynamic"))
+        smooth_path_nodes.append(pt[0], pt[1], type="dynamic")
 
     # 직선: out_pt → p_next
-    smooth_path_nodes.append(WaypointNode(out_pt[0], out_pt[1], type="out"))
-    smooth_path_nodes.append(WaypointNode(p_next[0], p_next[1], type="static"))
+    smooth_path_nodes.append(out_pt[0], out_pt[1], type="out")
+    smooth_path_nodes.append(p_next[0], p_next[1], type="static")
 
-x_smooth = [pt.x for pt in smooth_path_nodes]
-z_smooth = [pt.z for pt in smooth_path_nodes]
+x_smooth, z_smooth = smooth_path_nodes.planar().T
+smooth_nodes = smooth_path_nodes.to_list()     # 시각화 / CSV 저장용 dict 리스트
 
 # 스무스 처리된 노드 경로 시각화 (matplotlib)
 plt.figure(figsize=(6, 6))
@@ -201,8 +148,8 @@ color_map = {
     "out": "mo"        # 보라 점
 }
 
-for node in smooth_path_nodes:
-    plt.plot(node.x, node.z, color_map.get(node.type, "ko"))
+for node in smooth_nodes:
+    plt.plot(node['x'], node['z'], color_map.get(node['type'], "ko"))
 
 plt.title("Smooth Path Nodes")
 plt.xlabel("X")
@@ -218,9 +165,9 @@ plt.ylim(0, 300)
 plt.xticks([60, 120, 180, 240, 300])
 plt.yticks([60, 120, 180, 240, 300])
 
-for node in smooth_path_nodes:
-    if node.type == "static":
-        plt.plot(node.x, node.z, "bo")
+for node in smooth_nodes:
+    if node['type'] == "static":
+        plt.plot(node['x'], node['z'], "bo")
 
 plt.title("Static Waypoints Only")
 plt.xlabel("X")
@@ -233,8 +180,8 @@ plt.show()
 with open("smooth_path_nodes.csv", "w", newline="", encoding="utf-8") as f:
     writer = csv.writer(f)
     writer.writerow(["x", "z", "type", "arrived"])
-    for node in smooth_path_nodes:
-        writer.writerow([node.x, node.z, node.type, node.arrived])
+    for node in smooth_nodes:
+        writer.writerow([node['x'], node['z'], node['type'], node['arrived']])
 
 @app.route('/info', methods=['POST'])
 def info():
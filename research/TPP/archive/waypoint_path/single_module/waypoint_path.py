@@ -0,0 +1,207 @@
+"""
+배열 기반 웨이포인트 경로 (WaypointList 연결 리스트 대체)
+
+basic_path_tracking.py, generate_circle_nodes.py, 01_smooth_curve.py, create_node_for_forest_and_river.py,
+07_drive_for_raw_data.py 가 각자 WaypointNode / WaypointList 단방향 연결 리스트를 따로 정의해서 쓰고 있었고,
+to_list()는 노드를 하나씩 따라가며 점마다 dict를 새로 만들었음.
+경로 전체에 대한 질의(가장 가까운 구간, 남은 거리)도 매번 노드를 순회해야 했음.
+
+이 모듈의 WaypointPath는
+- 연속된 NumPy 배열 (N, 2) = (x, z) 또는 (N, 3) = (x, y, z) 에 점을 저장하고, 현재 목표는 cursor 인덱스로 가리킴
+- 점별 type(static/start/dynamic/out) 코드 배열과 arrived 플래그 배열을 같이 관리
+- pop / advance 는 cursor만 옮기는 O(1), append 는 용량을 2배씩 늘리는 amortized O(1)
+- 남은 구간 전체에 대한 가장 가까운 구간 / 남은 경로 길이 질의를 배열 연산으로 계산
+- remaining()은 남은 점들을 복사 없이 view로 돌려줘서 IBSM 전송(waypoints_list)에 바로 사용
+기존 WaypointList와 같은 이름의 메서드(append, peek, pop, mark_head_arrived, is_empty, to_list)를 그대로 제공함.
+07_drive_for_raw_data.py는 점마다 조준점(target_x, target_z)을 따로 달고 있어서 자체 연결 리스트를 유지함.
+
+사용 예)
+    waypoints = WaypointPath()
+    waypoints.append(30, 30)
+    waypoints.extend([(90, 90), (150, 90)], type="dynamic")
+    current_wp = waypoints.peek()             # current_wp.x, current_wp.z
+    waypoints.pop()
+    seg, t, dist, (px, pz) = waypoints.nearest_segment(player_x, player_z)
+    response["waypoints_list"] = waypoints.remaining().tolist()
+"""
+from collections import namedtuple
+
+import numpy as np
+
+WAYPOINT_TYPES = ("static", "start", "dynamic", "out")       # 01_smooth_curve.py 의 노드 타입
+TYPE_CODES = {name: code for code, name in enumerate(WAYPOINT_TYPES)}
+
+FLAG_ARRIVED = 1                # flags 비트: 도착 처리된 점
+INITIAL_CAPACITY = 16
+
+# peek / pop 이 돌려주는 점 1개 (기존 WaypointNode 처럼 .x, .z, .arrived, .type 으로 접근)
+Waypoint = namedtuple("Waypoint", ["index", "x", "y", "z", "arrived", "type"])
+
+
+class WaypointPath:
+    def __init__(self, points=None, dim=2, type="static"):
+        # dim=2: 열 순서 (x, z) / dim=3: 열 순서 (x, y, z), y는 높이
+        if dim not in (2, 3):
+            raise ValueError(f"Invalid waypoint dimension: {dim}")
+        self.dim = dim
+        self._points = np.empty((INITIAL_CAPACITY, dim), dtype=np.float64)
+        self._types = np.zeros(INITIAL_CAPACITY, dtype=np.uint8)
+        self._flags = np.zeros(INITIAL_CAPACITY, dtype=np.uint8)
+        self._size = 0                  # 저장된 점 개수 (지나간 점 포함)
+        self.cursor = 0                 # 현재 목표 점 인덱스
+        self._cum_length = None         # 누적 경로 길이 캐시 (append 시 무효화)
+        if points is not None:
+            self.extend(points, type=type)
+
+    ##### 저장 용량 확보 (2배씩 증가) #####
+    def _reserve(self, size):
+        capacity = len(self._points)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        points = np.empty((capacity, self.dim), dtype=np.float64)
+        points[:self._size] = self._points[:self._size]
+        types = np.zeros(capacity, dtype=np.uint8)
+        types[:self._size] = self._types[:self._size]
+        flags = np.zeros(capacity, dtype=np.uint8)
+        flags[:self._size] = self._flags[:self._size]
+        self._points, self._types, self._flags = points, types, flags
+
+    ##### 점 1개 추가 (기존 WaypointList.append 와 같은 인자) #####
+    def append(self, x, z, arrived=False, type="static", y=0.0):
+        self._reserve(self._size + 1)
+        i = self._size
+        if self.dim == 2:
+            self._points[i] = (x, z)
+        else:
+            self._points[i] = (x, y, z)
+        self._types[i] = TYPE_CODES[type]
+        self._flags[i] = FLAG_ARRIVED if arrived else 0
+        self._size += 1
+        self._cum_length = None
+        return i
+
+    ##### (M, dim) 점 배열을 한 번에 추가 #####
+    def extend(self, points, type="static"):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, self.dim)
+        start = self._size
+        self._reserve(start + len(points))
+        self._points[start:start + len(points)] = points
+        self._types[start:start + len(points)] = TYPE_CODES[type]
+        self._flags[start:start + len(points)] = 0
+        self._size += len(points)
+        self._cum_length = None
+        return start
+
+    def _waypoint(self, i):
+        p = self._points[i]
+        y = float(p[1]) if self.dim == 3 else 0.0
+        return Waypoint(i, float(p[0]), y, float(p[-1]),
+                        bool(self._flags[i] & FLAG_ARRIVED), WAYPOINT_TYPES[self._types[i]])
+
+    ##### 현재 목표 점 (없으면 None) #####
+    def peek(self):
+        if self.cursor >= self._size:
+            return None
+        return self._waypoint(self.cursor)
+
+    ##### 현재 목표 점을 돌려주고 다음 점으로 이동 (O(1)) #####
+    def pop(self):
+        if self.cursor >= self._size:
+            return None
+        node = self._waypoint(self.cursor)
+        self.cursor += 1
+        return node
+
+    ##### n개 점을 건너뜀 (경로 추종기에서 가장 가까운 구간으로 점프할 때 사용) #####
+    def advance(self, n=1):
+        self.cursor = min(self.cursor + max(int(n), 0), self._size)
+        return self.cursor
+
+    def seek(self, index):
+        self.cursor = min(max(int(index), 0), self._size)
+        return self.cursor
+
+    def mark_head_arrived(self):
+        if self.cursor >= self._size:
+            return False
+        self._flags[self.cursor] |= FLAG_ARRIVED
+        return True
+
+    def is_empty(self):
+        return self.cursor >= self._size
+
+    def __len__(self):
+        return self._size - self.cursor
+
+    ##### 남은 점 (cursor 이후) view, 복사 없음 #####
+    def remaining(self):
+        return self._points[self.cursor:self._size]
+
+    ##### 지나간 점까지 포함한 전체 점 view #####
+    def as_array(self):
+        return self._points[:self._size]
+
+    ##### 평면(x, z) 좌표 view: dim=3 이면 0, 2번 열을 stride로 골라서 복사 없음 #####
+    def planar(self, start=0):
+        return self._points[start:self._size, ::self.dim - 1]
+
+    def types(self):
+        return self._types[self.cursor:self._size]
+
+    def arrived(self):
+        return (self._flags[self.cursor:self._size] & FLAG_ARRIVED).astype(bool)
+
+    ##### 기존 WaypointList.to_list 와 같은 dict 리스트 (로그 / 디버그 출력용) #####
+    def to_list(self):
+        xz = self.planar(self.cursor)
+        types = self.types()
+        arrived = self.arrived()
+        return [{'x': float(x), 'z': float(z), 'arrived': bool(a), 'type': WAYPOINT_TYPES[t]}
+                for (x, z), a, t in zip(xz.tolist(), arrived, types)]
+
+    ##### 점 0번부터의 누적 경로 길이 (x, z 평면) #####
+    def cumulative_length(self):
+        if self._cum_length is None:
+            seg = np.diff(self.planar(), axis=0)
+            self._cum_length = np.concatenate(([0.0], np.cumsum(np.hypot(seg[:, 0], seg[:, 1]))))
+        return self._cum_length
+
+    ##### 남은 경로 길이: (현재 위치 -> 목표 점) + (목표 점 -> 마지막 점) #####
+    def remaining_length(self, x=None, z=None):
+        if self.is_empty():
+            return 0.0
+        cum = self.cumulative_length()
+        length = float(cum[self._size - 1] - cum[self.cursor])
+        if x is not None and z is not None:
+            head = self.planar(self.cursor)[0]
+            length += float(np.hypot(head[0] - x, head[1] - z))
+        return length
+
+    ##### 남은 구간 전체에 점(x, z)을 한 번에 투영해서 가장 가까운 구간 찾기 #####
+    # 구간 i 는 점 i -> 점 i+1, cursor 직전 점(이미 지나온 점)에서 출발하는 구간도 포함
+    # max_distance: 검색 시작점부터 이 경로 길이 안의 구간만 검색 (시작점과 끝점이 겹치는 원형 경로에서 끝으로 튀는 것 방지)
+    # 반환: (구간 인덱스, 구간 내 위치 t(0~1), 거리, 투영점(x, z)), 점이 1개뿐이면 그 점까지의 거리
+    def nearest_segment(self, x, z, max_distance=None):
+        if self.is_empty():
+            return None
+        start = max(self.cursor - 1, 0)
+        xz = self.planar(start)
+        if max_distance is not None:
+            cum = self.cumulative_length()
+            end = int(np.searchsorted(cum, cum[start] + max_distance, side="right"))
+            xz = xz[:max(end - start + 1, 1)]
+        if len(xz) == 1:
+            px, pz = xz[0]
+            return start, 0.0, float(np.hypot(px - x, pz - z)), (float(px), float(pz))
+
+        a = xz[:-1]
+        d = xz[1:] - a
+        length_sq = np.einsum("ij,ij->i", d, d)
+        t = ((x - a[:, 0]) * d[:, 0] + (z - a[:, 1]) * d[:, 1]) / np.where(length_sq > 0, length_sq, 1.0)
+        t = np.clip(t, 0.0, 1.0)
+        proj = a + d * t[:, None]
+        dist = np.hypot(proj[:, 0] - x, proj[:, 1] - z)
+        i = int(np.argmin(dist))
+        return start + i, float(t[i]), float(dist[i]), (float(proj[i, 0]), float(proj[i, 1]))
@@ -0,0 +1,239 @@
+"""
+VDRS 데이터셋 자동 라벨링 파이프라인 (배치 추론 + 프리페치 + 쓰기 워커 + 이어하기)
+
+labeling.py / obstacle_labeling.py는 맵 -> 장애물 -> 이미지를 하나씩 돌면서
+model.predict(이미지 경로)를 1장씩 호출하고, 시각화용으로 같은 이미지를 cv2.imread로 다시 읽고,
+라벨 / 시각화 파일 쓰기까지 전부 한 스레드에서 순서대로 처리했음.
+탐지 1개가 아닌 이미지는 그 자리에서 삭제했고, 중간에 끊기면 OUTPUT을 지우고 처음부터 다시 돌려야 했음.
+
+이 모듈의 label_dataset은
+- INPUT/맵/장애물/이미지 목록을 만들고, 출력 폴더의 manifest.csv에 (크기, 수정시각)이 같은 기록이 있는 이미지는 건너뜀
+- 디코딩 스레드 DECODE_WORKERS개가 이미지를 미리 읽어서 크기 PREFETCH의 큐에 채우고 (순서 유지)
+- BATCH_SIZE장씩 모아 predict_batch 1번으로 추론 (detector_runtime.load_detector의 predict_batch)
+- 탐지가 정확히 1개인 이미지는 쓰기 스레드 WRITE_WORKERS개가 YOLO 라벨(.txt) + 시각화(.jpg)를 저장
+  (이미 디코딩한 배열에 그리므로 다시 읽지 않음)
+- 파일 저장이 끝난 이미지 / 거부된 이미지(탐지 0개 또는 2개 이상)를 manifest.csv에 한 줄씩 바로 추가
+함. 거부된 이미지는 기본으로 지우지 않고 manifest에 rejected로만 남김 (DELETE_REJECTED = True 이면 기존처럼 삭제).
+출력 구조(맵/장애물/labels/*.txt, 맵/장애물/*_labeled.jpg)와 라벨 형식, 클래스 번호는 labeling.py와 같음.
+
+사용 예)
+    python labeling_pipeline.py
+"""
+import os
+import sys
+import csv
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import cv2
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "detector_service", "single_module"))
+
+INPUT_DIR = r"c:\PYSOU\final_project\labeling\input"    # 원본 이미지 폴더 (맵/장애물/이미지)
+OUTPUT_DIR = r"c:\PYSOU\final_project\labeling\output"  # 라벨링 결과 + manifest.csv 저장 폴더
+
+MODEL_PATH = "yolov9e.pt"
+CONF_THRES = 0.5                # YOLO 탐지 신뢰도 threshold
+BATCH_SIZE = 16                 # 한 번에 추론할 이미지 수
+PREFETCH = 64                   # 미리 디코딩해 둘 최대 이미지 수
+DECODE_WORKERS = 4              # 이미지 읽기 / 디코딩 스레드 수
+WRITE_WORKERS = 4               # 라벨 / 시각화 저장 스레드 수
+DELETE_REJECTED = False         # 탐지 1개가 아닌 원본 이미지 삭제 여부
+IMAGE_EXTS = (".jpg", ".png", ".jpeg")
+
+MANIFEST_NAME = "manifest.csv"
+MANIFEST_FIELDS = ["image", "size", "mtime_ns", "status", "num_boxes"]
+
+# obstacle별 클래스 번호 통일 (labeling.py와 동일)
+CLASS_MAPPING = {
+    "Car 2": 1,
+    "Car 3": 2,
+    "Car 4": 3,
+    "Human 1": 4,
+    "Tank 1": 5,
+    "Rock 1": 6,
+    "Rock 2": 7,
+    "Mine 1": 8,
+    "Wall 2": 9,
+    "Wall 2 X 10": 10,
+    "Other": 0
+}
+DEFAULT_CLASS_ID = 9            # 매핑에 없는 장애물 폴더 (labeling.py와 동일)
+
+
+##### INPUT/맵/장애물/이미지 -> [(맵, 장애물, 상대 경로)] (정렬된 순서) #####
+def list_images(input_dir):
+    jobs = []
+    for map_name in sorted(os.listdir(input_dir)):
+        map_path = os.path.join(input_dir, map_name)
+        if not os.path.isdir(map_path):
+            continue
+        for obs_name in sorted(os.listdir(map_path)):
+            obs_path = os.path.join(map_path, obs_name)
+            if not os.path.isdir(obs_path):
+                continue
+            for img_name in sorted(os.listdir(obs_path)):
+                if img_name.lower().endswith(IMAGE_EXTS):
+                    jobs.append((map_name, obs_name, os.path.join(map_name, obs_name, img_name)))
+    return jobs
+
+
+##### 파일 변경 확인용 키 (크기, 수정시각 ns) #####
+def file_key(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+##### manifest에 기록된 이미지 -> (크기, 수정시각). 파일이 바뀌었으면 다시 라벨링하도록 키를 같이 저장 #####
+def load_manifest(manifest_path):
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, newline="", encoding="utf-8") as f:
+        return {row["image"]: (int(row["size"]), int(row["mtime_ns"])) for row in csv.DictReader(f)}
+
+
+##### manifest 행 추가용 writer (행마다 flush, 중간에 끊겨도 그 전까지는 남음) #####
+class ManifestWriter:
+    def __init__(self, manifest_path):
+        new_file = not os.path.exists(manifest_path) or os.path.getsize(manifest_path) == 0
+        self._file = open(manifest_path, "a", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=MANIFEST_FIELDS)
+        if new_file:
+            self._writer.writeheader()
+
+    def write(self, row):
+        self._writer.writerow(row)
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+##### 이미지를 디코딩 스레드들로 미리 읽어서 순서대로 (job, 이미지) 반환, 읽기 실패는 이미지 None #####
+# 큐에는 Future를 넣어서 순서를 유지하고, 큐 크기(depth)만큼만 앞서 읽음
+def prefetch_images(jobs, input_dir, workers=DECODE_WORKERS, depth=PREFETCH):
+    futures = queue.Queue(maxsize=depth)
+    done = object()
+
+    def produce(pool):
+        for job in jobs:
+            futures.put((job, pool.submit(cv2.imread, os.path.join(input_dir, job[2]))))
+        futures.put(done)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        producer = threading.Thread(target=produce, args=(pool,), daemon=True)
+        producer.start()
+        while True:
+            item = futures.get()
+            if item is done:
+                break
+            job, future = item
+            yield job, future.result()
+        producer.join()
+
+
+##### 탐지 1개 (x1, y1, x2, y2) -> YOLO 라벨 한 줄 (labeling.py와 같이 정수 좌표 기준) #####
+def yolo_label_line(class_id, box, width, height):
+    x1, y1, x2, y2 = (int(v) for v in box[:4])
+    x_center = ((x1 + x2) / 2) / width
+    y_center = ((y1 + y2) / 2) / height
+    box_w = (x2 - x1) / width
+    box_h = (y2 - y1) / height
+    return f"{class_id} {x_center:.6f} {y_center:.6f} {box_w:.6f} {box_h:.6f}\n"
+
+
+##### 라벨 txt + 시각화 jpg 저장 (쓰기 스레드에서 실행) -> manifest 행 #####
+def write_outputs(job, image, detection, output_dir, key):
+    map_name, obs_name, rel_path = job
+    output_obs_path = os.path.join(output_dir, map_name, obs_name)
+    output_labels_path = os.path.join(output_obs_path, "labels")
+    os.makedirs(output_labels_path, exist_ok=True)
+    base_name = os.path.splitext(os.path.basename(rel_path))[0]
+
+    h, w = image.shape[:2]
+    class_id = CLASS_MAPPING.get(obs_name, DEFAULT_CLASS_ID)
+    with open(os.path.join(output_labels_path, f"{base_name}.txt"), "w") as f:
+        f.write(yolo_label_line(class_id, detection, w, h))
+
+    x1, y1, x2, y2 = (int(v) for v in detection[:4])
+    cv2.rectangle(image, (x1, y1), (x2, y2), (0, 255, 0), 2)
+    cv2.putText(image, f"{obs_name}", (x1, y1 - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+    cv2.imwrite(os.path.join(output_obs_path, f"{base_name}_labeled.jpg"), image)
+    return {"image": rel_path, "size": key[0], "mtime_ns": key[1], "status": "labeled", "num_boxes": 1}
+
+
+##### 데이터셋 라벨링, 상태별 이미지 수 반환 #####
+def label_dataset(input_dir, output_dir, predict_batch, batch_size=BATCH_SIZE, decode_workers=DECODE_WORKERS,
+                  write_workers=WRITE_WORKERS, prefetch=PREFETCH, delete_rejected=DELETE_REJECTED, progress=True):
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    finished = load_manifest(manifest_path)
+
+    jobs, keys = [], {}
+    counts = {"skipped": 0, "labeled": 0, "rejected": 0, "unreadable": 0}
+    for job in list_images(input_dir):
+        key = file_key(os.path.join(input_dir, job[2]))
+        if finished.get(job[2]) == key:
+            counts["skipped"] += 1
+            continue
+        jobs.append(job)
+        keys[job[2]] = key
+    if progress:
+        print(f"[INFO] 라벨링 대상 {len(jobs)}개 (manifest 기록 {counts['skipped']}개 건너뜀)")
+
+    manifest = ManifestWriter(manifest_path)
+    pending = deque()
+
+    def drain(block):
+        while pending and (block or pending[0].done()):
+            manifest.write(pending.popleft().result())
+            counts["labeled"] += 1
+
+    def flush(batch):
+        results = predict_batch([image for _, image in batch])
+        for (job, image), detections in zip(batch, results):
+            key = keys[job[2]]
+            if len(detections) == 1:
+                pending.append(writers.submit(write_outputs, job, image, detections[0], output_dir, key))
+                continue
+            if delete_rejected:
+                os.remove(os.path.join(input_dir, job[2]))
+            manifest.write({"image": job[2], "size": key[0], "mtime_ns": key[1],
+                            "status": "rejected", "num_boxes": len(detections)})
+            counts["rejected"] += 1
+        if len(pending) > write_workers * 4:            # 쓰기가 밀리면 가장 오래된 것부터 대기
+            wait([pending[0]], return_when=FIRST_COMPLETED)
+        drain(block=False)
+
+    try:
+        with ThreadPoolExecutor(max_workers=write_workers) as writers:
+            batch = []
+            for done_count, (job, image) in enumerate(prefetch_images(jobs, input_dir, decode_workers, prefetch), 1):
+                if image is None:
+                    counts["unreadable"] += 1
+                    continue
+                batch.append((job, image))
+                if len(batch) == batch_size:
+                    flush(batch)
+                    batch = []
+                if progress and done_count % (batch_size * 10) == 0:
+                    print(f"  {done_count}/{len(jobs)}  라벨 {counts['labeled']}, 거부 {counts['rejected']}")
+            if batch:
+                flush(batch)
+            drain(block=True)
+    finally:
+        manifest.close()
+    return counts
+
+
+if __name__ == "__main__":
+    from detector_runtime import load_detector
+
+    runtime = load_detector(MODEL_PATH, conf_thres=CONF_THRES)
+    counts = label_dataset(INPUT_DIR, OUTPUT_DIR, runtime.predict_batch)
+    print(f"[완료] 라벨 {counts['labeled']}개, 거부 {counts['rejected']}개, "
+          f"읽기 실패 {counts['unreadable']}개, 이전 실행분 {counts['skipped']}개")
+    print(f"결과 폴더: '{OUTPUT_DIR}'")
@@ -0,0 +1,206 @@
+"""
+목적 : 영상(.mp4) -> 프레임 추출을 프로세스 안에서 디코딩하며, 전체 CPU 예산 안에서 병렬로 처리하고
+       거의 같은 연속 프레임(perceptual hash)을 걸러서 저장한다. 선택적으로 클래스(장애물 폴더)별 샤드 1개로 저장.
+
+convert_mp4_files_to_images.py는 영상마다 ffmpeg -threads 16을 ThreadPoolExecutor(cpu_count())로 동시에 띄워서
+코어 수 x 16 스레드까지 과할당되었고, 정지 장면처럼 앞 프레임과 거의 같은 프레임도 전부 jpg로 저장했음.
+
+이 모듈은
+- 같은 저장 폴더(맵/장애물)의 영상들을 작업 1개로 묶고, 작업을 프로세스 CPU_BUDGET // THREADS_PER_JOB개에서 실행
+  (작업마다 FFmpeg 디코더 스레드(CAP_PROP_N_THREADS)와 cv2.setNumThreads를 THREADS_PER_JOB로 제한 -> 전체 스레드 수가 CPU_BUDGET을 넘지 않음.
+   cv2.setNumThreads만으로는 VideoCapture 안의 FFmpeg 디코더가 기본값인 CPU 수만큼 스레드를 씀)
+- cv2.VideoCapture로 FRAME_INTERVAL초마다 1장만 retrieve (나머지 프레임은 grab으로 디코딩만 건너뜀)
+- 프레임마다 64bit pHash(32x32 흑백 DCT의 저주파 8x8, 중앙값 기준)를 계산해서
+  직전에 저장한 프레임과의 해밍 거리가 DEDUP_DISTANCE 이하면 버림
+- SHARD_FORMAT = None 이면 기존과 같은 폴더 / 파일명(prefix_00001.jpg)으로 저장,
+  "tar"면 클래스별 frames.tar (jpg 바이트), "npz"면 클래스별 frames.npz (프레임별 uint8 배열)로 순차 저장
+을 함. 샤드는 iter_shard(path)로 순서대로 (이름, 이미지) 를 읽을 수 있음 (라벨링 / 학습 입력용).
+"""
+import os
+import sys
+import io
+import tarfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import cv2
+from scipy.fft import dctn
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(CURRENT_DIR)
+sys.path.append(BASE_DIR)
+sys.path.append(CURRENT_DIR)
+
+from settings import INPUT_DIR, OUTPUT_DIR, FRAME_INTERVAL
+from convert_mp4_files_to_images import make_prefix_from_filename
+
+CPU_BUDGET = os.cpu_count() or 1    # 모든 작업이 함께 쓰는 최대 디코딩 스레드 수
+THREADS_PER_JOB = 2                 # 작업(프로세스) 1개의 디코더 / cv2 스레드 수
+DEDUP_DISTANCE = 6                  # 직전 저장 프레임과 pHash 해밍 거리가 이 이하면 중복으로 버림 (64bit 중), 측정 전 추정값
+SHARD_FORMAT = None                 # None(jpg 파일) / "tar" / "npz"
+JPEG_QUALITY = 95
+HASH_SIZE = 8                       # pHash 저주파 블록 크기 (8x8 = 64bit)
+HASH_IMAGE = 32                     # pHash 계산용 흑백 축소 크기
+
+
+##### 32x32 흑백 배열 -> 64bit pHash (DCT 저주파 8x8, DC 제외 중앙값 기준) #####
+def phash_from_gray(gray):
+    coeffs = dctn(np.asarray(gray, dtype=np.float64), norm="ortho")[:HASH_SIZE, :HASH_SIZE].ravel()
+    bits = coeffs > np.median(coeffs[1:])
+    return int(np.packbits(bits).view(">u8")[0])
+
+
+##### BGR 프레임 -> pHash #####
+def frame_hash(frame):
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    return phash_from_gray(cv2.resize(gray, (HASH_IMAGE, HASH_IMAGE), interpolation=cv2.INTER_AREA))
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+##### INPUT 폴더의 mp4 -> 저장 폴더별 작업 {save_dir: [(mp4 경로, prefix)]} (폴더 규칙은 convert_mp4_files_to_images.py와 동일) #####
+def find_jobs(input_dir=INPUT_DIR, output_dir=OUTPUT_DIR):
+    jobs = {}
+    for root, _, files in os.walk(input_dir):
+        for f in sorted(files):
+            if not f.lower().endswith(".mp4"):
+                continue
+            rel_root = os.path.relpath(root, input_dir)
+            map_dir = os.path.dirname(rel_root)
+            filename_no_ext = os.path.splitext(f)[0]
+            prefix = make_prefix_from_filename(filename_no_ext, map_dir)
+            if map_dir == "":
+                save_dir = os.path.join(output_dir, filename_no_ext)
+            else:
+                pure_obj_dir = filename_no_ext.split('_')[1].strip() if '_' in filename_no_ext else filename_no_ext
+                save_dir = os.path.join(output_dir, map_dir, pure_obj_dir)
+            jobs.setdefault(save_dir, []).append((os.path.join(root, f), prefix))
+    return jobs
+
+
+##### 영상 1개에서 interval초마다 프레임 1장씩 (grab으로 건너뛰고 필요한 프레임만 retrieve) #####
+# FFmpeg 디코더 스레드 수는 열 때 지정해야 함 (cv2.setNumThreads는 디코더에 적용되지 않음)
+def sample_frames(mp4_path, interval, threads=THREADS_PER_JOB):
+    capture = cv2.VideoCapture(mp4_path, cv2.CAP_FFMPEG, [cv2.CAP_PROP_N_THREADS, threads])
+    if not capture.isOpened():
+        raise ValueError(f"Could not open video {mp4_path}")
+    fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+    step = max(int(round(fps * interval)), 1)
+    index = 0
+    try:
+        while capture.grab():
+            if index % step == 0:
+                ok, frame = capture.retrieve()
+                if ok:
+                    yield frame
+            index += 1
+    finally:
+        capture.release()
+
+
+##### 저장 방식별 writer: 폴더(jpg 파일) / tar 샤드 / npz 샤드 #####
+class FrameSink:
+    def __init__(self, save_dir, shard_format=SHARD_FORMAT):
+        os.makedirs(save_dir, exist_ok=True)
+        self.shard_format = shard_format
+        self.save_dir = save_dir
+        if shard_format == "tar":
+            self._archive = tarfile.open(os.path.join(save_dir, "frames.tar"), "w")
+        elif shard_format == "npz":
+            self._archive = zipfile.ZipFile(os.path.join(save_dir, "frames.npz"), "w", zipfile.ZIP_STORED)
+        elif shard_format is None:
+            self._archive = None
+        else:
+            raise ValueError(f"Unknown shard format {shard_format!r}")
+
+    def write(self, name, frame):
+        if self.shard_format == "npz":
+            with self._archive.open(f"{name}.npy", "w") as f:     # np.load(frames.npz)[name] 로 읽힘
+                np.lib.format.write_array(f, frame)
+            return
+        ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+        if not ok:
+            raise ValueError(f"Could not encode frame {name}")
+        if self.shard_format == "tar":
+            info = tarfile.TarInfo(f"{name}.jpg")
+            info.size = len(encoded)
+            self._archive.addfile(info, io.BytesIO(encoded.tobytes()))
+        else:
+            with open(os.path.join(self.save_dir, f"{name}.jpg"), "wb") as f:
+                f.write(encoded.tobytes())
+
+    def close(self):
+        if self._archive is not None:
+            self._archive.close()
+
+
+##### 작업 1개 (저장 폴더 1개의 영상들) -> (저장 폴더, 샘플 수, 저장 수) #####
+def extract_job(save_dir, videos, interval=FRAME_INTERVAL, threads=THREADS_PER_JOB,
+                dedup_distance=DEDUP_DISTANCE, shard_format=SHARD_FORMAT):
+    cv2.setNumThreads(threads)
+    sink = FrameSink(save_dir, shard_format)
+    sampled = kept = 0
+    try:
+        for mp4_path, prefix in videos:
+            last_hash = None                        # 영상마다 새로 비교 (영상 경계는 중복으로 안 봄)
+            for frame in sample_frames(mp4_path, interval, threads):
+                sampled += 1
+                h = frame_hash(frame)
+                if last_hash is not None and hamming(h, last_hash) <= dedup_distance:
+                    continue
+                last_hash = h
+                kept += 1
+                sink.write(f"{prefix}_{kept:05d}", frame)
+    finally:
+        sink.close()
+    return save_dir, sampled, kept
+
+
+##### 샤드(frames.tar / frames.npz)를 순서대로 읽기 -> (이름, BGR 이미지) #####
+def iter_shard(path):
+    if path.endswith(".tar"):
+        with tarfile.open(path, "r|") as archive:               # 스트리밍 모드, 앞에서부터 순차 읽기
+            for member in archive:
+                data = archive.extractfile(member).read()
+                yield os.path.splitext(member.name)[0], cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+    elif path.endswith(".npz"):
+        with np.load(path) as archive:
+            for name in archive.files:
+                yield name, archive[name]
+    else:
+        raise ValueError(f"Unknown shard file {path}")
+
+
+def main(cpu_budget=CPU_BUDGET, threads_per_job=THREADS_PER_JOB, shard_format=SHARD_FORMAT):
+    if not os.path.exists(INPUT_DIR):
+        print(f"[에러] 입력 폴더가 존재하지 않습니다: {INPUT_DIR}")
+        return
+    jobs = find_jobs()
+    if not jobs:
+        print(f"[알림] {INPUT_DIR} 및 하위 폴더에 mp4 파일이 없습니다.")
+        return
+
+    workers = max(cpu_budget // threads_per_job, 1)
+    print(f"[정보] 작업 {len(jobs)}개, 프로세스 {workers}개 x 스레드 {threads_per_job}개 (CPU 예산 {cpu_budget})")
+    total_sampled = total_kept = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(extract_job, save_dir, videos, FRAME_INTERVAL, threads_per_job,
+                               DEDUP_DISTANCE, shard_format): save_dir for save_dir, videos in jobs.items()}
+        for future in as_completed(futures):
+            try:
+                save_dir, sampled, kept = future.result()
+            except Exception as e:
+                print(f"[에러] 실패: {futures[future]} -> {e}")
+                continue
+            total_sampled += sampled
+            total_kept += kept
+            print(f"[진행] {save_dir}: 샘플 {sampled}장 -> 저장 {kept}장")
+
+    print(f"[완료] 샘플 {total_sampled}장 중 {total_kept}장 저장 (중복 {total_sampled - total_kept}장 제외)")
+
+
+if __name__ == "__main__":
+    main()
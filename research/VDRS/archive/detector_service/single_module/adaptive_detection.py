@@ -0,0 +1,195 @@
+"""
+움직임 게이팅 + 관심 영역(ROI) 탐지
+
+/detect는 장면이 거의 안 바뀌는 프레임(정지 중 / 포탑 고정)까지 매 프레임 전체 화면을 같은 해상도로 추론했음.
+
+이 모듈의 AdaptiveDetector는 프레임마다
+- 면적 평균으로 축소한 흑백 썸네일로 마지막 추론 프레임과의 블록별 차이(motion score, 0~1)를 싸게 계산해서
+  (썸네일 칸 / 블록 크기는 놓치면 안 되는 가장 작은 표적 크기 MIN_TARGET_PX 기준)
+- 변화가 STATIC_THRESHOLD 미만이면 추론을 건너뛰고 직전 결과를 재사용(skip),
+  MAX_SKIP 프레임 넘게 건너뛰었으면 저해상도 모델로 전체 화면을 한 번 갱신(low)
+- 변화가 있으면 직전 탐지 박스 + 예측된 적 위치(hints, 트래커 예측 박스) 주변만 잘라서
+  고해상도 모델에 crop들을 한 배치로 추론(roi), 박스는 전체 화면 좌표로 되돌림
+- 새 물체를 놓치지 않도록 FULL_INTERVAL 프레임마다, 또는 볼 영역이 없으면 전체 화면 추론(full)
+을 고름. 결과 박스는 /detect와 같은 (N, 6) [x1, y1, x2, y2, conf, class_id] 전체 화면 픽셀 좌표라서
+cal_position.py의 픽셀 -> 상대각 변환(pixel_to_angles)에 그대로 넣을 수 있고,
+각 crop이 덮는 각도 범위(crop_angle_windows)도 같은 변환으로 구할 수 있음.
+
+predict_full / predict_low / predict_crop은 BatchingDetector와 같은 predict_batch 형식.
+예) load_detector(imgsz=640).predict_batch, load_detector(imgsz=320).predict_batch
+
+사용 예)
+    adaptive = AdaptiveDetector(full.predict_batch, predict_low=low.predict_batch)
+    result = adaptive.update(frame, hints=tracker_boxes)
+    angles = pixel_to_angles(*box_centers(result["detections"]), SCREEN_W, SCREEN_H, FOV_H, FOV_V)
+"""
+import numpy as np
+
+MIN_TARGET_PX = 32              # 움직임을 놓치면 안 되는 가장 작은 표적 크기 (원본 픽셀)
+THUMB_CELL = MIN_TARGET_PX // 4 # 썸네일 1픽셀 = 원본 THUMB_CELL x THUMB_CELL 면적 평균
+MOTION_BLOCK = MIN_TARGET_PX // THUMB_CELL     # motion score 블록 크기 (썸네일 픽셀) = 원본 MIN_TARGET_PX 정사각형
+STATIC_THRESHOLD = 0.02         # 블록 평균 밝기 차이(0~1)가 이보다 작으면 정지 장면, 측정 전 추정값
+MAX_SKIP = 5                    # 정지 장면에서 연속으로 건너뛸 최대 프레임 수
+FULL_INTERVAL = 15              # 이 프레임 수마다 전체 화면 추론 (새로 나타난 물체 탐지)
+ROI_MARGIN = 0.5                # crop 여백 (박스 크기 대비 비율)
+MIN_CROP = 256                  # crop 한 변 최소 픽셀 수
+MAX_CROP_AREA = 0.5             # crop 총 면적이 화면의 이 비율을 넘으면 전체 화면 추론
+
+# cal_position.py 기본 화면 / 시야각
+SCREEN_W = 1919
+SCREEN_H = 1047
+FOV_H = 47.81061
+FOV_V = 28.0
+
+MODES = ("full", "roi", "low", "skip")
+
+
+##### 화면 픽셀 -> 포신 기준 상대각 (수평, 수직) deg, 배열 입력 가능 (cal_position.calculate_relative_angles와 같은 식) #####
+def pixel_to_angles(x_pixel, y_pixel, screen_w=SCREEN_W, screen_h=SCREEN_H, fov_h=FOV_H, fov_v=FOV_V):
+    cx, cy = screen_w / 2.0, screen_h / 2.0
+    rel_angle_h = (np.asarray(x_pixel, dtype=np.float64) - cx) / cx * (fov_h / 2.0)
+    rel_angle_v = (cy - np.asarray(y_pixel, dtype=np.float64)) / cy * (fov_v / 2.0)
+    return rel_angle_h, rel_angle_v
+
+
+##### (N, 6) 탐지 결과 -> 박스 중심 픽셀 (x, y) #####
+def box_centers(detections):
+    detections = np.asarray(detections, dtype=np.float64).reshape(-1, 6)
+    return (detections[:, 0] + detections[:, 2]) / 2.0, (detections[:, 1] + detections[:, 3]) / 2.0
+
+
+##### crop (K, 4) [x0, y0, x1, y1] -> 각 crop이 덮는 상대각 범위 (K, 4) [좌, 위, 우, 아래] deg #####
+def crop_angle_windows(crops, screen_w=SCREEN_W, screen_h=SCREEN_H, fov_h=FOV_H, fov_v=FOV_V):
+    crops = np.asarray(crops, dtype=np.float64).reshape(-1, 4)
+    left, top = pixel_to_angles(crops[:, 0], crops[:, 1], screen_w, screen_h, fov_h, fov_v)
+    right, bottom = pixel_to_angles(crops[:, 2], crops[:, 3], screen_w, screen_h, fov_h, fov_v)
+    return np.column_stack([left, top, right, bottom])
+
+
+##### 프레임 -> motion score용 흑백 썸네일 (cell x cell 칸 면적 평균, float32 0~1) #####
+# 간격 샘플링은 칸보다 좁은 물체가 썸네일에서 통째로 빠질 수 있어서 칸 안의 모든 픽셀(채널 포함)을 평균함
+# 정수 합을 세로 -> 가로(+채널) 순서로 구해서 float 변환은 썸네일 크기에서만 함
+def thumbnail(frame, cell=THUMB_CELL):
+    cell = max(min(cell, frame.shape[0], frame.shape[1]), 1)
+    h, w = frame.shape[0] // cell * cell, frame.shape[1] // cell * cell
+    channels = frame.shape[2] if frame.ndim == 3 else 1
+    row_dtype = np.uint16 if cell * 255 < 2 ** 16 else np.uint32
+    rows = frame[:h, :w].reshape(h // cell, cell, -1).sum(axis=1, dtype=row_dtype)
+    cells = rows.reshape(h // cell, w // cell, -1).sum(axis=2, dtype=np.uint32)
+    return cells.astype(np.float32) / (255.0 * cell * cell * channels)
+
+
+##### 두 썸네일의 차이 (0 = 같음, 1 = 완전히 다름) #####
+# 화면 전체 평균은 멀리 있는 작은 전차의 움직임이 묻혀서, block x block 창(원본 MIN_TARGET_PX 크기)의
+# 평균 절대 차이 중 최댓값을 씀. 창은 1칸씩 밀어서 (적분 영상) 표적이 블록 경계에 걸려도 나뉘지 않음
+def motion_score(reference, current, block=MOTION_BLOCK):
+    diff = np.abs(current - reference)
+    block = max(min(block, diff.shape[0], diff.shape[1]), 1)
+    integral = np.pad(diff.cumsum(axis=0, dtype=np.float64).cumsum(axis=1), ((1, 0), (1, 0)))
+    sums = (integral[block:, block:] - integral[:-block, block:]
+            - integral[block:, :-block] + integral[:-block, :-block])
+    return float(sums.max()) / (block * block)
+
+
+##### 박스들 주변 crop 영역 (K, 4) int [x0, y0, x1, y1], 겹치는 crop은 합침 #####
+def crop_regions(boxes, frame_shape, margin=ROI_MARGIN, min_size=MIN_CROP):
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    if len(boxes) == 0:
+        return np.zeros((0, 4), dtype=np.intp)
+    h, w = frame_shape[:2]
+    cx, cy = (boxes[:, 0] + boxes[:, 2]) / 2.0, (boxes[:, 1] + boxes[:, 3]) / 2.0
+    half_w = np.maximum((boxes[:, 2] - boxes[:, 0]) * (1.0 + 2.0 * margin), min(min_size, w)) / 2.0
+    half_h = np.maximum((boxes[:, 3] - boxes[:, 1]) * (1.0 + 2.0 * margin), min(min_size, h)) / 2.0
+    # 화면 밖으로 나가면 crop 크기를 유지한 채 안쪽으로 밀어 넣음
+    x0 = np.clip(cx - half_w, 0, np.maximum(w - 2.0 * half_w, 0))
+    y0 = np.clip(cy - half_h, 0, np.maximum(h - 2.0 * half_h, 0))
+    rects = np.column_stack([x0, y0, np.minimum(x0 + 2.0 * half_w, w), np.minimum(y0 + 2.0 * half_h, h)])
+
+    merged = True
+    while merged and len(rects) > 1:            # 겹치는 crop이 없을 때까지 합침 (같은 물체를 두 번 탐지하지 않도록)
+        merged = False
+        overlap = ((rects[:, None, 0] < rects[None, :, 2]) & (rects[None, :, 0] < rects[:, None, 2]) &
+                   (rects[:, None, 1] < rects[None, :, 3]) & (rects[None, :, 1] < rects[:, None, 3]))
+        np.fill_diagonal(overlap, False)
+        if overlap.any():
+            i, j = np.argwhere(overlap)[0]
+            union = np.r_[np.minimum(rects[i, :2], rects[j, :2]), np.maximum(rects[i, 2:], rects[j, 2:])]
+            rects = np.vstack([np.delete(rects, [i, j], axis=0), union])
+            merged = True
+    return np.column_stack([np.floor(rects[:, :2]), np.ceil(rects[:, 2:])]).astype(np.intp)
+
+
+class AdaptiveDetector:
+    def __init__(self, predict_full, predict_low=None, predict_crop=None,
+                 static_threshold=STATIC_THRESHOLD, max_skip=MAX_SKIP, full_interval=FULL_INTERVAL,
+                 margin=ROI_MARGIN, min_crop=MIN_CROP, max_crop_area=MAX_CROP_AREA):
+        self.predict_full = predict_full
+        self.predict_low = predict_low or predict_full
+        self.predict_crop = predict_crop or predict_full
+        self.static_threshold = static_threshold
+        self.max_skip = max_skip
+        self.full_interval = full_interval
+        self.margin = margin
+        self.min_crop = min_crop
+        self.max_crop_area = max_crop_area
+
+        self.mode_counts = dict.fromkeys(MODES, 0)
+        self._reference = None                  # 마지막으로 추론한 프레임의 썸네일
+        self._detections = np.zeros((0, 6), dtype=np.float32)
+        self._skipped = 0
+        self._since_full = 0
+
+    ##### 프레임 1장 처리 -> {"mode", "detections" (N, 6), "crops" (K, 4), "motion"} #####
+    # hints: 이번 프레임에서 적이 있을 것으로 예측한 박스 (M, 4) [x1, y1, x2, y2] (트래커 예측 등)
+    def update(self, frame, hints=None):
+        current = thumbnail(frame)
+        motion = 1.0 if self._reference is None else motion_score(self._reference, current)
+        crops = np.zeros((0, 4), dtype=np.intp)
+
+        if self._reference is None or self._since_full >= self.full_interval:
+            mode = "full"
+        elif motion < self.static_threshold:
+            mode = "skip" if self._skipped < self.max_skip else "low"
+        else:
+            regions = self._detections[:, :4]
+            if hints is not None and len(hints):
+                regions = np.vstack([regions, np.asarray(hints, dtype=np.float64).reshape(-1, 4)])
+            crops = crop_regions(regions, frame.shape, self.margin, self.min_crop)
+            area = np.prod(crops[:, 2:] - crops[:, :2], axis=1).sum() if len(crops) else 0
+            mode = "roi" if 0 < area <= self.max_crop_area * frame.shape[0] * frame.shape[1] else "full"
+
+        if mode == "skip":
+            self._skipped += 1
+        else:
+            if mode == "full":
+                self._detections = self.predict_full([frame])[0]
+                self._since_full = 0
+            elif mode == "low":
+                self._detections = self.predict_low([frame])[0]
+            else:
+                self._detections = self._predict_crops(frame, crops)
+            self._reference = current
+            self._skipped = 0
+        if mode != "full":
+            self._since_full += 1
+        self.mode_counts[mode] += 1
+        if mode != "roi":
+            crops = np.zeros((0, 4), dtype=np.intp)
+        return {"mode": mode, "detections": self._detections, "crops": crops, "motion": motion}
+
+    ##### crop들을 한 배치로 추론, 박스를 전체 화면 좌표로 되돌려서 합침 #####
+    def _predict_crops(self, frame, crops):
+        patches = [frame[y0:y1, x0:x1] for x0, y0, x1, y1 in crops]
+        results = self.predict_crop(patches)
+        merged = []
+        for (x0, y0, _, _), detections in zip(crops, results):
+            detections = np.array(detections, dtype=np.float32).reshape(-1, 6)
+            detections[:, [0, 2]] += x0
+            detections[:, [1, 3]] += y0
+            merged.append(detections)
+        return np.vstack(merged) if merged else np.zeros((0, 6), dtype=np.float32)
+
+    ##### 모드별 프레임 비율 #####
+    def mode_ratios(self):
+        total = max(sum(self.mode_counts.values()), 1)
+        return {mode: count / total for mode, count in self.mode_counts.items()}
@@ -0,0 +1,131 @@
+"""
+VDRS 탐지 마이크로 배칭 스케줄러
+
+/detect 핸들러들은 요청마다 YOLO를 배치 크기 1로 한 번씩 돌려서, 카메라(전차) 여러 대가 같은 서버를 쓰면
+forward pass가 요청 수만큼 순서대로 쌓이고 CPU에서 배치 연산의 이점을 전혀 못 얻었음.
+
+이 모듈의 BatchingDetector는
+- 요청 스레드가 submit(frame)으로 프레임을 큐에 넣으면 Future를 바로 돌려받고
+- 배칭 워커 스레드 1개가 첫 프레임이 들어온 시점부터 최대 max_delay_ms 동안, 최대 max_batch장까지 모아서
+- predict_batch(frames) 한 번(배치 forward pass)으로 추론한 뒤 프레임별 결과를 각 Future에 돌려줌
+- 요청별 지연(submit -> 결과)과 배치 크기를 기록해서 stats()로 처리량 / p50 / p99 지연을 보여 줌
+predict_batch는 프레임 리스트 -> 결과 리스트 함수라 YOLO 외 다른 모델도 끼울 수 있음 (yolo_predict_batch 참고).
+
+max_batch = 1 이면 기존과 같은 요청당 1회 추론이 됨. max_delay_ms를 늘리면 배치가 커져 처리량이 오르지만 지연이 늘어남.
+
+사용 예)
+    detector = BatchingDetector(yolo_predict_batch(YOLO("yolov8n.pt")), max_batch=8, max_delay_ms=10)
+    detections = detector.detect(frame)        # [[x1, y1, x2, y2, conf, class_id], ...]
+"""
+import time
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
+
+MAX_BATCH = 8                   # 한 번에 추론할 최대 프레임 수
+MAX_DELAY_MS = 10.0             # 첫 프레임 이후 배치를 모으는 최대 대기 시간(ms)
+LATENCY_HISTORY = 10000         # stats()에 쓰는 최근 요청 지연 기록 개수
+
+_STOP = object()
+
+
+##### ultralytics YOLO 모델 -> predict_batch 함수 (결과: 프레임별 (N, 6) [x1, y1, x2, y2, conf, class_id]) #####
+def yolo_predict_batch(model, conf=0.25, imgsz=640):
+    def predict_batch(frames):
+        results = model(frames, conf=conf, imgsz=imgsz, verbose=False)
+        return [r.boxes.data.cpu().numpy() for r in results]
+    return predict_batch
+
+
+class BatchingDetector:
+    def __init__(self, predict_batch, max_batch=MAX_BATCH, max_delay_ms=MAX_DELAY_MS):
+        self.predict_batch = predict_batch
+        self.max_batch = int(max_batch)
+        self.max_delay = float(max_delay_ms) / 1000.0
+        self._queue = queue.Queue()
+        self._latencies = deque(maxlen=LATENCY_HISTORY)
+        self._batch_sizes = deque(maxlen=LATENCY_HISTORY)
+        self._started = time.perf_counter()
+        self._frames_done = 0
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name="batching-detector", daemon=True)
+        self._worker.start()
+
+    ##### 프레임 1장 제출 -> Future (결과는 predict_batch가 돌려준 그 프레임의 값) #####
+    def submit(self, frame):
+        future = Future()
+        self._queue.put((frame, future, time.perf_counter()))
+        return future
+
+    ##### 제출 후 결과까지 대기 (요청 핸들러용) #####
+    def detect(self, frame, timeout=None):
+        return self.submit(frame).result(timeout=timeout)
+
+    def close(self):
+        self._queue.put(_STOP)
+        self._worker.join()
+
+    ##### 최근 요청 기준 처리량(frame/s), 평균 배치 크기, 지연 p50 / p99(ms) #####
+    def stats(self):
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000.0
+            batch_sizes = np.array(self._batch_sizes)
+            frames_done = self._frames_done
+        elapsed = time.perf_counter() - self._started
+        if len(latencies) == 0:
+            return {"frames": 0, "throughput": 0.0, "mean_batch": 0.0, "p50_ms": 0.0, "p99_ms": 0.0}
+        return {
+            "frames": frames_done,
+            "throughput": frames_done / elapsed,
+            "mean_batch": float(batch_sizes.mean()),
+            "p50_ms": float(np.percentile(latencies, 50)),
+            "p99_ms": float(np.percentile(latencies, 99)),
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self._latencies.clear()
+            self._batch_sizes.clear()
+            self._frames_done = 0
+            self._started = time.perf_counter()
+
+    ##### 첫 프레임 submit 시각부터 max_delay 동안 최대 max_batch장 모으기 #####
+    def _collect(self, first):
+        batch = [first]
+        deadline = first[2] + self.max_delay
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)          # 이번 배치를 처리한 뒤 종료
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            batch = self._collect(first)
+            frames = [item[0] for item in batch]
+            try:
+                results = self.predict_batch(frames)
+            except Exception as e:               # 배치 전체 실패 -> 모든 요청에 예외 전달
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            done = time.perf_counter()
+            with self._lock:
+                self._latencies.extend(done - submitted for _, _, submitted in batch)
+                self._batch_sizes.append(len(batch))
+                self._frames_done += len(batch)
+            for (_, future, _), result in zip(batch, results):
+                future.set_result(result)
@@ -0,0 +1,153 @@
+"""
+/detect 응답 생성 (열 단위 배열 + 프레임당 시각 1회) + 같은 프레임 재요청 결과 캐시
+
+simulate_detect_time.py의 /detect는 탐지마다 float() 변환으로 dict를 만들고, 객체마다 now_ms()로
+strftime을 다시 불렀음. 시뮬레이터가 같은 화면을 다시 보내도 디코딩 -> 추론 -> 직렬화를 처음부터 반복했음.
+
+이 모듈은
+- detect_time: 프레임 1장에 시각 문자열 1개 (now_ms와 같은 형식)
+- to_columnar: 탐지 (N, 6) / 트랙 (M, 7) -> 열별 리스트 {"bbox": (N, 4), "confidence", "classId"[, "trackingId"]}
+  (열마다 ndarray.tolist() 1번, 클래스 이름은 classNames에 1번만)
+- to_objects: 기존 /detect 형식(객체별 dict 목록), 변환은 열 단위로 하고 시각은 프레임당 1번
+- CachedFrame: 프레임 1장의 탐지 결과 + 시각, 응답 형식별 본문은 처음 요청될 때 json.dumps 1번으로 만들어 재사용
+- DetectionCache: (stream, 업로드 바이트 해시) -> CachedFrame, 최근 CACHE_SIZE개 LRU
+를 제공함. 캐시 키에 응답 형식을 넣지 않아서, 같은 프레임을 다른 형식으로 다시 요청해도 추론 / 추적(트래커 갱신)은
+1번만 일어나고 요청한 형식의 본문만 캐시된 탐지 결과에서 만듦.
+
+사용 예)
+    key = cache.key(stream, data)
+    entry = cache.get(key)
+    if entry is None:
+        entry = CachedFrame(track(stream, detector.detect(frame)), TARGET_CLASSES)
+        cache.put(key, entry)
+    body = entry.body("columnar")
+"""
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+import numpy as np
+
+CACHE_SIZE = 8                  # stream 전체에서 기억할 최근 응답 수
+BBOX_DECIMALS = 1               # 박스 좌표 소수 자리 (픽셀)
+CONF_DECIMALS = 4               # 신뢰도 소수 자리
+
+
+##### 프레임 처리 시각 문자열 (simulate_detect_time.now_ms와 같은 형식, 프레임당 1번 호출) #####
+def detect_time(now=None):
+    now = now or datetime.now()
+    return now.strftime("%Y-%m-%d %H:%M:%S.") + f"{now.microsecond // 1000:03d}"
+
+
+##### 탐지 (N, 6) / 트랙 (M, 7) -> 열별 파이썬 리스트 #####
+def _columns(detections):
+    detections = np.asarray(detections, dtype=np.float64)
+    if detections.ndim != 2:
+        detections = detections.reshape(-1, 6)
+    columns = {
+        "bbox": np.round(detections[:, :4], BBOX_DECIMALS).tolist(),
+        "confidence": np.round(detections[:, 4], CONF_DECIMALS).tolist(),
+        "classId": detections[:, 5].astype(int).tolist(),
+    }
+    if detections.shape[1] > 6:
+        columns["trackingId"] = detections[:, 6].astype(int).tolist()
+    return columns
+
+
+##### 열 단위 응답: {"detect_time", "count", "classNames", "bbox", "confidence", "classId"[, "trackingId"]} #####
+def to_columnar(detections, class_names, frame_time=None):
+    columns = _columns(detections)
+    result = {
+        "detect_time": frame_time or detect_time(),
+        "count": len(columns["classId"]),
+        "classNames": {str(class_id): name for class_id, name in class_names.items()},
+    }
+    result.update(columns)
+    return result
+
+
+##### 기존 /detect 형식 (객체별 dict 목록), 시각은 프레임당 1번 #####
+def to_objects(detections, class_names, frame_time=None):
+    columns = _columns(detections)
+    frame_time = frame_time or detect_time()
+    tracking_ids = columns.get("trackingId")
+    results = []
+    for i, (bbox, conf, class_id) in enumerate(zip(columns["bbox"], columns["confidence"], columns["classId"])):
+        result = {
+            'className': class_names.get(class_id, str(class_id)),
+            'bbox': bbox,
+            'confidence': conf,
+            'color': '#00FF00',
+            'filled': False,
+            'updateBoxWhileMoving': False,
+            'detect_time': frame_time
+        }
+        if tracking_ids is not None:
+            result['trackingId'] = tracking_ids[i]
+        results.append(result)
+    return results
+
+
+RESPONSE_FORMATS = {"objects": to_objects, "columnar": to_columnar}     # 응답 형식 이름 -> 생성 함수
+
+
+##### 캐시 항목: 프레임 1장의 탐지 결과 + 처리 시각, 형식별 응답 본문은 처음 요청될 때 1번만 직렬화 #####
+class CachedFrame:
+    def __init__(self, detections, class_names, frame_time=None):
+        self.detections = detections
+        self.class_names = class_names
+        self.frame_time = frame_time or detect_time()
+        self._bodies = {}
+        self._lock = threading.Lock()
+
+    def body(self, fmt="objects"):
+        if fmt not in RESPONSE_FORMATS:
+            raise ValueError(f"Unknown format {fmt!r}, expected one of {tuple(RESPONSE_FORMATS)}")
+        with self._lock:
+            body = self._bodies.get(fmt)
+            if body is None:
+                result = RESPONSE_FORMATS[fmt](self.detections, self.class_names, self.frame_time)
+                body = json.dumps(result, separators=(",", ":"))
+                self._bodies[fmt] = body
+            return body
+
+
+##### 같은 프레임 재요청용 탐지 결과 캐시 (최근 size개, 스레드 안전) #####
+class DetectionCache:
+    def __init__(self, size=CACHE_SIZE):
+        self.size = size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    ##### (stream, 업로드 바이트) -> 캐시 키. 디코딩 전 원본 바이트로 해시 (응답 형식은 키에 넣지 않음) #####
+    @staticmethod
+    def key(stream, data):
+        return stream, hashlib.blake2b(data, digest_size=16).digest()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        if self.size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / total if total else 0.0}
@@ -0,0 +1,208 @@
+"""
+탐지 모델 런타임: 프로세스당 1회 로드 + 워밍업 + ONNX Runtime / OpenVINO CPU 백엔드
+
+여러 스크립트가 import 시점에 model = YOLO('yolov8n.pt')를 실행해서 (탐지를 안 하는 01_smooth_curve.py까지)
+서버가 뜰 때마다 모델 로드 시간을 내고, 첫 /detect 요청이 torch 지연 초기화(커널 선택, 메모리 할당 등) 비용까지 떠안았음.
+
+이 모듈의 load_detector는
+- (모델, 백엔드, 입력 크기)별로 프로세스에 1번만 로드해서 같은 DetectorRuntime을 돌려주고
+- 로드 직후 입력 크기의 빈 프레임으로 warmup_runs번 추론해서 초기화 비용을 서버 시작 시점으로 옮기고
+- backend로 torch(ultralytics 그대로), onnx(ONNX Runtime), openvino(OpenVINO CPU)를 고를 수 있음.
+  onnx / openvino는 ultralytics export로 입력 크기(imgsz)와 배치 크기가 고정된 그래프를 1번 만들어 두고 재사용하며,
+  CPU 스레드 수(threads)를 세션 / 컴파일 옵션으로 직접 지정함.
+- classes(클래스 허용 목록)와 conf_thres는 추론 안에서 적용 (torch는 ultralytics classes 인자로 NMS 전에,
+  onnx / openvino는 후처리에서 ultralytics와 같이 전체 클래스 argmax 후 허용 클래스만 남기고 NMS) -> 응답 단계에서 다시 거를 필요 없음.
+DetectorRuntime.predict_batch는 BatchingDetector의 predict_batch와 같은 형식
+(프레임 리스트 -> 프레임별 (N, 6) [x1, y1, x2, y2, conf, class_id])이라 그대로 끼울 수 있음.
+
+사용 예)
+    runtime = load_detector(backend="onnx", threads=4)
+    detector = BatchingDetector(runtime.predict_batch, max_batch=runtime.graph_batch)
+"""
+import os
+import time
+import shutil
+import threading
+import numpy as np
+import cv2
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+EXPORT_DIR = os.path.join(BASE_DIR, "..", "exported_models")
+
+MODEL_PATH = "yolov8n.pt"
+BACKENDS = ("torch", "onnx", "openvino")
+IMGSZ = 640                     # 모델 입력 크기 (정사각형, 32의 배수)
+GRAPH_BATCH = 1                 # onnx / openvino 그래프의 고정 배치 크기
+WARMUP_RUNS = 3                 # 로드 직후 워밍업 추론 횟수
+CONF_THRES = 0.25
+IOU_THRES = 0.7                 # NMS IoU (ultralytics 기본값과 같음, 바꾸면 탐지 수가 달라짐)
+MAX_DETECTIONS = 300
+PAD_VALUE = 114                 # letterbox 여백 색 (ultralytics와 동일)
+
+_RUNTIMES = {}
+_RUNTIMES_LOCK = threading.Lock()
+
+
+##### 프로세스당 1회 로드 + 워밍업. 같은 (모델, 백엔드, 입력 크기, 허용 클래스, conf)는 같은 객체를 돌려줌 #####
+def load_detector(model_path=MODEL_PATH, backend="torch", imgsz=IMGSZ, threads=None,
+                  graph_batch=GRAPH_BATCH, warmup_runs=WARMUP_RUNS, classes=None, conf_thres=CONF_THRES):
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+    classes = None if classes is None else tuple(sorted(int(c) for c in classes))
+    key = (os.path.abspath(model_path), backend, imgsz, graph_batch, classes, conf_thres)
+    with _RUNTIMES_LOCK:
+        runtime = _RUNTIMES.get(key)
+        if runtime is None:
+            runtime = DetectorRuntime(model_path, backend, imgsz, threads, graph_batch, classes, conf_thres)
+            runtime.warmup(warmup_runs)
+            _RUNTIMES[key] = runtime
+    return runtime
+
+
+##### ultralytics export로 고정 크기 그래프 생성 (이미 있으면 재사용), 그래프 경로 반환 #####
+def export_model(model_path=MODEL_PATH, backend="onnx", imgsz=IMGSZ, graph_batch=GRAPH_BATCH, export_dir=EXPORT_DIR):
+    from ultralytics import YOLO
+
+    name = f"{os.path.splitext(os.path.basename(model_path))[0]}_{imgsz}_b{graph_batch}"
+    if backend == "onnx":
+        target = os.path.join(export_dir, name + ".onnx")
+    elif backend == "openvino":
+        target = os.path.join(export_dir, name + "_openvino_model", os.path.splitext(os.path.basename(model_path))[0] + ".xml")
+    else:
+        raise ValueError(f"Backend {backend!r} has no export format")
+    if os.path.exists(target):
+        return target
+
+    exported = YOLO(model_path).export(format=backend, imgsz=imgsz, batch=graph_batch, dynamic=False, half=False)
+    os.makedirs(export_dir, exist_ok=True)
+    # openvino는 폴더째 옮김. 대상 폴더가 이미 있으면 (이전 export가 중간에 끊긴 경우) 지우고 옮김
+    destination = os.path.dirname(target) if backend == "openvino" else target
+    if os.path.isdir(destination):
+        shutil.rmtree(destination)
+    shutil.move(exported, destination)
+    return target
+
+
+##### BGR 프레임 -> 정사각형 letterbox 입력 (3, imgsz, imgsz) float32, 비율, 여백 #####
+def letterbox(frame, imgsz=IMGSZ):
+    h, w = frame.shape[:2]
+    ratio = min(imgsz / h, imgsz / w)
+    new_w, new_h = int(round(w * ratio)), int(round(h * ratio))
+    pad_x, pad_y = (imgsz - new_w) / 2.0, (imgsz - new_h) / 2.0
+    resized = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR) if (new_w, new_h) != (w, h) else frame
+    top, left = int(round(pad_y - 0.1)), int(round(pad_x - 0.1))
+    canvas = np.full((imgsz, imgsz, 3), PAD_VALUE, dtype=np.uint8)
+    canvas[top:top + new_h, left:left + new_w] = resized
+    blob = canvas[:, :, ::-1].transpose(2, 0, 1).astype(np.float32) / 255.0    # BGR -> RGB, HWC -> CHW
+    return blob, ratio, (left, top)
+
+
+##### 그래프 출력 (4 + 클래스 수, 앵커 수) -> (N, 6) [x1, y1, x2, y2, conf, class_id] 원본 프레임 좌표 #####
+# classes: 허용 클래스 id 배열 (None이면 전체). ultralytics와 같이 전체 클래스에서 argmax 후 허용 클래스만 남김
+# (허용 클래스 열만 보고 argmax하면 bus 0.9 / truck 0.3 박스가 truck 0.3으로 남아서 torch 백엔드와 결과가 달라짐)
+def postprocess(output, ratio, pad, frame_shape, conf_thres=CONF_THRES, iou_thres=IOU_THRES, classes=None):
+    preds = output.T                                    # (앵커 수, 4 + 클래스 수)
+    scores = preds[:, 4:]
+    class_ids = scores.argmax(axis=1)
+    confs = scores[np.arange(len(scores)), class_ids]
+    keep = confs >= conf_thres
+    if classes is not None:
+        keep &= np.isin(class_ids, np.asarray(classes, dtype=np.intp))
+    if not keep.any():
+        return np.zeros((0, 6), dtype=np.float32)
+    boxes, confs, class_ids = preds[keep, :4], confs[keep], class_ids[keep]
+
+    xywh = boxes.copy()                                 # NMS용 (x, y, w, h)
+    xywh[:, :2] -= xywh[:, 2:] / 2.0
+    idx = cv2.dnn.NMSBoxesBatched(xywh.tolist(), confs.tolist(), class_ids.tolist(), conf_thres, iou_thres)
+    idx = np.asarray(idx, dtype=np.intp).reshape(-1)[:MAX_DETECTIONS]
+
+    xyxy = np.column_stack([xywh[idx, :2], xywh[idx, :2] + xywh[idx, 2:]])
+    xyxy -= np.array([pad[0], pad[1], pad[0], pad[1]], dtype=np.float32)
+    xyxy /= ratio
+    xyxy[:, 0::2] = xyxy[:, 0::2].clip(0, frame_shape[1])
+    xyxy[:, 1::2] = xyxy[:, 1::2].clip(0, frame_shape[0])
+    return np.column_stack([xyxy, confs[idx], class_ids[idx]]).astype(np.float32)
+
+
+class DetectorRuntime:
+    def __init__(self, model_path=MODEL_PATH, backend="torch", imgsz=IMGSZ, threads=None, graph_batch=GRAPH_BATCH,
+                 classes=None, conf_thres=CONF_THRES):
+        self.backend = backend
+        self.imgsz = imgsz
+        self.threads = threads
+        self.graph_batch = graph_batch if backend != "torch" else None     # torch는 배치 크기 제한 없음
+        self.classes = None if classes is None else list(classes)      # 허용 클래스 id (None이면 전체)
+        self.conf_thres = conf_thres
+        self.iou_thres = IOU_THRES
+
+        start = time.perf_counter()
+        if backend == "torch":
+            self._load_torch(model_path)
+        elif backend == "onnx":
+            self._load_onnx(export_model(model_path, "onnx", imgsz, graph_batch))
+        else:
+            self._load_openvino(export_model(model_path, "openvino", imgsz, graph_batch))
+        self.load_time = time.perf_counter() - start
+        self.warmup_time = 0.0
+
+    def _load_torch(self, model_path):
+        import torch
+        from ultralytics import YOLO
+
+        if self.threads:
+            torch.set_num_threads(self.threads)
+        self._model = YOLO(model_path)
+
+    def _load_onnx(self, graph_path):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if self.threads:
+            options.intra_op_num_threads = self.threads
+            options.inter_op_num_threads = 1
+        session = ort.InferenceSession(graph_path, options, providers=["CPUExecutionProvider"])
+        input_name = session.get_inputs()[0].name
+        self._infer = lambda blob: session.run(None, {input_name: blob})[0]
+
+    def _load_openvino(self, graph_path):
+        import openvino as ov
+
+        config = {"PERFORMANCE_HINT": "LATENCY"}
+        if self.threads:
+            config["INFERENCE_NUM_THREADS"] = self.threads
+        compiled = ov.Core().compile_model(graph_path, "CPU", config)
+        request = compiled.create_infer_request()
+        output = compiled.output(0)
+        self._infer = lambda blob: request.infer({0: blob})[output]
+
+    ##### 입력 크기의 빈 프레임으로 runs번 추론 (지연 초기화 비용을 시작 시점에 지불) #####
+    def warmup(self, runs=WARMUP_RUNS):
+        frame = np.full((self.imgsz, self.imgsz, 3), PAD_VALUE, dtype=np.uint8)
+        start = time.perf_counter()
+        for _ in range(runs):
+            self.predict_batch([frame] * (self.graph_batch or 1))
+        self.warmup_time = time.perf_counter() - start
+
+    ##### 프레임 리스트 -> 프레임별 (N, 6) [x1, y1, x2, y2, conf, class_id] #####
+    def predict_batch(self, frames):
+        if self.backend == "torch":
+            results = self._model(frames, conf=self.conf_thres, iou=self.iou_thres, imgsz=self.imgsz,
+                                  classes=self.classes, verbose=False)
+            return [r.boxes.data.cpu().numpy() for r in results]
+
+        outputs = []
+        for start in range(0, len(frames), self.graph_batch):          # 고정 배치 크기로 나눠서, 모자라면 채움
+            chunk = frames[start:start + self.graph_batch]
+            prepared = [letterbox(frame, self.imgsz) for frame in chunk]
+            blob = np.zeros((self.graph_batch, 3, self.imgsz, self.imgsz), dtype=np.float32)
+            blob[:len(chunk)] = np.stack([p[0] for p in prepared])
+            raw = self._infer(blob)
+            for i, (frame, (_, ratio, pad)) in enumerate(zip(chunk, prepared)):
+                outputs.append(postprocess(raw[i], ratio, pad, frame.shape, self.conf_thres, self.iou_thres,
+                                           self.classes))
+        return outputs
+
+    def predict(self, frame):
+        return self.predict_batch([frame])[0]
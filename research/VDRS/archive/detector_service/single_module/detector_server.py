@@ -0,0 +1,108 @@
+"""
+목적 : 배칭 탐지 서버. /detect 요청들을 BatchingDetector로 모아서 YOLO 배치 추론 1회로 처리함.
+       (요청 형식 / 응답 JSON은 simulator api_calling_order의 /detect와 동일)
+
+Flask는 threaded=True로 요청마다 스레드를 쓰므로, 동시에 들어온 요청들이 각자 detector.detect(frame)에서
+기다리는 동안 워커가 한 배치로 묶어 추론함. 배치 크기 / 대기 시간은 아래 MAX_BATCH, MAX_DELAY_MS로 조절.
+/stats 는 처리량과 p50 / p99 지연을 돌려줌.
+모델은 detector_runtime.load_detector로 서버 시작 시 1회 로드 + 워밍업함. (BACKEND로 torch / onnx / openvino 선택)
+TRACKING = True 이면 요청의 'stream' 필드(카메라 / 전차 구분, 기본 "default")마다 SortTracker를 두고
+응답 박스에 프레임 간 고정 'trackingId'를 붙임. (사격 통제의 target_tracking_id로 사용)
+타깃 클래스 / CONF_THRES는 모델 호출 안에서 적용해서 응답 단계의 클래스 필터가 없음.
+/detect?format=columnar 이면 detection_results.to_columnar의 열 단위 응답 (기본은 기존 객체 목록 형식),
+응답 본문은 프레임 / 형식당 json.dumps 1번으로 만들고, 같은 stream에서 같은 이미지 바이트가 다시 오면
+디코딩 / 추론 / 추적 없이 캐시한 탐지 결과로 응답함. 캐시 키에 형식이 없어서 같은 프레임을 두 형식으로 요청해도
+트래커는 1번만 갱신됨. (/stats 에 캐시 적중률 포함)
+"""
+import os
+import sys
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from flask import Flask, Response, request, jsonify
+
+from batching_detector import BatchingDetector
+from detection_results import CachedFrame, DetectionCache, RESPONSE_FORMATS
+from detector_runtime import load_detector
+from sort_tracker import SortTracker
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "..", "..", "..", "..", "archive", "simulator", "api_calling_order", "single_module"))
+from image_decoding import decode_bytes
+
+MODEL_PATH = "yolov8n.pt"
+BACKEND = "torch"               # "torch" / "onnx" / "openvino"
+THREADS = None                  # CPU 추론 스레드 수 (None이면 백엔드 기본값)
+MAX_BATCH = 8                   # 한 번에 추론할 최대 프레임 수
+MAX_DELAY_MS = 10.0             # 배치를 모으는 최대 대기 시간(ms)
+REQUEST_TIMEOUT = 5.0           # 추론 결과 대기 최대 시간(s)
+TRACKING = True                 # 응답에 trackingId 포함 (확정된 트랙만 응답)
+CONF_THRES = 0.25               # 모델 호출 안에서 적용하는 신뢰도 threshold
+CACHE_SIZE = 8                  # 같은 프레임 재요청용 탐지 결과 캐시 크기 (0이면 캐시 안 함)
+
+# COCO 기준: 0=person, 2=car, 7=truck, 15=bench(rock으로 임시 사용)
+TARGET_CLASSES = {0: "person", 2: "car", 7: "truck", 15: "rock"}
+
+app = Flask(__name__)
+
+# 서버 시작 시 1회 로드 + 워밍업, 모든 요청이 같은 배칭 워커를 공유
+runtime = load_detector(MODEL_PATH, backend=BACKEND, threads=THREADS,
+                        classes=list(TARGET_CLASSES), conf_thres=CONF_THRES)
+detector = BatchingDetector(runtime.predict_batch, max_batch=MAX_BATCH, max_delay_ms=MAX_DELAY_MS)
+cache = DetectionCache(CACHE_SIZE)
+
+# stream별 트래커 (같은 stream의 프레임은 순서대로 처리)
+trackers = {}
+trackers_lock = threading.Lock()
+
+
+##### stream의 트래커로 탐지 (N, 6) 추적 -> (M, 7) [..., track_id] (탐지는 이미 타깃 클래스만) #####
+def track(stream, detections):
+    with trackers_lock:
+        entry = trackers.setdefault(stream, (SortTracker(), threading.Lock()))
+    tracker, lock = entry
+    with lock:
+        return tracker.update(detections)
+
+
+@app.route('/detect', methods=['POST'])
+def detect():
+    image = request.files.get('image')
+    if not image:
+        return jsonify({"error": "No image received"}), 400
+    fmt = request.args.get('format', 'objects')
+    if fmt not in RESPONSE_FORMATS:
+        return jsonify({"error": f"Unknown format {fmt!r}"}), 400
+    stream = request.form.get('stream', 'default')
+
+    # 같은 stream에 같은 이미지가 다시 오면 디코딩 / 추론 / 추적 없이 이전 탐지 결과로 응답 (형식이 달라도)
+    data = image.read()
+    key = cache.key(stream, data)
+    entry = cache.get(key)
+    if entry is not None:
+        return Response(entry.body(fmt), mimetype='application/json')
+
+    # 메모리에서 바로 디코딩 (요청별 버퍼, 다른 /detect 핸들러와 같은 image_decoding.decode_bytes)
+    try:
+        frame = decode_bytes(data)
+    except ValueError:
+        return jsonify({"error": "Invalid image"}), 400
+
+    # 부하가 몰려 REQUEST_TIMEOUT 안에 배치 추론이 끝나지 않으면 503 (Flask 기본 500 대신)
+    try:
+        detections = detector.detect(frame, timeout=REQUEST_TIMEOUT)
+    except FutureTimeoutError:
+        return jsonify({"error": f"Detection timed out after {REQUEST_TIMEOUT}s"}), 503
+    if TRACKING:
+        detections = track(stream, detections)
+    entry = CachedFrame(detections, TARGET_CLASSES)
+    cache.put(key, entry)
+    return Response(entry.body(fmt), mimetype='application/json')
+
+
+@app.route('/stats', methods=['GET'])
+def stats():
+    return jsonify({**detector.stats(), "cache": cache.stats()})
+
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5000, threaded=True)
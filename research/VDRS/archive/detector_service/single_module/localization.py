@@ -0,0 +1,116 @@
+"""
+탐지 박스 -> 월드 좌표 일괄 변환 (픽셀 -> 상대각 -> 광선 -> 거리 / 지형 교차)
+
+cal_position.py의 process_frames와 cal_degree.py는 프레임 1개, 표적 1개씩 파이썬 루프로
+상대각 -> 절대 좌표를 계산하고 (거리 변환은 고정 MAP_SCALE, 포신 고각 무시), 결과를 DictWriter로 한 줄씩 썼음.
+거리계 값이 없는 표적은 위치를 구할 방법이 없었음.
+
+이 모듈의 localize는 N개 박스(탐지 (N, 6) / 트랙 (M, 7) 그대로)와 포탑 yaw / pitch, 전차 위치, 거리계 거리를 배열로 받아서
+- 박스 중심 픽셀 -> 포신 기준 상대각 (cal_position과 같은 선형 식, adaptive_detection.pixel_to_angles)
+- 포탑 각도를 더한 절대 방위각 / 고각 -> 카메라에서 나가는 단위 광선
+- 거리가 있으면 카메라 + 광선 x 거리 x distance_scale
+- 거리가 없고 지형(TerrainSampler)이 있으면 광선을 RAY_STEP 간격으로 한 번에 전진(ray-march)해서
+  처음 지면 아래로 들어간 구간을 선형 보간으로 세분한 지면 교차점
+을 한 번의 NumPy 연산으로 계산함.
+
+좌표는 시뮬레이터 월드 기준 (x, y = 높이, z), 방위각은 12시(+z) 기준 시계방향 (FCS azimuth_12oclock과 동일).
+FCS 함수들의 topview (x, y)는 여기의 (x, z)이고, terrain.sample(x, z)로 높이를 구함.
+결과 dict는 pd.DataFrame(result).to_csv(...)로 한 번에 저장할 수 있음.
+
+사용 예)
+    terrain = TerrainSampler.from_csv(MAP_CSV_PATH)
+    result = localize(tracks, tank_pos=(x, y, z), turret_yaw=yaw, turret_pitch=pitch, terrain=terrain)
+    solutions = compute_firing_solutions((x, z), yaw, pitch, topview(result), terrain=terrain)
+"""
+import numpy as np
+
+from adaptive_detection import pixel_to_angles, box_centers, SCREEN_W, SCREEN_H, FOV_H, FOV_V
+
+MAP_SCALE = 10.7143             # cal_position.py와 동일 (1m당 맵 좌표 단위 x 10)
+DISTANCE_SCALE = MAP_SCALE / 10.0   # 거리계 거리 -> 맵 좌표 거리 (cal_position.calculate_absolute_position과 동일)
+CAMERA_HEIGHT = 2.0             # 전차 위치 대비 카메라(포탑) 높이(m), 측정 전 추정값
+RAY_STEP = 1.0                  # ray-march 전진 간격(m)
+MAX_RANGE = 300.0               # ray-march 최대 거리(m), 맵 크기
+
+SOURCE_NONE, SOURCE_RANGE, SOURCE_TERRAIN = 0, 1, 2
+
+
+##### 절대 방위각(12시 기준 시계방향) / 고각(위쪽 +) -> 단위 광선 (N, 3) [x, y(높이), z] #####
+def ray_directions(yaw_deg, pitch_deg):
+    yaw = np.radians(yaw_deg)
+    pitch = np.radians(pitch_deg)
+    cos_pitch = np.cos(pitch)
+    return np.stack([cos_pitch * np.sin(yaw), np.sin(pitch), cos_pitch * np.cos(yaw)], axis=-1)
+
+
+##### 광선들의 지면 교차점 (N, 3), 교차점이 없으면 NaN #####
+# origin, direction: (N, 3). RAY_STEP 간격 샘플 (N, S)를 한 번에 지형 높이와 비교
+def ray_march(terrain, origin, direction, step=RAY_STEP, max_range=MAX_RANGE):
+    t = np.arange(step, max_range + step, step)                                  # (S,)
+    points = origin[:, None, :] + direction[:, None, :] * t[None, :, None]       # (N, S, 3)
+    above = points[..., 1] - terrain.sample(points[..., 0], points[..., 2])      # 지면 위 높이 (N, S)
+
+    below = above <= 0.0
+    hit = below.any(axis=1)
+    first = below.argmax(axis=1)                                                 # 처음 지면 아래로 들어간 샘플
+    rows = np.arange(len(origin))
+    prev = np.maximum(first - 1, 0)
+    h0, h1 = above[rows, prev], above[rows, first]
+    # 직전 샘플(지면 위)과 교차 샘플 사이 선형 보간, 첫 샘플부터 지면 아래면 그 샘플
+    with np.errstate(invalid="ignore", divide="ignore"):
+        frac = np.where(first > 0, h0 / (h0 - h1), 0.0)
+    t_hit = np.where(first > 0, t[prev] + frac * step, t[0])
+
+    out = origin + direction * t_hit[:, None]
+    out[~hit] = np.nan
+    return out
+
+
+##### 박스 N개 -> 상대각 / 절대각 / 월드 좌표 #####
+# boxes: (N, 4+) [x1, y1, x2, y2, ...] 화면 픽셀
+# tank_pos: (3,) 또는 (N, 3) [x, y(높이), z], turret_yaw / turret_pitch: 스칼라 또는 (N,) deg
+# distance: 스칼라 또는 (N,) 거리계 거리 (없으면 None / NaN -> 지형 교차 사용)
+def localize(boxes, tank_pos, turret_yaw, turret_pitch, distance=None, terrain=None,
+             screen_w=SCREEN_W, screen_h=SCREEN_H, fov_h=FOV_H, fov_v=FOV_V,
+             distance_scale=DISTANCE_SCALE, camera_height=CAMERA_HEIGHT,
+             ray_step=RAY_STEP, max_range=MAX_RANGE):
+    boxes = np.asarray(boxes, dtype=np.float64)
+    boxes = boxes.reshape(-1, boxes.shape[-1]) if boxes.size else np.zeros((0, 6))
+    n = len(boxes)
+    x_pixel, y_pixel = box_centers(np.pad(boxes[:, :4], ((0, 0), (0, 2))))
+    rel_h, rel_v = pixel_to_angles(x_pixel, y_pixel, screen_w, screen_h, fov_h, fov_v)
+
+    abs_yaw = (np.broadcast_to(turret_yaw, (n,)) + rel_h) % 360.0
+    abs_pitch = np.broadcast_to(turret_pitch, (n,)) + rel_v
+    origin = np.broadcast_to(np.asarray(tank_pos, dtype=np.float64), (n, 3)).copy()
+    origin[:, 1] += camera_height
+    direction = ray_directions(abs_yaw, abs_pitch)
+
+    dist = np.full(n, np.nan) if distance is None else np.broadcast_to(np.asarray(distance, dtype=np.float64), (n,))
+    has_range = np.isfinite(dist) & (dist > 0)
+    world = np.full((n, 3), np.nan)
+    world[has_range] = origin[has_range] + direction[has_range] * (dist[has_range] * distance_scale)[:, None]
+    source = np.where(has_range, SOURCE_RANGE, SOURCE_NONE)
+
+    if terrain is not None and not has_range.all():
+        need = ~has_range
+        world[need] = ray_march(terrain, origin[need], direction[need], ray_step, max_range)
+        source[need] = np.where(np.isfinite(world[need, 0]), SOURCE_TERRAIN, SOURCE_NONE)
+
+    return {
+        "x_pixel": x_pixel,
+        "y_pixel": y_pixel,
+        "rel_angle_h": rel_h,                   # 포신 기준 수평 상대각(도), 오른쪽 +
+        "rel_angle_v": rel_v,                   # 포신 기준 수직 상대각(도), 위쪽 +
+        "abs_angle": abs_yaw,                   # 12시 기준 시계방향 방위각(도)
+        "abs_pitch": abs_pitch,                 # 수평 기준 고각(도)
+        "x": world[:, 0],
+        "y": world[:, 1],                       # 높이
+        "z": world[:, 2],
+        "source": source,                       # 0 = 위치 없음, 1 = 거리계, 2 = 지형 교차
+    }
+
+
+##### localize 결과 -> FCS topview 좌표 (N, 2) [x, z] #####
+def topview(result):
+    return np.column_stack([result["x"], result["z"]])
@@ -0,0 +1,171 @@
+"""
+SORT 방식 다중 객체 트래커 (탐지 박스에 프레임 간 고정 ID 부여)
+
+/detect는 프레임마다 박스만 돌려주고 ID가 없어서, 사격 통제(handle_fire의 target_tracking_id)가
+'같은 표적'을 가리킬 방법이 없었음. (mock_detection.py는 매 갱신마다 새 tracking_id를 만듦)
+
+이 모듈의 SortTracker는
+- 트랙마다 등속 칼만 필터 상태 [cx, cy, s(면적), r(가로/세로), vcx, vcy, vs]를 (T, 7) / (T, 7, 7) 배열로 들고
+- 프레임마다 모든 트랙을 한 번에 예측(배치 행렬곱)하고
+- 예측 박스 x 탐지 박스 IoU 행렬을 한 번에 계산해서 헝가리안(scipy linear_sum_assignment)으로 짝을 짓고
+  (IoU < iou_threshold이거나 클래스가 다르면 짝 안 함)
+- 짝지은 트랙들을 한 번에 칼만 갱신, 남은 탐지는 새 트랙, max_age 프레임 넘게 못 찾은 트랙은 삭제
+함. ID는 트랙이 사라질 때까지 유지되고, min_hits번 이상 잡힌 트랙만 결과로 내보냄.
+파라미터 기본값은 SORT 원 논문 구현과 같음.
+
+결과는 /detect (N, 6) 형식에 track_id 열을 붙인 (M, 7) [x1, y1, x2, y2, conf, class_id, track_id].
+predicted_boxes()는 다음 프레임 예측 박스라서 AdaptiveDetector의 hints로 쓸 수 있음.
+
+사용 예)
+    tracker = SortTracker()
+    tracks = tracker.update(detections)         # detections: (N, 6)
+    target_id = int(tracks[0, 6])
+"""
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+MAX_AGE = 3                     # 탐지 없이 유지할 최대 프레임 수
+MIN_HITS = 3                    # 결과로 내보내기 전 필요한 연속 탐지 수
+IOU_THRESHOLD = 0.3             # 짝짓기 최소 IoU
+CLASS_AWARE = True              # 클래스가 다른 트랙 / 탐지는 짝 안 함
+
+DIM_X, DIM_Z = 7, 4
+
+# 등속 모델: [cx, cy, s] += [vcx, vcy, vs], 관측은 상태의 앞 4개 [cx, cy, s, r]
+F = np.eye(DIM_X)
+F[0, 4] = F[1, 5] = F[2, 6] = 1.0
+
+# SORT 원 구현의 잡음 설정 (속도는 처음에 모르므로 크게)
+P0 = np.diag([10.0, 10.0, 10.0, 10.0, 1e4, 1e4, 1e4])
+Q = np.diag([1.0, 1.0, 1.0, 1.0, 0.01, 0.01, 1e-4])
+R = np.diag([1.0, 1.0, 10.0, 10.0])
+
+
+##### 박스 (N, 4) [x1, y1, x2, y2] -> 관측 (N, 4) [cx, cy, s, r] #####
+def boxes_to_z(boxes):
+    w = boxes[:, 2] - boxes[:, 0]
+    h = boxes[:, 3] - boxes[:, 1]
+    return np.column_stack([boxes[:, 0] + w / 2.0, boxes[:, 1] + h / 2.0, w * h, w / np.maximum(h, 1e-6)])
+
+
+##### 상태 (N, 7) -> 박스 (N, 4) [x1, y1, x2, y2] #####
+def x_to_boxes(x):
+    w = np.sqrt(np.maximum(x[:, 2] * x[:, 3], 0.0))
+    h = x[:, 2] / np.maximum(w, 1e-6)
+    return np.column_stack([x[:, 0] - w / 2.0, x[:, 1] - h / 2.0, x[:, 0] + w / 2.0, x[:, 1] + h / 2.0])
+
+
+##### IoU 행렬 (N, M) #####
+def iou_matrix(a, b):
+    inter_w = np.clip(np.minimum(a[:, None, 2], b[None, :, 2]) - np.maximum(a[:, None, 0], b[None, :, 0]), 0, None)
+    inter_h = np.clip(np.minimum(a[:, None, 3], b[None, :, 3]) - np.maximum(a[:, None, 1], b[None, :, 1]), 0, None)
+    inter = inter_w * inter_h
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    return inter / np.maximum(area_a[:, None] + area_b[None, :] - inter, 1e-9)
+
+
+class SortTracker:
+    def __init__(self, max_age=MAX_AGE, min_hits=MIN_HITS, iou_threshold=IOU_THRESHOLD, class_aware=CLASS_AWARE):
+        self.max_age = max_age
+        self.min_hits = min_hits
+        self.iou_threshold = iou_threshold
+        self.class_aware = class_aware
+        self.frame_count = 0
+        self._next_id = 1
+
+        # 트랙 상태 (행 = 트랙)
+        self.x = np.zeros((0, DIM_X))
+        self.P = np.zeros((0, DIM_X, DIM_X))
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.class_ids = np.zeros(0, dtype=np.int64)
+        self.conf = np.zeros(0)
+        self.hit_streak = np.zeros(0, dtype=np.int64)
+        self.time_since_update = np.zeros(0, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.ids)
+
+    ##### 모든 트랙의 다음 프레임 예측 박스 (T, 4), 상태는 바꾸지 않음 #####
+    def predicted_boxes(self):
+        return x_to_boxes(self._predict_x())
+
+    def _predict_x(self):
+        x = self.x.copy()
+        x[(x[:, 2] + x[:, 6]) <= 0, 6] = 0.0    # 면적이 음수로 가면 면적 속도 0 (SORT와 동일)
+        return x @ F.T
+
+    ##### 프레임 1장의 탐지 (N, 6) -> 확정 트랙 (M, 7) [x1, y1, x2, y2, conf, class_id, track_id] #####
+    def update(self, detections):
+        detections = np.asarray(detections, dtype=np.float64).reshape(-1, 6)
+        self.frame_count += 1
+
+        # 1. 예측
+        self.x = self._predict_x()
+        self.P = F @ self.P @ F.T + Q
+        self.time_since_update += 1
+        self.hit_streak[self.time_since_update > 1] = 0
+
+        # 2. 짝짓기
+        matched_t, matched_d = self._associate(detections)
+
+        # 3. 짝지은 트랙 칼만 갱신 (한 번에)
+        if len(matched_t):
+            z = boxes_to_z(detections[matched_d, :4])
+            P = self.P[matched_t]
+            PHt = P[:, :, :DIM_Z]                                   # P @ H.T
+            S = PHt[:, :DIM_Z, :] + R                               # H @ P @ H.T + R
+            K = np.linalg.solve(S, PHt.transpose(0, 2, 1)).transpose(0, 2, 1)
+            residual = z - self.x[matched_t, :DIM_Z]
+            self.x[matched_t] += (K @ residual[:, :, None])[:, :, 0]
+            self.P[matched_t] = P - K @ P[:, :DIM_Z, :]
+            self.conf[matched_t] = detections[matched_d, 4]
+            self.class_ids[matched_t] = detections[matched_d, 5].astype(np.int64)
+            self.time_since_update[matched_t] = 0
+            self.hit_streak[matched_t] += 1
+
+        # 4. 짝 없는 탐지 -> 새 트랙
+        unmatched = np.ones(len(detections), dtype=bool)
+        unmatched[matched_d] = False
+        if unmatched.any():
+            self._spawn(detections[unmatched])
+
+        # 5. 오래 못 찾은 트랙 삭제
+        alive = self.time_since_update <= self.max_age
+        if not alive.all():
+            self._keep(alive)
+
+        confirmed = (self.time_since_update == 0) & ((self.hit_streak >= self.min_hits) |
+                                                      (self.frame_count <= self.min_hits))
+        return np.column_stack([x_to_boxes(self.x[confirmed]), self.conf[confirmed],
+                                self.class_ids[confirmed], self.ids[confirmed]])
+
+    ##### 예측 박스 x 탐지 IoU -> 헝가리안 짝 (트랙 인덱스, 탐지 인덱스) #####
+    def _associate(self, detections):
+        empty = np.zeros(0, dtype=np.intp)
+        if len(self.ids) == 0 or len(detections) == 0:
+            return empty, empty
+        iou = iou_matrix(x_to_boxes(self.x), detections[:, :4])
+        if self.class_aware:
+            iou[self.class_ids[:, None] != detections[None, :, 5].astype(np.int64)] = 0.0
+        rows, cols = linear_sum_assignment(-iou)
+        keep = iou[rows, cols] >= self.iou_threshold
+        return rows[keep], cols[keep]
+
+    def _spawn(self, detections):
+        n = len(detections)
+        x = np.zeros((n, DIM_X))
+        x[:, :DIM_Z] = boxes_to_z(detections[:, :4])
+        self.x = np.vstack([self.x, x])
+        self.P = np.concatenate([self.P, np.broadcast_to(P0, (n, DIM_X, DIM_X))])
+        self.ids = np.r_[self.ids, np.arange(self._next_id, self._next_id + n)]
+        self._next_id += n
+        self.class_ids = np.r_[self.class_ids, detections[:, 5].astype(np.int64)]
+        self.conf = np.r_[self.conf, detections[:, 4]]
+        self.hit_streak = np.r_[self.hit_streak, np.ones(n, dtype=np.int64)]
+        self.time_since_update = np.r_[self.time_since_update, np.zeros(n, dtype=np.int64)]
+
+    def _keep(self, mask):
+        self.x, self.P = self.x[mask], self.P[mask]
+        self.ids, self.class_ids, self.conf = self.ids[mask], self.class_ids[mask], self.conf[mask]
+        self.hit_streak, self.time_since_update = self.hit_streak[mask], self.time_since_update[mask]
@@ -0,0 +1,81 @@
+"""
+배칭 설정별 탐지 처리량 vs p99 지연
+
+CLIENTS개 스레드가 각자 '프레임 제출 -> 결과 대기 -> 다음 프레임'을 DURATION초 동안 반복하는 상황
+(전차 여러 대가 /detect를 계속 호출하는 상황)을 만들고, (max_batch, max_delay_ms) 설정마다
+처리량(frame/s), 평균 배치 크기, p50 / p99 지연을 표로 출력하고 csv로 저장함.
+(1, 0)이 기존 요청당 1회 추론 방식.
+"""
+import os
+import sys
+import time
+import threading
+import numpy as np
+import pandas as pd
+from ultralytics import YOLO
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "single_module"))
+
+from batching_detector import BatchingDetector, yolo_predict_batch
+
+MODEL_PATH = "yolov8n.pt"
+OUTPUT_PATH = os.path.join(BASE_DIR, "..", "output_data", "batching_benchmark.csv")
+
+FRAME_SIZE = (720, 1280)        # 시뮬레이터 카메라 프레임 (높이, 너비), 측정 전 추정값
+CLIENTS = 8                     # 동시에 요청하는 클라이언트 수
+DURATION = 10.0                 # 설정당 측정 시간(s)
+WARMUP = 2.0                    # 측정 전 워밍업 시간(s), 통계에서 제외
+SETTINGS = [                    # (max_batch, max_delay_ms)
+    (1, 0.0),
+    (2, 5.0),
+    (4, 5.0),
+    (4, 10.0),
+    (8, 10.0),
+    (8, 20.0),
+    (16, 20.0),
+]
+
+
+##### 클라이언트 1개: 프레임 제출 후 결과를 받으면 다음 프레임 (닫힌 루프) #####
+def client(detector, frames, stop):
+    i = 0
+    while not stop.is_set():
+        detector.detect(frames[i % len(frames)])
+        i += 1
+
+
+def run_setting(predict_batch, frames, max_batch, max_delay_ms):
+    detector = BatchingDetector(predict_batch, max_batch=max_batch, max_delay_ms=max_delay_ms)
+    stop = threading.Event()
+    threads = [threading.Thread(target=client, args=(detector, frames[k::CLIENTS], stop)) for k in range(CLIENTS)]
+    for t in threads:
+        t.start()
+    time.sleep(WARMUP)
+    detector.reset_stats()
+    time.sleep(DURATION)
+    result = detector.stats()
+    stop.set()
+    for t in threads:
+        t.join()
+    detector.close()
+    return result
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, (*FRAME_SIZE, 3), dtype=np.uint8) for _ in range(CLIENTS * 4)]
+    predict_batch = yolo_predict_batch(YOLO(MODEL_PATH))
+
+    rows = []
+    print(f"클라이언트 {CLIENTS}개, 프레임 {FRAME_SIZE[1]}x{FRAME_SIZE[0]}, 설정당 {DURATION:.0f}초")
+    print(f"{'max_batch':>9} | {'delay(ms)':>9} | {'처리량(fps)':>10} | {'평균 배치':>8} | {'p50(ms)':>8} | {'p99(ms)':>8}")
+    for max_batch, max_delay_ms in SETTINGS:
+        s = run_setting(predict_batch, frames, max_batch, max_delay_ms)
+        rows.append({"max_batch": max_batch, "max_delay_ms": max_delay_ms, **s})
+        print(f"{max_batch:>9} | {max_delay_ms:>9.1f} | {s['throughput']:>10.1f} | {s['mean_batch']:>8.2f} | "
+              f"{s['p50_ms']:>8.1f} | {s['p99_ms']:>8.1f}")
+
+    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
+    pd.DataFrame(rows).to_csv(OUTPUT_PATH, index=False)
+    print(f"저장: {OUTPUT_PATH}")
@@ -0,0 +1,58 @@
+"""
+탐지 백엔드별 시작 시간 / 프레임당 지연 비교 (torch vs ONNX Runtime vs OpenVINO, CPU)
+
+백엔드마다 새 프로세스에서 (import 비용까지 포함해서)
+1. 모델 로드 시간
+2. 워밍업 없이 첫 프레임 추론 시간 (기존 서버의 첫 /detect 요청이 내던 비용)
+3. 워밍업 이후 프레임당 평균 / p99 지연
+을 재서 표로 출력함. onnx / openvino 그래프 export는 측정 전에 미리 해 두고 시간에서 제외.
+"""
+import os
+import sys
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "single_module"))
+
+from detector_runtime import load_detector, export_model, BACKENDS, MODEL_PATH, IMGSZ
+
+FRAME_SIZE = (720, 1280)        # 시뮬레이터 카메라 프레임 (높이, 너비), 측정 전 추정값
+THREADS = 4                     # CPU 추론 스레드 수 (모든 백엔드 동일)
+REPEATS = 100                   # 워밍업 이후 측정 프레임 수
+
+
+##### 새 프로세스에서 1개 백엔드 측정 #####
+def measure(backend):
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, (*FRAME_SIZE, 3), dtype=np.uint8) for _ in range(8)]
+
+    start = time.perf_counter()
+    runtime = load_detector(MODEL_PATH, backend=backend, imgsz=IMGSZ, threads=THREADS, warmup_runs=0)
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    runtime.predict(frames[0])
+    first_frame = time.perf_counter() - start
+
+    runtime.warmup()
+    times = []
+    for i in range(REPEATS):
+        start = time.perf_counter()
+        runtime.predict(frames[i % len(frames)])
+        times.append(time.perf_counter() - start)
+    times = np.array(times) * 1000.0
+    return load_time, first_frame * 1000.0, times.mean(), np.percentile(times, 99)
+
+
+if __name__ == "__main__":
+    for backend in BACKENDS[1:]:
+        export_model(MODEL_PATH, backend, IMGSZ)
+
+    print(f"모델 {MODEL_PATH}, 입력 {IMGSZ}, 프레임 {FRAME_SIZE[1]}x{FRAME_SIZE[0]}, 스레드 {THREADS}")
+    print(f"{'백엔드':<10} | {'로드(s)':>8} | {'첫 프레임(ms)':>12} | {'평균(ms)':>8} | {'p99(ms)':>8}")
+    for backend in BACKENDS:
+        with ProcessPoolExecutor(max_workers=1) as pool:       # 백엔드마다 깨끗한 프로세스
+            load_time, first_ms, mean_ms, p99_ms = pool.submit(measure, backend).result()
+        print(f"{backend:<10} | {load_time:>8.2f} | {first_ms:>12.1f} | {mean_ms:>8.1f} | {p99_ms:>8.1f}")
@@ -0,0 +1,97 @@
+"""
+매 프레임 전체 화면 탐지 vs AdaptiveDetector (움직임 게이팅 + ROI)
+
+시뮬레이터 녹화 영상(VIDEO_DIR의 첫 mp4)을 프레임마다
+1. 기존 방식: 고해상도 모델로 전체 화면 추론
+2. AdaptiveDetector: skip / low(저해상도 전체) / roi(고해상도 crop) / full 중 선택
+으로 처리해서 프레임당 평균 / p99 처리 시간, 모드 비율, 기존 방식 박스 중 IoU >= MATCH_IOU로
+다시 찾은 비율(재현율)을 출력함. 각 프레임의 crop 각도 범위(cal_position 식)도 첫 몇 개 출력.
+"""
+import os
+import sys
+import time
+import numpy as np
+import cv2
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "single_module"))
+
+from detector_runtime import load_detector
+from adaptive_detection import AdaptiveDetector, crop_angle_windows
+
+VIDEO_DIR = os.path.join(BASE_DIR, "..", "..", "collect_raw_data", "single_module", "collect_raw_data",
+                         "INPUT", "Country Road", "Tank 1")    # 'Country Road_Tank 1_이름.mp4' 녹화 영상 폴더
+MAX_FRAMES = 600
+HIGH_IMGSZ = 640
+LOW_IMGSZ = 320
+MATCH_IOU = 0.5
+
+
+def read_frames(video_dir, limit):
+    videos = sorted(f for f in os.listdir(video_dir) if f.lower().endswith(".mp4"))
+    if not videos:
+        raise ValueError(f"No .mp4 file in {video_dir}")
+    path = os.path.join(video_dir, videos[0])
+    capture = cv2.VideoCapture(path)
+    frames = []
+    while len(frames) < limit:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        frames.append(frame)
+    capture.release()
+    if not frames:
+        raise ValueError(f"No frames read from {path}")
+    return frames
+
+
+##### 기준 박스 중 IoU >= threshold인 박스가 있는 비율 #####
+def recall(reference, detections, threshold=MATCH_IOU):
+    if len(reference) == 0:
+        return 1.0
+    if len(detections) == 0:
+        return 0.0
+    a, b = reference[:, None, :4], detections[None, :, :4]
+    inter_w = np.clip(np.minimum(a[..., 2], b[..., 2]) - np.maximum(a[..., 0], b[..., 0]), 0, None)
+    inter_h = np.clip(np.minimum(a[..., 3], b[..., 3]) - np.maximum(a[..., 1], b[..., 1]), 0, None)
+    inter = inter_w * inter_h
+    area_a = (a[..., 2] - a[..., 0]) * (a[..., 3] - a[..., 1])
+    area_b = (b[..., 2] - b[..., 0]) * (b[..., 3] - b[..., 1])
+    iou = inter / (area_a + area_b - inter)
+    return float((iou.max(axis=1) >= threshold).mean())
+
+
+def timed_run(step, frames):
+    outputs, times = [], []
+    for frame in frames:
+        start = time.perf_counter()
+        outputs.append(step(frame))
+        times.append(time.perf_counter() - start)
+    times = np.array(times) * 1000.0
+    return outputs, times.mean(), np.percentile(times, 99)
+
+
+if __name__ == "__main__":
+    frames = read_frames(VIDEO_DIR, MAX_FRAMES)
+    high = load_detector(imgsz=HIGH_IMGSZ)
+    low = load_detector(imgsz=LOW_IMGSZ)
+    adaptive = AdaptiveDetector(high.predict_batch, predict_low=low.predict_batch)
+
+    full_out, full_mean, full_p99 = timed_run(high.predict, frames)
+    adaptive_out, adaptive_mean, adaptive_p99 = timed_run(adaptive.update, frames)
+
+    frame_recall = np.mean([recall(ref, out["detections"]) for ref, out in zip(full_out, adaptive_out)])
+    print(f"프레임 {len(frames)}개 ({frames[0].shape[1]}x{frames[0].shape[0]})")
+    print(f"{'방식':<10} | {'평균(ms)':>8} | {'p99(ms)':>8}")
+    print(f"{'전체 화면':<10} | {full_mean:>8.1f} | {full_p99:>8.1f}")
+    print(f"{'adaptive':<10} | {adaptive_mean:>8.1f} | {adaptive_p99:>8.1f}")
+    print("모드 비율: " + ", ".join(f"{mode} {ratio:.0%}" for mode, ratio in adaptive.mode_ratios().items()))
+    print(f"전체 화면 박스 재현율 (IoU >= {MATCH_IOU}): {frame_recall:.1%}")
+
+    h, w = frames[0].shape[:2]
+    shown = 0
+    for i, out in enumerate(adaptive_out):
+        if out["mode"] == "roi" and shown < 3:
+            windows = crop_angle_windows(out["crops"], screen_w=w, screen_h=h)
+            print(f"frame {i} crop 상대각 [좌, 위, 우, 아래] deg: {np.round(windows, 2).tolist()}")
+            shown += 1
@@ -0,0 +1,76 @@
+"""
+SortTracker 프레임당 처리 시간 / ID 유지 확인 (합성 탐지 스트림)
+
+화면(1280x720) 안에서 등속으로 움직이는 물체 N개의 박스에 위치 잡음을 넣고,
+DROP_RATE 비율로 탐지를 빠뜨린 스트림을 만들어서 물체 수별로
+- 프레임당 update 평균 / p99 시간(ms)
+- ID 전환 수 (같은 물체에 붙은 track_id가 바뀐 횟수)
+- 생성된 track_id 수 (물체 수에 가까울수록 좋음)
+를 출력함.
+"""
+import os
+import sys
+import time
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "single_module"))
+
+from sort_tracker import SortTracker
+
+SCREEN = (1280, 720)
+FRAMES = 500
+OBJECT_COUNTS = [5, 20, 50]
+BOX_SIZE = (40, 120)            # 박스 한 변 범위 (px)
+SPEED = 6.0                     # 프레임당 최대 이동 (px)
+NOISE = 2.0                     # 박스 좌표 잡음 표준편차 (px)
+DROP_RATE = 0.05                # 탐지 누락 비율
+
+
+def make_stream(n, rng):
+    size = rng.uniform(*BOX_SIZE, (n, 2))
+    pos = rng.uniform([0, 0], [SCREEN[0] - size[:, 0].max(), SCREEN[1] - size[:, 1].max()], (n, 2))
+    vel = rng.uniform(-SPEED, SPEED, (n, 2))
+    stream = []
+    for _ in range(FRAMES):
+        pos += vel
+        bounce = (pos < 0) | (pos + size > SCREEN)               # 화면 끝에서 반사
+        vel[bounce] *= -1
+        boxes = np.column_stack([pos, pos + size]) + rng.normal(0, NOISE, (n, 4))
+        seen = rng.random(n) >= DROP_RATE
+        detections = np.column_stack([boxes, np.full(n, 0.9), np.full(n, 2), np.arange(n)])[seen]
+        stream.append(detections)
+    return stream
+
+
+def run(n, rng):
+    stream = make_stream(n, rng)
+    tracker = SortTracker()
+    times, last_id, switches, ids = [], {}, 0, set()
+    for detections in stream:
+        start = time.perf_counter()
+        tracks = tracker.update(detections[:, :6])
+        times.append(time.perf_counter() - start)
+
+        # 트랙 박스와 가장 많이 겹치는 실제 물체로 ID 전환 확인
+        for track in tracks:
+            overlap = np.linalg.norm(detections[:, :2] - track[:2], axis=1)
+            if len(overlap) == 0:
+                continue
+            obj = int(detections[overlap.argmin(), 6])
+            track_id = int(track[6])
+            if obj in last_id and last_id[obj] != track_id:
+                switches += 1
+            last_id[obj] = track_id
+            ids.add(track_id)
+    times = np.array(times[10:]) * 1000.0
+    return times.mean(), np.percentile(times, 99), switches, len(ids)
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    print(f"프레임 {FRAMES}개, 잡음 {NOISE}px, 누락 {DROP_RATE:.0%}")
+    print(f"{'물체 수':>6} | {'평균(ms)':>8} | {'p99(ms)':>8} | {'ID 전환':>7} | {'track_id 수':>10}")
+    for n in OBJECT_COUNTS:
+        mean_ms, p99_ms, switches, id_count = run(n, rng)
+        print(f"{n:>6} | {mean_ms:>8.3f} | {p99_ms:>8.3f} | {switches:>7} | {id_count:>10}")
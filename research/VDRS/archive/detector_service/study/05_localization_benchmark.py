@@ -0,0 +1,93 @@
+"""
+cal_position.process_frames (루프 + DictWriter) vs localize (NumPy 일괄) 비교
+
+1. 거리계 거리가 있는 탐지 N개: 두 방식의 절대 좌표 차이(수평 포신 기준)와 계산 / csv 저장 시간
+2. 거리가 없는 탐지: country road 지형에서 ray-march 지면 교차점의 지형 높이 오차와 처리 시간
+을 출력함.
+"""
+import os
+import sys
+import csv
+import time
+import tempfile
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESEARCH_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", "..", "..", ".."))
+sys.path.append(os.path.join(BASE_DIR, "..", "single_module"))
+sys.path.append(os.path.join(BASE_DIR, "..", "..", "visual_img_position.py"))
+sys.path.append(os.path.join(RESEARCH_DIR, "FCS", "archive", "fcs_prototypes"))
+
+import cal_position
+from localization import localize
+from terrain_sampler import TerrainSampler
+
+MAP_CSV_PATH = os.path.join(RESEARCH_DIR, "FCS", "archive", "fcs_prototypes", "map_csvs", "01_country_road_300x300.csv")
+DETECTION_COUNTS = [10, 100, 1000]
+SCREEN_W, SCREEN_H = 1919, 1047
+FOV_H, FOV_V = 47.81061, 28.0
+REPEATS = 20
+
+
+def make_boxes(n, rng, y_range=(0, SCREEN_H)):
+    cx = rng.uniform(20, SCREEN_W - 20, n)
+    cy = rng.uniform(*y_range, n)
+    return np.column_stack([cx - 20, cy - 20, cx + 20, cy + 20])
+
+
+##### cal_position.save_results_to_csv와 같은 방식 (출력 없이) #####
+def write_dict_rows(results, path):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0]))
+        writer.writeheader()
+        for row in results:
+            writer.writerow(row)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        out = fn()
+    return (time.perf_counter() - start) / REPEATS * 1000.0, out
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    csv_path = os.path.join(tempfile.gettempdir(), "enemy_positions_map.csv")
+    friendly_pos, turret_yaw = (150.0, 150.0), 45.12
+
+    print("1. 거리계 거리 사용 (포신 수평)")
+    print(f"{'탐지 수':>6} | {'루프(ms)':>8} | {'일괄(ms)':>8} | {'DictWriter(ms)':>12} | {'to_csv(ms)':>12} | {'최대 차이(m)':>12}")
+    for n in DETECTION_COUNTS:
+        boxes = make_boxes(n, rng, (SCREEN_H / 2, SCREEN_H / 2))           # 화면 중앙 높이 (고각 0)
+        distance = rng.uniform(20, 300, n)
+        frames = [{"frame": f"frame{i:03d}", "x_pixel": (b[0] + b[2]) / 2, "y_pixel": (b[1] + b[3]) / 2,
+                   "distance_m": d} for i, (b, d) in enumerate(zip(boxes, distance))]
+
+        def loop_compute():
+            return cal_position.process_frames(frames, SCREEN_W, SCREEN_H, FOV_H, FOV_V, friendly_pos, turret_yaw)
+
+        def vectorized_compute():
+            return localize(boxes, (friendly_pos[0], 0.0, friendly_pos[1]), turret_yaw, 0.0, distance=distance,
+                            screen_w=SCREEN_W, screen_h=SCREEN_H, fov_h=FOV_H, fov_v=FOV_V, camera_height=0.0)
+
+        loop_ms, loop_out = timed(loop_compute)
+        vec_ms, vec_out = timed(vectorized_compute)
+        loop_save_ms, _ = timed(lambda: write_dict_rows(loop_out, csv_path))
+        vec_save_ms, _ = timed(lambda: pd.DataFrame(vec_out).to_csv(csv_path, index=False))
+        ref = np.array([(r["x_enemy"], r["y_enemy"]) for r in loop_out])
+        diff = np.abs(ref - np.column_stack([vec_out["x"], vec_out["z"]])).max()
+        print(f"{n:>6} | {loop_ms:>8.2f} | {vec_ms:>8.2f} | {loop_save_ms:>12.2f} | {vec_save_ms:>12.2f} | {diff:>12.2e}")
+
+    print("\n2. 거리 없음, 지형 ray-march (country road)")
+    terrain = TerrainSampler.from_csv(MAP_CSV_PATH)
+    tank_pos = (150.0, float(terrain.sample(150.0, 150.0)), 150.0)
+    print(f"{'탐지 수':>6} | {'일괄(ms)':>8} | {'교차 비율':>8} | {'높이 오차 최대(m)':>16}")
+    for n in DETECTION_COUNTS:
+        boxes = make_boxes(n, rng, (SCREEN_H * 0.55, SCREEN_H))                # 화면 아래쪽 (지면 방향)
+        vec_ms, result = timed(lambda: localize(boxes, tank_pos, turret_yaw, 0.0, terrain=terrain,
+                                                screen_w=SCREEN_W, screen_h=SCREEN_H, fov_h=FOV_H, fov_v=FOV_V))
+        hit = np.isfinite(result["x"])
+        error = np.abs(result["y"][hit] - terrain.sample(result["x"][hit], result["z"][hit]))
+        print(f"{n:>6} | {vec_ms:>8.2f} | {hit.mean():>8.1%} | {error.max():>16.3f}")
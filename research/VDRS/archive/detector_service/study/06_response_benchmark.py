@@ -0,0 +1,86 @@
+"""
+/detect 응답 생성 비교: 기존 (Python 클래스 필터 + 객체마다 float() / now_ms) vs to_objects vs to_columnar
+
+탐지 수별로
+1. 응답 생성 + json.dumps 시간 (기존 방식은 모델이 전체 COCO 클래스를 내보낸다고 보고 필터 포함)
+2. 응답 본문 크기
+3. 같은 프레임 재요청 시 캐시 조회 시간 (업로드 바이트 해시 + 형식별 본문, 처음 요청된 형식은 직렬화 포함)
+을 출력함.
+"""
+import os
+import sys
+import json
+import time
+from datetime import datetime
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "single_module"))
+
+from detection_results import CachedFrame, DetectionCache, to_columnar, to_objects
+
+TARGET_CLASSES = {0: "person", 2: "car", 7: "truck", 15: "rock"}
+DETECTION_COUNTS = [5, 20, 100]
+UPLOAD_BYTES = 200_000          # 1280x720 jpg 정도의 업로드 크기
+REPEATS = 2000
+
+
+##### simulate_detect_time.py의 /detect 응답 생성 방식 (출력 없이) #####
+def legacy_response(detections):
+    def now_ms():
+        now = datetime.now()
+        return now.strftime("%Y-%m-%d %H:%M:%S.") + f"{int(now.microsecond / 1000):03d}"
+
+    filtered_results = []
+    for box in detections:
+        class_id = int(box[5])
+        if class_id in TARGET_CLASSES:
+            filtered_results.append({
+                'className': TARGET_CLASSES[class_id],
+                'bbox': [float(coord) for coord in box[:4]],
+                'confidence': float(box[4]),
+                'color': '#00FF00',
+                'filled': False,
+                'updateBoxWhileMoving': False,
+                'detect_time': now_ms()
+            })
+    return json.dumps(filtered_results)
+
+
+def make_detections(n, rng, classes):
+    xy = rng.uniform(0, 1200, (n, 2))
+    wh = rng.uniform(10, 200, (n, 2))
+    return np.column_stack([xy, xy + wh, rng.uniform(0.25, 1.0, n), rng.choice(classes, n)]).astype(np.float32)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        out = fn()
+    return (time.perf_counter() - start) / REPEATS * 1e6, out
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 256, UPLOAD_BYTES, dtype=np.uint8).tobytes()
+    print(f"{'탐지 수':>6} | {'기존(us)':>9} | {'objects(us)':>11} | {'columnar(us)':>12} | "
+          f"{'기존(B)':>8} | {'objects(B)':>10} | {'columnar(B)':>11}")
+    for n in DETECTION_COUNTS:
+        # 기존: 모델이 전체 클래스를 내보내고 절반 정도가 타깃 클래스 / 새 방식: 모델이 타깃 클래스만 내보냄
+        all_classes = make_detections(n * 2, rng, [0, 2, 7, 15, 1, 3, 5, 9])
+        targets = make_detections(n, rng, list(TARGET_CLASSES))
+        legacy_us, legacy_body = timed(lambda: legacy_response(all_classes))
+        objects_us, objects_body = timed(lambda: json.dumps(to_objects(targets, TARGET_CLASSES), separators=(",", ":")))
+        columnar_us, columnar_body = timed(lambda: json.dumps(to_columnar(targets, TARGET_CLASSES), separators=(",", ":")))
+        print(f"{n:>6} | {legacy_us:>9.1f} | {objects_us:>11.1f} | {columnar_us:>12.1f} | "
+              f"{len(legacy_body):>8} | {len(objects_body):>10} | {len(columnar_body):>11}")
+
+    cache = DetectionCache()
+    entry = CachedFrame(targets, TARGET_CLASSES)
+    cache.put(cache.key("default", data), entry)
+    start = time.perf_counter()
+    entry.body("objects")                               # 다른 형식 첫 요청: 캐시된 탐지 결과에서 직렬화 1번
+    other_us = (time.perf_counter() - start) * 1e6
+    hit_us, _ = timed(lambda: cache.get(cache.key("default", data)).body("columnar"))
+    print(f"\n캐시 적중 (업로드 {UPLOAD_BYTES // 1000}KB 해시 + 조회): {hit_us:.1f} us, "
+          f"같은 프레임 다른 형식 첫 요청 (추론 / 추적 없이 직렬화만): {other_us:.1f} us")
@@ -0,0 +1,84 @@
+"""
+AdaptiveDetector 움직임 게이팅 점검 (모델 / 영상 없이 합성 프레임)
+
+1919x1047 배경(고정 무늬 + 프레임마다 밝기 잡음) 위에서 MIN_TARGET_PX보다 작은 밝은 정사각형 표적을
+프레임마다 일정 픽셀씩 움직이고, 탐지 함수는 crop / 전체 화면 안에서 표적 픽셀을 찾아 박스로 돌려줌.
+표적 크기 / 속도별로 모드 비율, 박스가 표적 폭의 절반 이상 뒤처진 프레임 수, 최대 지연(px)을 출력하고,
+움직이는 표적이 skip으로 분류된 프레임이 있으면 실패로 끝냄.
+표적이 없는 정지 장면은 반대로 대부분 skip / low여야 함 (잡음만으로 roi / full이 늘지 않는지 확인).
+"""
+import os
+import sys
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "..", "single_module"))
+
+from adaptive_detection import AdaptiveDetector, MIN_TARGET_PX, SCREEN_W, SCREEN_H
+
+TARGET_SIZES = [8, 12, 20, 31]  # 표적 한 변 (px), 모두 MIN_TARGET_PX 미만
+SPEEDS = [5, 10]                # 프레임당 이동 (px)
+FRAMES = 60
+TARGET_VALUE = 250              # 표적 밝기 (배경은 60~120)
+NOISE_STD = 2.0                 # 프레임마다 더하는 밝기 잡음 (영상 압축 잡음 정도)
+
+
+##### 표적 픽셀(TARGET_VALUE)을 찾아 박스로 돌려주는 가짜 탐지 함수 (predict_batch 형식) #####
+def fake_predict(frames):
+    outputs = []
+    for frame in frames:
+        ys, xs = np.nonzero(frame[:, :, 0] == TARGET_VALUE)
+        if len(xs):
+            outputs.append(np.array([[xs.min(), ys.min(), xs.max() + 1, ys.max() + 1, 0.9, 2]], dtype=np.float32))
+        else:
+            outputs.append(np.zeros((0, 6), dtype=np.float32))
+    return outputs
+
+
+def make_frame(background, rng, box=None):
+    noise = rng.normal(0.0, NOISE_STD, background.shape)
+    frame = np.clip(background + noise, 0, TARGET_VALUE - 1).astype(np.uint8)
+    if box is not None:
+        x0, y0, x1, y1 = box
+        frame[y0:y1, x0:x1] = TARGET_VALUE
+    return frame
+
+
+def run(background, rng, size, speed):
+    adaptive = AdaptiveDetector(fake_predict)
+    skipped, lagging, max_lag = 0, 0, 0.0
+    for i in range(FRAMES):
+        x, y = 300 + speed * i, SCREEN_H // 2
+        result = adaptive.update(make_frame(background, rng, (x, y, x + size, y + size)))
+        detections = result["detections"]
+        lag = abs(float(detections[0, 0]) - x) if len(detections) else float("inf")
+        skipped += result["mode"] == "skip"
+        lagging += lag >= size / 2.0
+        max_lag = max(max_lag, lag)
+    return adaptive.mode_ratios(), skipped, lagging, max_lag
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    background = rng.integers(60, 120, (SCREEN_H, SCREEN_W, 3)).astype(np.float64)
+
+    print(f"MIN_TARGET_PX = {MIN_TARGET_PX}, 프레임 {FRAMES}개")
+    print(f"{'크기(px)':>8} | {'속도(px)':>8} | {'full':>5} | {'roi':>5} | {'low':>5} | {'skip':>5} | "
+          f"{'지연 프레임':>10} | {'최대 지연(px)':>12}")
+    failures = []
+    for size in TARGET_SIZES:
+        for speed in SPEEDS:
+            ratios, skipped, lagging, max_lag = run(background, rng, size, speed)
+            print(f"{size:>8} | {speed:>8} | {ratios['full']:>5.0%} | {ratios['roi']:>5.0%} | {ratios['low']:>5.0%} | "
+                  f"{ratios['skip']:>5.0%} | {lagging:>10} | {max_lag:>12.1f}")
+            if skipped:
+                failures.append((size, speed, skipped))
+
+    static = AdaptiveDetector(fake_predict)
+    for _ in range(FRAMES):
+        static.update(make_frame(background, rng))
+    print("정지 장면 모드 비율: " + ", ".join(f"{mode} {ratio:.0%}" for mode, ratio in static.mode_ratios().items()))
+
+    if failures:
+        raise SystemExit(f"Moving targets classified as skip (size, speed, frames): {failures}")
+    print("움직이는 표적이 skip으로 분류된 프레임 없음")